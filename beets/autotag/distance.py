@@ -2,18 +2,19 @@ from __future__ import annotations
 
 import datetime
 import re
-from functools import cache, total_ordering
+from functools import cache, lru_cache, total_ordering
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from jellyfish import levenshtein_distance
 from unidecode import unidecode
 
 from beets import config, metadata_plugins
-from beets.util import as_string, cached_classproperty
+from beets.util import CacheInfo, as_string, cached_classproperty
 from beets.util.color import colorize
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, KeysView
+    from collections.abc import Iterable, Iterator, KeysView, Sequence
 
     from beets.library import Item
     from beets.util import Likelies
@@ -45,6 +46,30 @@ SD_PATTERNS = [
 SD_REPLACE = [(r"&", "and")]
 
 
+# Number of normalized strings and of string pairs whose distances are
+# remembered between calls to `string_dist`.
+STRING_DIST_CACHE_SIZE = 8192
+
+# Copies of the string distance parameters the caches were filled with.
+_sd_settings: tuple[list[Any], ...] | None = None
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+
+@cache
+def _sd_pattern(pat: str) -> re.Pattern[str]:
+    """Return the compiled form of one of the string distance patterns."""
+    return re.compile(pat)
+
+
+@lru_cache(maxsize=STRING_DIST_CACHE_SIZE)
+def _basic_form(string: str) -> str:
+    """Transliterate `string` to lowercase ASCII and drop all characters
+    that are not alphanumeric.
+    """
+    return _NON_ALNUM.sub("", as_string(unidecode(string)).lower())
+
+
 def _string_dist_basic(str1: str, str2: str) -> float:
     """Basic edit distance between two strings, ignoring
     non-alphanumeric characters and case. Comparisons are based on a
@@ -53,10 +78,8 @@ def _string_dist_basic(str1: str, str2: str) -> float:
     """
     assert isinstance(str1, str)
     assert isinstance(str2, str)
-    str1 = as_string(unidecode(str1))
-    str2 = as_string(unidecode(str2))
-    str1 = re.sub(r"[^a-z0-9]", "", str1.lower())
-    str2 = re.sub(r"[^a-z0-9]", "", str2.lower())
+    str1 = _basic_form(str1)
+    str2 = _basic_form(str2)
     if not str1 and not str2:
         return 0.0
     return levenshtein_distance(str1, str2) / float(max(len(str1), len(str2)))
@@ -72,23 +95,66 @@ def string_dist(str1: str | None, str2: str | None) -> float:
     if str1 is None or str2 is None:
         return 1.0
 
-    str1 = str1.lower()
-    str2 = str2.lower()
+    _check_sd_settings()
+    return _string_dist_normalized(
+        _normalize_for_dist(str1), _normalize_for_dist(str2)
+    )
+
+
+def string_dist_cache_info() -> dict[str, CacheInfo]:
+    """Return the hit and miss counts of the caches behind `string_dist`,
+    by the kind of value they hold.
+    """
+    return {
+        "normalized": CacheInfo(*_normalize_for_dist.cache_info()),
+        "basic": CacheInfo(*_basic_form.cache_info()),
+        "pairs": CacheInfo(*_string_dist_normalized.cache_info()),
+    }
+
+
+def _check_sd_settings() -> None:
+    """Empty the caches behind `string_dist` if its parameters, which
+    may be changed at any time, changed since they were filled.
+    """
+    global _sd_settings
+    if _sd_settings != (SD_END_WORDS, SD_PATTERNS, SD_REPLACE):
+        string_dist_cache_clear()
+        _sd_settings = (list(SD_END_WORDS), list(SD_PATTERNS), list(SD_REPLACE))
+
+
+def string_dist_cache_clear() -> None:
+    """Empty the caches behind `string_dist`."""
+    _normalize_for_dist.cache_clear()
+    _basic_form.cache_clear()
+    _string_dist_normalized.cache_clear()
+
+
+@lru_cache(maxsize=STRING_DIST_CACHE_SIZE)
+def _normalize_for_dist(string: str) -> str:
+    """Lowercase `string` and apply the substitutions that `string_dist`
+    makes before comparing it.
+    """
+    string = string.lower()
 
     # Don't penalize strings that move certain words to the end. For
     # example, "the something" should be considered equal to
     # "something, the".
     for word in SD_END_WORDS:
-        if str1.endswith(f", {word}"):
-            str1 = f"{word} {str1[: -len(word) - 2]}"
-        if str2.endswith(f", {word}"):
-            str2 = f"{word} {str2[: -len(word) - 2]}"
+        if string.endswith(f", {word}"):
+            string = f"{word} {string[: -len(word) - 2]}"
 
     # Perform a couple of basic normalizing substitutions.
     for pat, repl in SD_REPLACE:
-        str1 = re.sub(pat, repl, str1)
-        str2 = re.sub(pat, repl, str2)
+        string = _sd_pattern(pat).sub(repl, string)
+
+    return string
+
 
+@lru_cache(maxsize=STRING_DIST_CACHE_SIZE)
+def _string_dist_normalized(str1: str, str2: str) -> float:
+    """Return `string_dist` of two strings that went through
+    `_normalize_for_dist`.
+    """
     # Change the weight for certain string portions matched by a set
     # of regular expressions. We gradually change the strings and build
     # up penalties associated with parts of the string that were
@@ -97,8 +163,9 @@ def string_dist(str1: str | None, str2: str | None) -> float:
     penalty = 0.0
     for pat, weight in SD_PATTERNS:
         # Get strings that drop the pattern.
-        case_str1 = re.sub(pat, "", str1)
-        case_str2 = re.sub(pat, "", str2)
+        regex = _sd_pattern(pat)
+        case_str1 = regex.sub("", str1)
+        case_str2 = regex.sub("", str2)
 
         if case_str1 != str1 or case_str2 != str2:
             # If the pattern was present (i.e., it is deleted in the
@@ -427,6 +494,129 @@ def track_distance(
     return dist
 
 
+def track_distance_matrix(
+    items: Sequence[Item], tracks: Sequence[TrackInfo]
+) -> np.ndarray:
+    """Return the distances between each of `items` and each of `tracks`,
+    as a matrix with a row per item and a column per track.
+
+    Each entry is equal to ``track_distance(item, track).distance``, but
+    the components are computed for all pairs at once, and the string
+    distances are computed once for each distinct pair of titles.
+    """
+    weights = Distance._weights
+    shape = (len(items), len(tracks))
+    raw_dist = np.zeros(shape)
+    max_dist = np.zeros(shape)
+
+    def add(key: str, dist: np.ndarray, mask: np.ndarray | bool = True) -> None:
+        """Add the penalty `dist` for `key` to the pairs of `mask`, in the
+        same order as `track_distance` adds them.
+        """
+        nonlocal raw_dist, max_dist
+        raw_dist = raw_dist + np.where(mask, dist * weights[key], 0.0)
+        max_dist = max_dist + np.where(mask, 1 * weights[key], 0.0)
+
+    def column(values: Iterable[Any]) -> np.ndarray:
+        return np.array(list(values), dtype=object)[:, None]
+
+    def row(values: Iterable[Any]) -> np.ndarray:
+        return np.array(list(values), dtype=object)[None, :]
+
+    # Length.
+    if any(t.length for t in tracks):
+        grace, length_max = get_track_length_grace(), get_track_length_max()
+        item_lengths = np.array([float(i.length) for i in items])[:, None]
+        track_lengths = np.array([float(t.length or 0) for t in tracks])
+        diff = np.abs(item_lengths - track_lengths[None, :]) - grace
+        number = np.maximum(np.minimum(diff, length_max), 0)
+        length_dist = number / length_max if length_max else np.zeros(shape)
+        add("track_length", length_dist, row(bool(t.length) for t in tracks))
+
+    # Title. Each distinct title is normalized once, and the distance of
+    # each distinct pair of titles is computed once.
+    _check_sd_settings()
+    item_titles = {i.title: _normalize_for_dist(i.title) for i in items}
+    track_titles = {
+        t.title: _normalize_for_dist(t.title)
+        for t in tracks
+        if t.title is not None
+    }
+    title_dists: dict[tuple[str, str | None], float] = {}
+    for item_title, item_norm in item_titles.items():
+        for track in tracks:
+            if (key := (item_title, track.title)) in title_dists:
+                continue
+            if track.title is None:
+                title_dists[key] = 1.0
+            else:
+                title_dists[key] = _string_dist_normalized(
+                    item_norm, track_titles[track.title]
+                )
+    add(
+        "track_title",
+        np.array(
+            [[title_dists[i.title, t.title] for t in tracks] for i in items],
+            dtype=float,
+        ).reshape(shape),
+    )
+
+    # Track index.
+    item_tracks = column(i.track for i in items)
+    index_changed = (item_tracks != row(t.medium_index for t in tracks)) & (
+        item_tracks != row(t.index for t in tracks)
+    )
+    add(
+        "track_index",
+        index_changed.astype(float),
+        column(bool(i.track) for i in items)
+        & row(bool(t.index) for t in tracks),
+    )
+
+    # Track ID.
+    item_ids = column(i.mb_trackid for i in items)
+    add(
+        "track_id",
+        (item_ids != row(t.track_id for t in tracks)).astype(float),
+        column(bool(i.mb_trackid) for i in items),
+    )
+
+    # Penalize mismatching disc numbers.
+    item_discs = column(i.disc for i in items)
+    add(
+        "medium",
+        (item_discs != row(t.medium for t in tracks)).astype(float),
+        column(bool(i.disc) for i in items)
+        & row(bool(t.medium) for t in tracks),
+    )
+
+    # Data source.
+    source_dists: dict[tuple[str | None, str | None], list[float]] = {}
+    for item in items:
+        for track in tracks:
+            key = (item.get("data_source"), track.data_source)
+            if key not in source_dists:
+                dist = Distance()
+                dist.add_data_source(*key)
+                source_dists[key] = dist._penalties.get("data_source", [])
+    penalties = [
+        [source_dists[i.get("data_source"), t.data_source] for t in tracks]
+        for i in items
+    ]
+    add(
+        "data_source",
+        np.array([[p[0] if p else 0.0 for p in r] for r in penalties]).reshape(
+            shape
+        ),
+        np.array([[bool(p) for p in r] for r in penalties], dtype=bool).reshape(
+            shape
+        ),
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(max_dist != 0, raw_dist / max_dist, 0.0)
+
+
 def distance(
     original: Likelies,
     album_info: AlbumInfo,
@@ -10,11 +10,15 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar
 
 import lap
-import numpy as np
 
 from beets import config, logging, metadata_plugins, plugins
 
-from .distance import VA_ARTISTS, distance, track_distance
+from .distance import (
+    VA_ARTISTS,
+    distance,
+    track_distance,
+    track_distance_matrix,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
@@ -61,9 +65,9 @@ def assign_items(
     """
     log.debug("Computing track assignment...")
     # Construct the cost matrix.
-    costs = [[float(track_distance(i, t)) for t in tracks] for i in items]
+    costs = track_distance_matrix(items, tracks)
     # Assign items to tracks
-    _, _, assigned_item_idxs = lap.lapjv(np.array(costs), extend_cost=True)
+    _, _, assigned_item_idxs = lap.lapjv(costs, extend_cost=True)
     log.debug("...done.")
 
     # Each item in `assigned_item_idxs` list corresponds to a track in the
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
 from contextlib import contextmanager
 from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from beets.dbcore import SearchIndex
 
 # Holds the music dir context
 _music_dir_var: ContextVar[bytes] = ContextVar("music_dir", default=b"")
@@ -23,3 +29,24 @@ def music_dir(value: bytes):
         yield
     finally:
         _music_dir_var.reset(token)
+
+
+# Holds the full-text search index of the library being queried
+_search_index_var: ContextVar[SearchIndex | None] = ContextVar(
+    "search_index", default=None
+)
+
+
+def get_search_index() -> SearchIndex | None:
+    """Get the full-text search index available to query parsing."""
+    return _search_index_var.get()
+
+
+@contextmanager
+def search_index(value: SearchIndex | None):
+    """Temporarily bind the full-text search index for query parsing."""
+    token = _search_index_var.set(value)
+    try:
+        yield
+    finally:
+        _search_index_var.reset(token)
@@ -3,6 +3,7 @@ Library.
 """
 
 from .db import Database, Index, Model, Results
+from .fts import SearchIndex
 from .query import (
     AndQuery,
     FieldQuery,
@@ -29,6 +30,7 @@ __all__ = [
     "OrQuery",
     "Query",
     "Results",
+    "SearchIndex",
     "Type",
     "parse_sorted_query",
     "query_from_strings",
@@ -40,6 +40,7 @@ from beets.util.functemplate import get_template
 
 from ..util import cached_classproperty
 from . import types
+from .fts import SearchIndex
 from .query import MatchQuery, TrueQuery
 from .sort import NullSort
 
@@ -55,6 +56,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from ..util import PathLike
+    from ..util.functemplate import Template
     from .query import FieldQueryType, Query, SQLiteType
     from .sort import FieldSort, Sort
 
@@ -143,14 +145,21 @@ class FormattedMapping(Mapping[str, str]):
             default = self.model._type(key).format(None)
         return super().get(key, default)
 
+    @cached_property
+    def _sep_replacements(self) -> tuple[str, str]:
+        """The replacements for path and drive separators in values."""
+        return (
+            beets.config["path_sep_replace"].as_str(),
+            beets.config["drive_sep_replace"].as_str(),
+        )
+
     def _get_formatted(self, model: Model, key: str) -> str:
         value = model._type(key).format(model.get(key))
         if isinstance(value, bytes):
             value = value.decode("utf-8", "ignore")
 
         if self.for_path:
-            sep_repl = beets.config["path_sep_replace"].as_str()
-            sep_drive = beets.config["drive_sep_replace"].as_str()
+            sep_repl, sep_drive = self._sep_replacements
 
             if re.match(r"^[a-zA-Z]:", value):
                 value = re.sub(r"(?<=[a-zA-Z]):", sep_drive, value)
@@ -348,6 +357,40 @@ class Model(ABC, Generic[D]):
         # gather the getter mapping every time.
         raise NotImplementedError()
 
+    @classmethod
+    def flex_field_sql(cls, key: str) -> str | None:
+        """Return an SQL expression that evaluates to the flexible
+        attribute `key` of the row being queried, or None if `key` is a
+        computed field, which can only be evaluated in Python.
+
+        The expression is NULL for rows that do not have the attribute.
+        It can be used to evaluate queries and sorts on flexible
+        attributes in the database.
+        """
+        if key in cls._getters():
+            return None
+        return cls._flex_value_sql(key, f"{cls._table}.id")
+
+    @classmethod
+    def _flex_value_sql(cls, key: str, entity_id: str) -> str:
+        """Return a subquery selecting the flexible attribute `key` of the
+        entity whose id is given by the SQL expression `entity_id`.
+
+        Values of numeric types are cast so that they compare and sort as
+        numbers rather than as the text they are stored as.
+        """
+        # Like `_get`, match the key case-insensitively but prefer an
+        # exact match.
+        key_sql = "'{}'".format(key.replace("'", "''"))
+        value_sql = (
+            f"(SELECT value FROM {cls._flex_table} "
+            f"WHERE entity_id = {entity_id} AND key = {key_sql} COLLATE NOCASE "
+            f"ORDER BY key = {key_sql} DESC LIMIT 1)"
+        )
+        if cls._type(key).sql in ("INTEGER", "REAL"):
+            value_sql = f"CAST({value_sql} AS NUMERIC)"
+        return value_sql
+
     def _template_funcs(self) -> Mapping[str, Callable[[str], str]]:
         """Return a mapping from function names to text-transformer
         functions.
@@ -591,46 +634,34 @@ class Model(ABC, Generic[D]):
         :param fields: the fields to be stored. If not specified, all fields
         will be.
         """
+        self.db._store([self], fields)
+        self.db._model_changed(self)
+
+    def _dirty_values(
+        self, fields: Iterable[str] | None = None
+    ) -> tuple[dict[str, SQLiteType], dict[str, SQLiteType], set[str]]:
+        """Get the changes `store` needs to write to the database: the SQL
+        values of the modified fixed fields among `fields` (all fields by
+        default) and of the modified flexible attributes, and the keys of
+        the flexible attributes to delete.
+        """
         if fields is None:
             fields = self._fields
 
-        # Build assignments for query.
-        assignments = []
-        subvars: list[SQLiteType] = []
+        dirty = set(self._dirty)
+        values = {}
         for key in fields:
-            if key != "id" and key in self._fields and key in self._dirty:
-                self._dirty.remove(key)
-                assignments.append(f"{key}=?")
-                value = self._type(key).to_sql(self[key])
-                subvars.append(value)
+            if key != "id" and key in self._fields and key in dirty:
+                dirty.remove(key)
+                values[key] = self._type(key).to_sql(self[key])
 
-        with self.db.transaction() as tx:
-            # Main table update.
-            if assignments:
-                query = f"UPDATE {self._table} SET {','.join(assignments)} WHERE id=?"
-                subvars.append(self.id)
-                tx.mutate(query, subvars)
-
-            # Modified/added flexible attributes.
-            for key, value in self._values_flex.items():
-                if key in self._dirty:
-                    self._dirty.remove(key)
-                    value = self._type(key).to_sql(value)
-                    tx.mutate(
-                        f"INSERT INTO {self._flex_table} "
-                        "(entity_id, key, value) "
-                        "VALUES (?, ?, ?);",
-                        (self.id, key, value),
-                    )
+        flex_values = {}
+        for key, value in self._values_flex.items():
+            if key in dirty:
+                dirty.remove(key)
+                flex_values[key] = self._type(key).to_sql(value)
 
-            # Deleted flexible attributes.
-            for key in self._dirty:
-                tx.mutate(
-                    f"DELETE FROM {self._flex_table} WHERE entity_id=? AND key=?",
-                    (self.id, key),
-                )
-
-        self.clear_dirty()
+        return values, flex_values, dirty
 
     def load(self) -> None:
         """Refresh the object's metadata from the library database.
@@ -652,6 +683,9 @@ class Model(ABC, Generic[D]):
             tx.mutate(
                 f"DELETE FROM {self._flex_table} WHERE entity_id=?", (self.id,)
             )
+            if self.db.search_index:
+                self.db.search_index.remove(tx, self)
+        self.db._model_changed(self)
 
     def add(self, db: D | None = None):
         """Add the object to the library database. This object must be
@@ -666,22 +700,25 @@ class Model(ABC, Generic[D]):
         db = self._check_db(need_id=False)
 
         with db.transaction() as tx:
-            new_id = tx.mutate(f"INSERT INTO {self._table} DEFAULT VALUES")
-            self.id = new_id
-            self.added = time.time()
-
-            # Mark every non-null field as dirty and store.
-            for key in self:
-                if self[key] is not None:
-                    self._dirty.add(key)
+            self._insert(tx)
             self.store()
 
+    def _insert(self, tx: Transaction) -> None:
+        """Create an empty row for the object and mark every non-null stored
+        field as dirty, so that the next `store` fills the row in.
+        """
+        self.id = tx.mutate(f"INSERT INTO {self._table} DEFAULT VALUES")
+        self.added = time.time()
+        for key in (*self._fields, *self._values_flex):
+            if self[key] is not None:
+                self._dirty.add(key)
+
     # Formatting and templating.
     _formatter: type[FormattedMapping]
 
     def formatted(
         self,
-        included_keys: str = FormattedMapping.ALL_KEYS,
+        included_keys: str | list[str] = FormattedMapping.ALL_KEYS,
         for_path: bool = False,
     ) -> FormattedMapping:
         """Get a mapping containing all values on this object formatted
@@ -689,14 +726,29 @@ class Model(ABC, Generic[D]):
         """
         return self._formatter(self, included_keys, for_path)
 
+    def template_values(
+        self, template: Template, for_path: bool = False
+    ) -> FormattedMapping:
+        """Get a mapping of the formatted values on this object that
+        `template` refers to.
+
+        Unlike `formatted`, the mapping does not need to look up every
+        field of the object.
+        """
+        keys = self.keys(computed=True)
+        return self.formatted(
+            [k for k in template.varnames if k in keys], for_path
+        )
+
     def evaluate_template(self, fmt: str, for_path: bool = False) -> str:
         """Evaluate a format string using the object's fields.
 
         If `for_path` is true, then no new path separators are added to the template.
         """
         # Perform substitution.
-        return get_template(fmt).substitute(
-            self.formatted(for_path=for_path), self._template_funcs()
+        template = get_template(fmt)
+        return template.substitute(
+            self.template_values(template, for_path), self._template_funcs()
         )
 
     # Parsing.
@@ -764,16 +816,39 @@ class Results(Sequence[AnyModel]):
         self.sort = sort
         self.flex_rows = flex_rows
 
-        # We keep a queue of rows we haven't yet consumed for
-        # materialization. We preserve the original total number of
-        # rows.
-        self._rows = rows
-        self._row_count = len(rows)
+        # An iterator over the rows we haven't yet consumed for
+        # materialization, paired with their flexible attributes. It is
+        # shared by all iterators over this result set.
+        self._pending_rows = self._iter_rows()
+        self._exhausted = False
 
         # The materialized objects corresponding to rows that have been
         # consumed.
         self._objects: list[AnyModel] = []
 
+        # Called with each chunk of objects before they are produced.
+        self._prefetch: Callable[[list[AnyModel]], None] | None = None
+
+    def prefetch(self, fetch: Callable[[list[AnyModel]], None]) -> Self:
+        """Materialize the objects in chunks and call `fetch` with each
+        chunk before its objects are produced, so that it can load data
+        related to all of them at once. Return the result set itself.
+        """
+        self._prefetch = fetch
+        return self
+
+    @cached_property
+    def _row_count(self) -> int:
+        """The total number of rows returned by the database."""
+        return len(self.rows)
+
+    def _iter_rows(self) -> Iterator[tuple[sqlite3.Row, FlexAttrs]]:
+        """Generate database rows along with their flexible attributes."""
+        # Index flexible attributes by the item ID, so we have easier access
+        flex_attrs = self._get_indexed_flex_attrs()
+        for row in self.rows:
+            yield row, flex_attrs.get(row["id"], {})
+
     def _get_objects(self) -> Iterator[AnyModel]:
         """Construct and generate Model objects for they query. The
         objects are returned in the order emitted from the database; no
@@ -784,30 +859,36 @@ class Results(Sequence[AnyModel]):
         a `Results` object a second time should be much faster than the
         first.
         """
-
-        # Index flexible attributes by the item ID, so we have easier access
-        flex_attrs = self._get_indexed_flex_attrs()
-
         index = 0  # Position in the materialized objects.
-        while index < len(self._objects) or self._rows:
+        while True:
             # Are there previously-materialized objects to produce?
             if index < len(self._objects):
                 yield self._objects[index]
                 index += 1
-
-            # Otherwise, we consume another row, materialize its object
-            # and produce it.
-            else:
-                while self._rows:
-                    row = self._rows.pop(0)
-                    obj = self._make_model(row, flex_attrs.get(row["id"], {}))
-                    # If there is a slow-query predicate, ensurer that the
-                    # object passes it.
-                    if not self.query or self.query.match(obj):
-                        self._objects.append(obj)
-                        index += 1
-                        yield obj
+                continue
+
+            if self._exhausted:
+                return
+
+            # Otherwise, we consume another row (or, when prefetching,
+            # another chunk of rows) and materialize its object. The loop
+            # above then produces it.
+            chunk: list[AnyModel] = []
+            chunk_size = StreamingResults.CHUNK_SIZE if self._prefetch else 1
+            for row, flex_values in self._pending_rows:
+                obj = self._make_model(row, flex_values)
+                # If there is a slow-query predicate, ensure that the
+                # object passes it.
+                if not self.query or self.query.match(obj):
+                    chunk.append(obj)
+                    if len(chunk) == chunk_size:
                         break
+            else:
+                self._exhausted = True
+
+            if chunk and self._prefetch:
+                self._prefetch(chunk)
+            self._objects.extend(chunk)
 
     def __iter__(self) -> Iterator[AnyModel]:
         """Construct and generate Model objects for all matching
@@ -846,7 +927,7 @@ class Results(Sequence[AnyModel]):
 
     def __len__(self) -> int:
         """Get the number of matching objects."""
-        if not self._rows:
+        if self._exhausted:
             # Fully materialized. Just count the objects.
             return len(self._objects)
 
@@ -879,7 +960,7 @@ class Results(Sequence[AnyModel]):
         if isinstance(index, slice) or index < 0:
             return list(self)[index]
 
-        if not self._rows and not self.sort:
+        if self._exhausted and not self.sort:
             # Fully materialized and already in order. Just look up the
             # object.
             return self._objects[index]
@@ -903,6 +984,111 @@ class Results(Sequence[AnyModel]):
             return None
 
 
+class StreamingResults(Results[AnyModel]):
+    """A result set that reads rows from the database in chunks instead
+    of fetching the whole result up front.
+
+    The ids of the matching rows are read first. The rows themselves,
+    and their flexible attributes, are then read one chunk at a time and
+    merged on `entity_id`, so memory use stays bounded by the chunk size
+    (plus the ids and whatever objects the caller keeps around) and the
+    first objects are available before the query has been fully read.
+
+    Each chunk is read by its own statement, so no lock is held on the
+    database while the results are consumed. A row that is removed in
+    the meantime is skipped, and a changed row is read as it is when its
+    chunk is.
+    """
+
+    CHUNK_SIZE: ClassVar[int] = 500
+    """The number of rows read at once. This also bounds the number of
+    parameters in the row and flexible attribute queries.
+    """
+
+    def __init__(
+        self,
+        model_class: type[AnyModel],
+        db: D,
+        sql: str,
+        subvals: Sequence[SQLiteType],
+        query: Query | None = None,
+        sort: Sort | None = None,
+    ) -> None:
+        """Create a result set for the rows whose ids the `sql`
+        statement selects, in order, with the substitution values
+        `subvals`.
+
+        `query` and `sort` are the slow query and sort components, as
+        for `Results`.
+        """
+        self.sql = sql
+        self.subvals = subvals
+        super().__init__(model_class, [], db, [], query, sort)
+
+    @cached_property
+    def _row_count(self) -> int:
+        """Count the rows returned by the database without fetching them."""
+        with self.db.transaction() as tx:
+            return tx.query(f"SELECT COUNT(*) FROM ({self.sql})", self.subvals)[
+                0
+            ][0]
+
+    def _iter_rows(self) -> Iterator[tuple[sqlite3.Row, FlexAttrs]]:
+        with self.db.transaction() as tx:
+            ids = [row[0] for row in tx.query(self.sql, self.subvals)]
+
+        for start in range(0, len(ids), self.CHUNK_SIZE):
+            chunk = ids[start : start + self.CHUNK_SIZE]
+            with self.db.transaction() as tx:
+                rows_by_id = {
+                    row["id"]: row
+                    for row in tx.query(
+                        f"SELECT * FROM {self.model_class._table} "
+                        f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                }
+            rows = [rows_by_id[i] for i in chunk if i in rows_by_id]
+            if not rows:
+                continue
+
+            flex_attrs = self._get_chunk_flex_attrs(rows)
+            for row in rows:
+                yield row, flex_attrs.get(row["id"], {})
+
+    def _get_chunk_flex_attrs(
+        self, rows: list[sqlite3.Row]
+    ) -> dict[int, FlexAttrs]:
+        """Fetch the flexible attributes for a chunk of rows, indexed by
+        the entity id they belong to.
+
+        The attribute rows are ordered by `entity_id` so that they can be
+        merged with the sorted ids of the chunk in a single pass.
+        """
+        ids = sorted(row["id"] for row in rows)
+        with self.db.transaction() as tx:
+            flex_rows = tx.query(
+                f"SELECT entity_id, key, value "
+                f"FROM {self.model_class._flex_table} "
+                f"WHERE entity_id IN ({', '.join('?' * len(ids))}) "
+                "ORDER BY entity_id",
+                ids,
+            )
+
+        flex_values: dict[int, FlexAttrs] = {}
+        flex_iter = iter(flex_rows)
+        flex_row = next(flex_iter, None)
+        for entity_id in ids:
+            while flex_row is not None and flex_row["entity_id"] <= entity_id:
+                if flex_row["entity_id"] == entity_id:
+                    flex_values.setdefault(entity_id, {})[flex_row["key"]] = (
+                        flex_row["value"]
+                    )
+                flex_row = next(flex_iter, None)
+
+        return flex_values
+
+
 class Transaction:
     """A context manager for safe, concurrent access to the database.
     All SQL commands should be executed through a transaction.
@@ -913,6 +1099,9 @@ class Transaction:
     current transaction.
     """
 
+    _locked = False
+    """Whether this root transaction holds the database lock."""
+
     def __init__(self, db: Database) -> None:
         self.db = db
 
@@ -923,12 +1112,38 @@ class Transaction:
         with self.db._tx_stack() as stack:
             first = not stack
             stack.append(self)
-        if first:
+        if first and not self.db.wal:
             # Beginning a "root" transaction, which corresponds to an
-            # SQLite transaction.
-            self.db._db_lock.acquire()
+            # SQLite transaction. In WAL mode, readers don't block
+            # writers, so only transactions that write take the lock.
+            self._lock()
         return self
 
+    def _lock(self) -> None:
+        """Take the database lock for the root transaction unless it
+        already holds it.
+        """
+        with self.db._tx_stack() as stack:
+            root = stack[0]
+        if not root._locked:
+            self.db._db_lock.acquire()
+            root._locked = True
+
+    @property
+    def excludes_writers(self) -> bool:
+        """Whether other threads are kept from writing until the root
+        transaction ends.
+        """
+        with self.db._tx_stack() as stack:
+            return stack[0]._locked
+
+    def exclude_writers(self) -> None:
+        """Keep other threads from writing until the root transaction
+        ends. In WAL mode, this waits for the transactions that are
+        writing to commit first.
+        """
+        self._lock()
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -939,8 +1154,10 @@ class Transaction:
         entered but not yet exited transaction. If it is the last active
         transaction, the database updates are committed.
         """
-        # Beware of races; currently secured by db._db_lock
-        self.db.revision += self._mutated
+        # Beware of races; currently secured by db._db_lock, which
+        # transactions that mutate always hold.
+        if self._mutated:
+            self.db.revision += 1
         with self.db._tx_stack() as stack:
             assert stack.pop() is self
             empty = not stack
@@ -948,7 +1165,9 @@ class Transaction:
             # Ending a "root" transaction. End the SQLite transaction.
             self.db._connection().commit()
             self._mutated = False
-            self.db._db_lock.release()
+            if self._locked:
+                self._locked = False
+                self.db._db_lock.release()
 
         if (
             isinstance(exc_value, sqlite3.OperationalError)
@@ -974,6 +1193,7 @@ class Transaction:
         Yield control to mutation execution code. If execution succeeds,
         mark this transaction as mutated.
         """
+        self._lock()
         try:
             yield
         except sqlite3.OperationalError as e:
@@ -1014,6 +1234,7 @@ class Transaction:
     def script(self, statements: str) -> None:
         """Execute a string containing multiple SQL statements."""
         # We don't know whether this mutates, but quite likely it does.
+        self._lock()
         self._mutated = True
         self.db._connection().executescript(statements)
 
@@ -1095,7 +1316,13 @@ class Database:
 
     path: Path
 
-    def __init__(self, path: PathLike, timeout: float = 5.0) -> None:
+    def __init__(
+        self,
+        path: PathLike,
+        timeout: float = 5.0,
+        search_index: SearchIndex | None = None,
+        wal: bool = False,
+    ) -> None:
         if sqlite3.threadsafety == 0:
             raise RuntimeError(
                 "sqlite3 must be compiled with multi-threading support"
@@ -1126,9 +1353,13 @@ class Database:
         # backoff algorithm in the case of contention was causing
         # whole-second sleeps (!) that would trigger its internal
         # timeout. Using this lock ensures only one SQLite transaction
-        # is active at a time.
+        # is active at a time. In WAL mode, it only serializes writes.
         self._db_lock = threading.Lock()
 
+        self.wal = False
+        if wal:
+            self.wal = self._enable_wal()
+
         # Set up database schema.
         self._ensure_migration_state_table()
         for model_cls in self._models:
@@ -1137,6 +1368,8 @@ class Database:
             self._create_indices(model_cls._table, model_cls._indices)
 
         self._migrate()
+        SearchIndex.setup(self, search_index)
+        self.search_index = search_index
 
     @cached_property
     def db_tables(self) -> dict[str, TableInfo]:
@@ -1219,10 +1452,30 @@ class Database:
             for path in self._extensions:
                 conn.load_extension(path)
 
+        if self.wal:
+            # Take the write lock when a transaction begins rather than
+            # when it first writes, so that writers from other processes
+            # wait for each other instead of failing to upgrade.
+            conn.isolation_level = "IMMEDIATE"
+
         # Access SELECT results like dictionaries.
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _enable_wal(self) -> bool:
+        """Switch the database to write-ahead logging, which lets readers
+        run concurrently with a writer, and return whether that worked.
+
+        In-memory databases, for example, cannot use it.
+        """
+        with self.transaction() as tx:
+            mode = tx.query("PRAGMA journal_mode = WAL")[0][0]
+        if mode != "wal":
+            return False
+
+        self._connection().isolation_level = "IMMEDIATE"
+        return True
+
     def add_functions(self, conn: sqlite3.Connection) -> None:
         def regexp(value: Any, pattern: str) -> bool:
             if isinstance(value, bytes):
@@ -1390,6 +1643,99 @@ class Database:
                 (name, table),
             )
 
+    # Writing.
+
+    def store_many(
+        self, objs: Iterable[Model], fields: Iterable[str] | None = None
+    ) -> None:
+        """Save the metadata of the objects into the database, like calling
+        `Model.store` on each of them.
+
+        The writes are batched: objects that changed the same fixed fields
+        are updated with a single statement, and so are all flexible
+        attributes.
+        """
+        objs = list(objs)
+        self._store(objs, fields)
+        for obj in objs:
+            self._model_changed(obj)
+
+    def _store(
+        self, objs: Iterable[Model], fields: Iterable[str] | None = None
+    ) -> None:
+        """Write the changes of the objects to the database."""
+        objs = list(objs)
+        fields = None if fields is None else list(fields)
+
+        # Rows of substitution values per statement.
+        updates: defaultdict[
+            tuple[str, tuple[str, ...]], list[tuple[SQLiteType, ...]]
+        ] = defaultdict(list)
+        flex_updates: defaultdict[str, list[tuple[SQLiteType, ...]]] = (
+            defaultdict(list)
+        )
+        flex_deletes: defaultdict[str, list[tuple[SQLiteType, ...]]] = (
+            defaultdict(list)
+        )
+        reindexed = []
+        for obj in objs:
+            values, flex_values, deleted = obj._dirty_values(fields)
+            if values:
+                updates[obj._table, tuple(values)].append(
+                    (*values.values(), obj.id)
+                )
+                if not values.keys().isdisjoint(obj._search_fields):
+                    reindexed.append(obj)
+            flex_updates[obj._flex_table].extend(
+                (obj.id, key, value) for key, value in flex_values.items()
+            )
+            flex_deletes[obj._flex_table].extend(
+                (obj.id, key) for key in deleted
+            )
+
+        with self.transaction() as tx:
+            for (table, keys), rows in updates.items():
+                assignments = ",".join(f"{key}=?" for key in keys)
+                tx.mutate_many(
+                    f"UPDATE {table} SET {assignments} WHERE id=?", rows
+                )
+            for flex_table, rows in flex_updates.items():
+                if rows:
+                    tx.mutate_many(
+                        f"INSERT INTO {flex_table} (entity_id, key, value) "
+                        "VALUES (?, ?, ?);",
+                        rows,
+                    )
+            for flex_table, rows in flex_deletes.items():
+                if rows:
+                    tx.mutate_many(
+                        f"DELETE FROM {flex_table} WHERE entity_id=? AND key=?",
+                        rows,
+                    )
+            if self.search_index:
+                for obj in reindexed:
+                    self.search_index.update(tx, obj)
+
+        for obj in objs:
+            obj.clear_dirty()
+
+    def add_many(self, objs: Iterable[Model]) -> None:
+        """Add the objects to the database, like calling `Model.add` on
+        each of them, but storing their fields with `store_many`.
+        """
+        objs = list(objs)
+        with self.transaction() as tx:
+            for obj in objs:
+                obj._db = self
+                obj._insert(tx)
+            self.store_many(objs)
+
+    def _model_changed(self, obj: Model) -> None:
+        """Handle a change to `obj` that was written to the database.
+
+        Subclasses can override this to report changes.
+        """
+
     # Querying.
 
     def _get_results(
@@ -1397,11 +1743,15 @@ class Database:
         model_cls: type[AnyModel],
         query: Query | None = None,
         sort: Sort | None = None,
+        stream: bool = False,
     ) -> Results[AnyModel]:
         """Fetch the objects of type `model_cls` matching the given
         query. The query may be given as a string, string sequence, a
         Query object, or None (to fetch everything). `sort` is an
         `Sort` object.
+
+        If `stream` is true, return a `StreamingResults` that reads the
+        rows from the database in chunks while they are consumed.
         """
         query = query or TrueQuery()  # A null query.
         sort = sort or NullSort()  # Unsorted.
@@ -1409,9 +1759,7 @@ class Database:
         order_by = sort.order_clause()
 
         table = model_cls._table
-        _from = table
-        if query.field_names & model_cls.other_db_fields:
-            _from += f" {model_cls.relation_join}"
+        _from = self._query_source(model_cls, query)
 
         # group by id to avoid duplicates when joining with the relation
         sql = (
@@ -1429,13 +1777,28 @@ class Database:
             f"WHERE entity_id IN (SELECT id FROM ({sql}))"
         )
 
+        # When streaming, only the ids are selected up front.
+        columns = "id" if stream else "*"
         if order_by:
             # the sort field may exist in both 'items' and 'albums' tables
             # (when they are joined), causing ambiguous column OperationalError
             # if we try to order directly.
             # Since the join is required only for filtering, we can filter in
             # a subquery and order the result, which returns unique fields.
-            sql = f"SELECT * FROM ({sql}) ORDER BY {order_by}"
+            # The subquery is named after the table so that sorts on
+            # flexible attributes can refer to its rows.
+            sql = (
+                f"SELECT {columns} FROM ({sql}) AS {table} ORDER BY {order_by}"
+            )
+        elif stream:
+            sql = f"SELECT id FROM ({sql})"
+
+        slow_query = None if where else query
+        slow_sort = sort if sort.is_slow() else None
+        if stream:
+            return StreamingResults(
+                model_cls, self, sql, subvals, slow_query, slow_sort
+            )
 
         with self.transaction() as tx:
             rows = tx.query(sql, subvals)
@@ -1446,10 +1809,50 @@ class Database:
             rows,
             self,
             flex_rows,
-            None if where else query,  # Slow query component.
-            sort if sort.is_slow() else None,  # Slow sort component.
+            slow_query,  # Slow query component.
+            slow_sort,  # Slow sort component.
         )
 
+    @staticmethod
+    def _query_source(model_cls: type[Model], query: Query) -> str:
+        """Return the tables to select the rows `query` filters from: the
+        model's table, joined with its related table if the query needs it.
+        """
+        if query.field_names & model_cls.other_db_fields:
+            return f"{model_cls._table} {model_cls.relation_join}"
+        return model_cls._table
+
+    def _matching_ids(
+        self, model_cls: type[Model], query: Query, ids: Sequence[int]
+    ) -> set[int] | None:
+        """Return those of `ids` whose rows match `query`, or None if the
+        query cannot be evaluated by the database the same way as by
+        `Query.match`.
+        """
+        where, subvals = query.clause()
+        if where is None:
+            return None
+        # SQLite's LIKE only folds the case of ASCII characters, while
+        # string queries lowercase any character when matching.
+        if any(isinstance(v, str) and not v.isascii() for v in subvals):
+            return None
+
+        table = model_cls._table
+        matching = set()
+        chunk_size = StreamingResults.CHUNK_SIZE
+        with self.transaction() as tx:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start : start + chunk_size]
+                rows = tx.query(
+                    f"SELECT DISTINCT {table}.id "
+                    f"FROM ({self._query_source(model_cls, query)}) "
+                    f"WHERE {table}.id IN ({', '.join('?' * len(chunk))}) "
+                    f"AND ({where})",
+                    [*chunk, *subvals],
+                )
+                matching.update(row[0] for row in rows)
+        return matching
+
     def _get(self, model_cls: type[AnyModel], id_: int) -> AnyModel | None:
         """Get a Model object by its id or None if the id does not exist."""
         return self._get_results(model_cls, MatchQuery("id", id_)).get()
@@ -0,0 +1,135 @@
+"""A full-text index of the search fields of models, backed by SQLite's
+FTS5 extension.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from unidecode import unidecode
+
+from .query import FullTextQuery
+
+if TYPE_CHECKING:
+    from .db import Database, Model, Transaction
+    from .query import FieldQueryType, Query
+
+
+class SearchIndex:
+    """Index the `_search_fields` of a database's models in FTS5 tables.
+
+    The tables use the trigram tokenizer, which lets them find the rows
+    whose fields contain a given substring without scanning the model's
+    table. If `asciify` is true, the unidecoded values of the fields are
+    indexed instead of the values themselves.
+    """
+
+    min_pattern_length = 3
+    """The length of the shortest pattern the trigram tokenizer can look up."""
+
+    def __init__(self, asciify: bool = False) -> None:
+        self.asciify = asciify
+
+    @staticmethod
+    def tables(model_cls: type[Model]) -> tuple[str, str]:
+        """Return the names of the plain and the asciified index tables
+        for `model_cls`.
+        """
+        return f"{model_cls._table}_fts", f"{model_cls._table}_fts_ascii"
+
+    def table(self, model_cls: type[Model]) -> str:
+        """Return the name of the index table for `model_cls`."""
+        return self.tables(model_cls)[self.asciify]
+
+    def _values_sql(self, model_cls: type[Model]) -> str:
+        """Return the SQL expressions for the indexed values of a row."""
+        if self.asciify:
+            return ", ".join(
+                f"unidecode(COALESCE({f}, ''))"
+                for f in model_cls._search_fields
+            )
+        return ", ".join(model_cls._search_fields)
+
+    def _insert_sql(self, model_cls: type[Model]) -> str:
+        fields = ", ".join(model_cls._search_fields)
+        return (
+            f"INSERT OR REPLACE INTO {self.table(model_cls)} (rowid, {fields}) "
+            f"SELECT id, {self._values_sql(model_cls)} FROM {model_cls._table}"
+        )
+
+    @classmethod
+    def setup(cls, db: Database, index: SearchIndex | None) -> None:
+        """Create and fill the index tables `index` needs in `db` and drop
+        any other ones.
+
+        Indices that are not in use are not kept up to date, so they are
+        dropped rather than left to go stale.
+        """
+        with db.transaction() as tx:
+            existing = {
+                row[0]
+                for row in tx.query(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+            for model_cls in db._models:
+                keep = index.table(model_cls) if index else None
+                for table in cls.tables(model_cls):
+                    if table in existing and table != keep:
+                        tx.script(f"DROP TABLE {table};")
+                if index and model_cls._search_fields and keep not in existing:
+                    index._create(tx, model_cls)
+
+    def _create(self, tx: Transaction, model_cls: type[Model]) -> None:
+        """Create and fill the index table for `model_cls`."""
+        fields = ", ".join(model_cls._search_fields)
+        tx.script(
+            f"CREATE VIRTUAL TABLE {self.table(model_cls)} "
+            f"USING fts5({fields}, tokenize='trigram');"
+        )
+        tx.mutate(self._insert_sql(model_cls))
+
+    def update(self, tx: Transaction, obj: Model) -> None:
+        """Index the stored values of `obj`."""
+        tx.mutate(f"{self._insert_sql(type(obj))} WHERE id = ?", (obj.id,))
+
+    def remove(self, tx: Transaction, obj: Model) -> None:
+        """Remove `obj` from the index."""
+        if not obj._search_fields:
+            return
+        tx.mutate(
+            f"DELETE FROM {self.table(type(obj))} WHERE rowid = ?", (obj.id,)
+        )
+
+    def supports(self, query_cls: FieldQueryType) -> bool:
+        """Whether the index can narrow down the rows matched by queries of
+        type `query_cls`.
+        """
+        if query_cls.fts_match == "ascii":
+            return self.asciify
+        return query_cls.fts_match == "substring"
+
+    def query(
+        self,
+        model_cls: type[Model],
+        subquery: Query,
+        pattern: str,
+        fields: list[str] | None = None,
+    ) -> Query:
+        """Look up the rows matched by `subquery` in the index, given that
+        they contain `pattern` in one of `fields` (by default, any indexed
+        field).
+
+        Patterns that are too short for the index leave `subquery` as is.
+        """
+        if self.asciify:
+            pattern = unidecode(pattern)
+        if len(pattern) < self.min_pattern_length:
+            return subquery
+
+        fts_match = '"{}"'.format(pattern.replace('"', '""'))
+        if fields:
+            fts_match = f"{{{' '.join(fields)}}} : {fts_match}"
+        return FullTextQuery(
+            subquery, model_cls._table, self.table(model_cls), fts_match
+        )
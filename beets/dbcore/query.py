@@ -130,8 +130,28 @@ class FieldQuery(Query, Generic[P]):
     same matching functionality in SQLite.
     """
 
+    flex_col_clause: ClassVar[bool] = False
+    """Whether `col_clause` also works when the field is given by an SQL
+    expression (`field_sql`) rather than a column, so that the query can
+    be evaluated in SQLite for flexible attributes.
+    """
+
+    fts_match: ClassVar[str | None] = None
+    """How a full-text index can narrow down the rows this query matches:
+    ``"substring"`` if their value contains the pattern, ignoring case, or
+    ``"ascii"`` if their unidecoded value contains the unidecoded pattern.
+    See `beets.dbcore.fts.SearchIndex`.
+    """
+
+    field_sql: str | None = None
+    """An SQL expression evaluating to the field's value, used in place of
+    the column name for fields that are not columns of the table.
+    """
+
     @property
     def field(self) -> str:
+        if self.field_sql is not None:
+            return self.field_sql
         return (
             f"{self.table}.{self.field_name}" if self.table else self.field_name
         )
@@ -183,6 +203,8 @@ class FieldQuery(Query, Generic[P]):
 class MatchQuery(FieldQuery[AnySQLiteType]):
     """A query that looks for exact matches in an Model field."""
 
+    flex_col_clause = True
+
     def col_clause(self) -> tuple[str, Sequence[SQLiteType]]:
         return f"{self.field} = ?", [self.pattern]
 
@@ -196,6 +218,8 @@ class MatchQuery(FieldQuery[AnySQLiteType]):
 class NoneQuery(FieldQuery[None]):
     """A query that checks whether a field is null."""
 
+    flex_col_clause = True
+
     def __init__(self, field: str, fast: bool = True) -> None:
         super().__init__(field, None, fast)
 
@@ -237,6 +261,8 @@ class StringFieldQuery(FieldQuery[P]):
 class StringQuery(StringFieldQuery[str]):
     """A query that matches a whole string in a specific Model field."""
 
+    flex_col_clause = True
+
     def col_clause(self) -> tuple[str, Sequence[SQLiteType]]:
         search = (
             self.pattern.replace("\\", "\\\\")
@@ -255,6 +281,9 @@ class StringQuery(StringFieldQuery[str]):
 class SubstringQuery(StringFieldQuery[str]):
     """A query that matches a substring in a specific Model field."""
 
+    flex_col_clause = True
+    fts_match = "substring"
+
     def col_clause(self) -> tuple[str, Sequence[SQLiteType]]:
         pattern = (
             self.pattern.replace("\\", "\\\\")
@@ -376,6 +405,8 @@ class RegexpQuery(StringFieldQuery[Pattern[str]]):
     expression.
     """
 
+    flex_col_clause = True
+
     def __init__(
         self, field_name: str, pattern: str, fast: bool = True
     ) -> None:
@@ -430,6 +461,8 @@ class NumericQuery(FieldQuery[str]):
     a float.
     """
 
+    flex_col_clause = True
+
     def _convert(self, s: str) -> float | int | None:
         """Convert a string to a numeric type (float or int).
 
@@ -647,6 +680,61 @@ class NotQuery(Query):
         return hash(("not", hash(self.subquery)))
 
 
+class FullTextQuery(Query):
+    """A query that matches the same objects as `subquery` but, in SQLite,
+    only considers the rows of `table` that the FTS5 query `fts_match`
+    finds in the full-text index `fts_table`.
+
+    `fts_match` must find (a superset of) all rows matched by `subquery`:
+    the index narrows down the candidates and `subquery` decides.
+    """
+
+    @property
+    def field_names(self) -> set[str]:
+        """Return a set with field names that this query operates on."""
+        return self.subquery.field_names
+
+    def __init__(
+        self, subquery: Query, table: str, fts_table: str, fts_match: str
+    ) -> None:
+        self.subquery = subquery
+        self.table = table
+        self.fts_table = fts_table
+        self.fts_match = fts_match
+
+    def clause(self) -> tuple[str | None, Sequence[SQLiteType]]:
+        clause, subvals = self.subquery.clause()
+        if not clause:
+            return None, ()
+        candidates = (
+            f"SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH ?"
+        )
+        return (
+            f"{self.table}.id IN ({candidates}) AND ({clause})",
+            [self.fts_match, *subvals],
+        )
+
+    def match(self, obj: Model) -> bool:
+        return self.subquery.match(obj)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.subquery!r}, "
+            f"{self.fts_table!r}, {self.fts_match!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, FullTextQuery)
+            and self.subquery == other.subquery
+            and self.fts_table == other.fts_table
+            and self.fts_match == other.fts_match
+        )
+
+    def __hash__(self) -> int:
+        return hash(("fts", hash(self.subquery), self.fts_match))
+
+
 class TrueQuery(Query):
     """A query that always matches."""
 
@@ -857,6 +945,8 @@ class DateQuery(FieldQuery[str]):
     using an ellipsis interval syntax similar to that of NumericQuery.
     """
 
+    flex_col_clause = True
+
     def __init__(
         self, field_name: str, pattern: str, fast: bool = True
     ) -> None:
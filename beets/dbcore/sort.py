@@ -185,6 +185,28 @@ class SlowFieldSort(FieldSort):
         return True
 
 
+class FlexFieldSort(FieldSort):
+    """A sort criterion by a flexible field, evaluated in SQL using an
+    expression that looks up the field's value (see
+    `Model.flex_field_sql`).
+    """
+
+    def __init__(
+        self,
+        field: str,
+        field_sql: str,
+        ascending: bool = True,
+        case_insensitive: bool = True,
+    ) -> None:
+        super().__init__(field, ascending, case_insensitive)
+        self.field_sql = field_sql
+
+    def order_clause(self) -> str:
+        order = "ASC" if self.ascending else "DESC"
+        collate = "COLLATE NOCASE" if self.case_insensitive else ""
+        return f"{self.field_sql} {collate} {order}"
+
+
 class NullSort(Sort):
     """No sorting. Leave results unsorted."""
 
@@ -39,6 +39,7 @@ MetadataReceivedEventType = (
 AlbumMatchedEventType = Literal["album_matched"]
 LibraryEventType = Literal["cli_exit", "library_opened"]
 DatabaseChangeEventType = Literal["database_change"]
+DatabaseBulkChangeEventType = Literal["database_bulk_change"]
 ImportBeginEventType = Literal["import_begin"]
 ItemImportedEventType = Literal["item_imported"]
 ItemEventType = Literal["item_removed"]
@@ -60,6 +61,7 @@ EventType = (
     | AlbumMatchedEventType
     | LibraryEventType
     | DatabaseChangeEventType
+    | DatabaseBulkChangeEventType
     | ImportBeginEventType
     | ItemImportedEventType
     | ItemEventType
@@ -121,6 +123,11 @@ class DatabaseChangeEventArgs(TypedDict):
     model: LibModel
 
 
+class DatabaseBulkChangeEventArgs(TypedDict):
+    lib: Library
+    models: list[LibModel]
+
+
 class ImportBeginEventArgs(TypedDict):
     session: ImportSession
 
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import os
 import time
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from beets import config, logging, plugins, util
+from beets.exceptions import UserError
 from beets.util import displayable_path, normpath, pipeline, syspath
 
 from . import stages as stagefuncs
@@ -211,8 +213,16 @@ class ImportSession:
             # also add the music to the library database, so later
             # stages need to read and write data from there.
             if self.config["autotag"]:
+                # Look up several tasks at once, but let the user decide
+                # about them in order.
+                lookup_threads = self.config["lookup_threads"].get(int)
+                if lookup_threads < 1:
+                    raise UserError("lookup_threads must be at least 1")
                 stages += [
-                    stagefuncs.lookup_candidates(self),
+                    pipeline.ordered(
+                        stagefuncs.lookup_candidates(self)
+                        for _ in range(lookup_threads)
+                    ),
                     stagefuncs.user_query(self),
                 ]
             else:
@@ -250,7 +260,7 @@ class ImportSession:
         been imported in a previous session.
         """
         if self.is_resuming(toppath) and all(
-            [ImportState().progress_has_element(toppath, p) for p in paths]
+            self.state.progress_has_element(toppath, p) for p in paths
         ):
             return True
         if self.config["incremental"] and tuple(paths) in self.history_dirs:
@@ -258,14 +268,15 @@ class ImportSession:
 
         return False
 
-    _history_dirs = None
+    @cached_property
+    def state(self) -> ImportState:
+        """The import state, read from the state file once per session."""
+        return ImportState()
 
-    @property
+    @cached_property
     def history_dirs(self) -> set[tuple[PathBytes, ...]]:
-        # FIXME: This could be simplified to a cached property
-        if self._history_dirs is None:
-            self._history_dirs = ImportState().taghistory
-        return self._history_dirs
+        """The directories imported before the session started."""
+        return set(self.state.taghistory)
 
     def already_merged(self, paths: Sequence[PathBytes]) -> bool:
         """Returns true if all the paths being imported were part of a merge
@@ -298,7 +309,7 @@ class ImportSession:
 
         Determines the return value of `is_resuming(toppath)`.
         """
-        if self.want_resume and ImportState().progress_has(toppath):
+        if self.want_resume and self.state.progress_has(toppath):
             # Either accept immediately or prompt for input to decide.
             if self.want_resume is True or self.should_resume(toppath):
                 log.warning(
@@ -308,4 +319,4 @@ class ImportSession:
                 self._is_resuming[toppath] = True
             else:
                 # Clear progress; we're starting from the top.
-                ImportState().progress_reset(toppath)
+                self.state.progress_reset(toppath)
@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 import os
 import pickle
+import threading
 from bisect import bisect_left, insort
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar
 
 from typing_extensions import Self
 
@@ -35,6 +36,12 @@ class ImportState:
     This keeps track of all directories that were ever imported, which
     allows the importer to only import new stuff.
 
+    The state file holds a pickled snapshot of the state, followed by a
+    log of the changes made by the `progress_*` and `history_*` methods
+    since then, which are appended to the file one by one. Opening the
+    file replays the log, and the file is rewritten as a new snapshot
+    once the log outgrows the state.
+
     Usage
     -----
     ```
@@ -51,12 +58,20 @@ class ImportState:
     taghistory: set[tuple[PathBytes, ...]]
     path: PathBytes
 
+    #: The number of changes the log may hold before it is compacted,
+    #: unless the state itself is larger.
+    compact_threshold: ClassVar[int] = 1000
+
     def __init__(
         self, readonly: bool = False, path: PathBytes | None = None
     ) -> None:
         self.path = path or os.fsencode(config["statefile"].as_filename())
         self.tagprogress = {}
         self.taghistory = set()
+        # The number of changes logged after the snapshot, or None if
+        # there is no valid snapshot to append changes to.
+        self._logged: int | None = None
+        self._lock = threading.RLock()
         self._open()
 
     def __enter__(self) -> Self:
@@ -77,6 +92,8 @@ class ImportState:
                 # Read the states
                 self.tagprogress = state.get("tagprogress", {})
                 self.taghistory = state.get("taghistory", set())
+                self._logged = 0
+                self._replay(f)
         except Exception as exc:
             # The `pickle` module can emit all sorts of exceptions during
             # unpickling, including ImportError. We use a catch-all
@@ -84,18 +101,71 @@ class ImportState:
             # full list!).
             log.debug("state file could not be read: {}", exc)
 
-    def _save(self) -> None:
+    def _replay(self, f: BinaryIO) -> None:
+        """Apply the changes logged in `f` after the snapshot."""
+        size = os.fstat(f.fileno()).st_size
+        while True:
+            offset = f.tell()
+            try:
+                name, *args = pickle.load(f)
+                getattr(self, f"_{name}")(*args)
+            except Exception as exc:
+                if isinstance(exc, EOFError) and offset == size:
+                    return
+                # A change may have been cut short when writing it. Cut
+                # it off, so that later changes are appended after the
+                # last complete one.
+                log.debug("state file log could not be read: {}", exc)
+                self._truncate(offset)
+                return
+            self._logged += 1  # type: ignore[operator]
+
+    def _truncate(self, offset: int) -> None:
+        """Drop everything in the state file after `offset`."""
         try:
-            with open(self.path, "wb") as f:
-                pickle.dump(
-                    {
-                        "tagprogress": self.tagprogress,
-                        "taghistory": self.taghistory,
-                    },
-                    f,
-                )
+            os.truncate(self.path, offset)
         except OSError as exc:
-            log.error("state file could not be written: {}", exc)
+            log.debug("state file could not be truncated: {}", exc)
+            # The next change rewrites the file instead.
+            self._logged = None
+
+    def _save(self) -> None:
+        with self._lock:
+            tmp_path = self.path + b".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(
+                        {
+                            "tagprogress": self.tagprogress,
+                            "taghistory": self.taghistory,
+                        },
+                        f,
+                    )
+                os.replace(tmp_path, self.path)
+            except OSError as exc:
+                log.error("state file could not be written: {}", exc)
+                self._logged = None
+            else:
+                self._logged = 0
+
+    def _log(self, name: str, *args: Any) -> None:
+        """Apply a change to the state and append it to the state file."""
+        with self._lock:
+            getattr(self, f"_{name}")(*args)
+            if self._logged is None or self._logged >= max(
+                self.compact_threshold,
+                len(self.tagprogress) + len(self.taghistory),
+            ):
+                self._save()
+                return
+            try:
+                with open(self.path, "ab") as f:
+                    pickle.dump((name, *args), f)
+            except OSError as exc:
+                log.error("state file could not be written: {}", exc)
+                self._logged = None
+            else:
+                self._logged += 1
 
     # -------------------------------- Tagprogress ------------------------------- #
 
@@ -103,13 +173,15 @@ class ImportState:
         """Record that the files under all of the `paths` have been imported
         under `toppath`.
         """
-        with self as state:
-            imported = state.tagprogress.setdefault(toppath, [])
-            for path in paths:
-                if imported and imported[-1] <= path:
-                    imported.append(path)
-                else:
-                    insort(imported, path)
+        self._log("progress_add", toppath, *paths)
+
+    def _progress_add(self, toppath: PathBytes, *paths: PathBytes) -> None:
+        imported = self.tagprogress.setdefault(toppath, [])
+        for path in paths:
+            if imported and imported[-1] <= path:
+                imported.append(path)
+            else:
+                insort(imported, path)
 
     def progress_has_element(self, toppath: PathBytes, path: PathBytes) -> bool:
         """Return whether `path` has been imported in `toppath`."""
@@ -125,13 +197,17 @@ class ImportState:
 
     def progress_reset(self, toppath: PathBytes | None) -> None:
         """Reset the progress for `toppath`."""
-        with self as state:
-            if toppath in state.tagprogress:
-                del state.tagprogress[toppath]
+        self._log("progress_reset", toppath)
+
+    def _progress_reset(self, toppath: PathBytes | None) -> None:
+        if toppath in self.tagprogress:
+            del self.tagprogress[toppath]
 
     # -------------------------------- Taghistory -------------------------------- #
 
     def history_add(self, paths: list[PathBytes]) -> None:
         """Add the paths to the history."""
-        with self as state:
-            state.taghistory.add(tuple(paths))
+        self._log("history_add", tuple(paths))
+
+    def _history_add(self, paths: tuple[PathBytes, ...]) -> None:
+        self.taghistory.add(paths)
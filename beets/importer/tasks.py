@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import contextvars
 import logging
 import os
 import re
 import shutil
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cached_property
 from tempfile import mkdtemp
 from typing import TYPE_CHECKING, Any, AnyStr
@@ -15,19 +17,19 @@ import mediafile
 
 from beets import config, library, plugins, util
 from beets.autotag import AlbumMatch, Source, tag_album, tag_item
-from beets.dbcore.query import PathQuery
+from beets.dbcore.query import InQuery, OrQuery, PathQuery
 from beets.util import extension
 from beets.util.extension import remux_mpeglayer3_wav
 
 from .actions import Action, DuplicateAction
-from .state import ImportState
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
     from beets.autotag import Recommendation, TrackMatch
 
     from .session import ImportSession
+    from .state import ImportState
 
 # Global logger.
 log = logging.getLogger("beets")
@@ -35,6 +37,9 @@ log = logging.getLogger("beets")
 
 SINGLE_ARTIST_THRESH = 0.25
 
+# The number of paths to look up in the library with each query.
+PATH_QUERY_CHUNK_SIZE = 100
+
 # Usually flexible attributes are preserved (i.e., not updated) during
 # reimports. The following two lists (globally) change this behaviour for
 # certain fields. To alter these lists only when a specific plugin is in use,
@@ -82,6 +87,23 @@ def _item_dup_key(item: library.Item, keys: list[str]) -> tuple[Any, ...]:
     return tuple(item.get(k) for k in keys)
 
 
+def _items_at_paths(
+    lib: library.Library, paths: Sequence[util.PathBytes]
+) -> list[list[library.Item]]:
+    """Return the items of `lib` at each of `paths`, as a separate
+    `PathQuery` for each path would, in a few queries.
+    """
+    found: list[list[library.Item]] = []
+    for start in range(0, len(paths), PATH_QUERY_CHUNK_SIZE):
+        queries = [
+            PathQuery("path", p)
+            for p in paths[start : start + PATH_QUERY_CHUNK_SIZE]
+        ]
+        items = list(lib.items(OrQuery(queries)))
+        found.extend([i for i in items if q.match(i)] for q in queries)
+    return found
+
+
 def _dup_items(obj: library.Album | library.Item) -> list[library.Item]:
     """Flatten a found-duplicate (`Album` or `Item`) into its items."""
     if isinstance(obj, library.Album):
@@ -287,16 +309,16 @@ class ImportTask(BaseImportTask):
             self.choice_flag = Action.APPLY  # Implicit choice.
             self.match = choice  # type: ignore[assignment]
 
-    def save_progress(self) -> None:
+    def save_progress(self, state: ImportState) -> None:
         """Updates the progress state to indicate that this album has
         finished.
         """
         if self.toppath:
-            ImportState().progress_add(self.toppath, *self.paths)
+            state.progress_add(self.toppath, *self.paths)
 
-    def save_history(self) -> None:
+    def save_history(self, state: ImportState) -> None:
         """Save the directory in the history for incremental imports."""
-        ImportState().history_add(self.paths)
+        state.history_add(self.paths)
 
     # Logical decisions.
 
@@ -491,12 +513,12 @@ class ImportTask(BaseImportTask):
         """Save progress, clean up files, and emit plugin event."""
         # Update progress.
         if session.want_resume:
-            self.save_progress()
+            self.save_progress(session.state)
         if session.config["incremental"] and not (
             # Should we skip recording to incremental list?
             self.skip and session.config["incremental_skip_later"]
         ):
-            self.save_history()
+            self.save_history(session.state)
 
         self.cleanup(
             copy=session.config["copy"].get(bool),
@@ -577,17 +599,24 @@ class ImportTask(BaseImportTask):
             "album"
         ].as_str_seq()
         dup_query = tmp_album.duplicates_query(keys)
+        albums = list(lib.albums(dup_query))
+        if not albums:
+            return []
+
+        # Fetch the paths of the items of all these albums at once.
+        album_paths: dict[int, set[util.PathBytes]] = defaultdict(set)
+        for item in lib.items(InQuery("album_id", [a.id for a in albums])):
+            album_paths[item.album_id].add(item.path)
 
         # Don't count albums with the same files as duplicates.
         task_paths = {i.path for i in self.items if i}
 
         duplicates = []
-        for album in lib.albums(dup_query):
+        for album in albums:
             # Check whether the album paths are all present in the task
             # i.e. album is being completely re-imported by the task,
             # in which case it is not a duplicate (will be replaced).
-            album_paths = {i.path for i in album.items()}
-            if not (album_paths <= task_paths):
+            if not (album_paths[album.id] <= task_paths):
                 duplicates.append(album)
 
         return duplicates
@@ -687,7 +716,7 @@ class ImportTask(BaseImportTask):
     def add(self, lib: library.Library) -> None:
         """Add the items as an album to the library and remove replaced items."""
         self.align_album_level_fields()
-        with lib.transaction():
+        with lib.bulk():
             self.record_replaced(lib)
             self.remove_replaced(lib)
 
@@ -713,8 +742,10 @@ class ImportTask(BaseImportTask):
             defaultdict()
         )
         replaced_album_ids = set()
-        for item in self.imported_items():
-            dup_items = list(lib.items(query=PathQuery("path", item.path)))
+        items = self.imported_items()
+        replaced = _items_at_paths(lib, [item.path for item in items])
+        lib._prefetch_albums(d for dups in replaced for d in dups)
+        for item, dup_items in zip(items, replaced):
             self.replaced_items[item] = dup_items
             for dup_item in dup_items:
                 if (
@@ -1013,16 +1044,16 @@ class SentinelImportTask(ImportTask):
         self.is_album = True
         self.choice_flag = None
 
-    def save_history(self) -> None:
+    def save_history(self, state: ImportState) -> None:
         pass
 
-    def save_progress(self) -> None:
+    def save_progress(self, state: ImportState) -> None:
         if not self.paths:
             # "Done" sentinel.
-            ImportState().progress_reset(self.toppath)
+            state.progress_reset(self.toppath)
         elif self.toppath:
             # "Directory progress" sentinel for singletons
-            super().save_progress()
+            super().save_progress(state)
 
     @property
     def skip(self) -> bool:
@@ -1202,6 +1233,8 @@ class ImportTaskFactory:
         self.skipped = 0  # Skipped due to incremental/resume.
         self.imported = 0  # "Real" tasks created.
         self.is_archive = ArchiveImportTask.is_archive(util.syspath(toppath))
+        # The items being read ahead of their tasks, by path.
+        self._reads: dict[util.PathBytes, Future[library.Item | None]] = {}
 
     def tasks(self) -> Iterable[ImportTask]:
         """Yield all import tasks for music found in the user-specified
@@ -1224,7 +1257,7 @@ class ImportTaskFactory:
                 return
 
         # Search for music in the directory.
-        for dirs, paths in self.paths():
+        for dirs, paths in self._read_ahead(self.paths()):
             if self.session.config["singletons"]:
                 for path in paths:
                     tasks = self._create(self.singleton(path))
@@ -1276,6 +1309,49 @@ class ImportTaskFactory:
             for dirs, paths in albums_in_dir(self.toppath):
                 yield dirs, paths
 
+    def _read_ahead(
+        self,
+        groups: Iterable[tuple[list[util.PathBytes], list[util.PathBytes]]],
+    ) -> Iterator[tuple[list[util.PathBytes], list[util.PathBytes]]]:
+        """Pass on the `(dirs, files)` pairs of `groups` while a pool of
+        threads reads the items of the next few pairs, which `read_item`
+        then returns.
+
+        The files that will be skipped are not read, and nothing is read
+        ahead unless the ``read_threads`` import option asks for several
+        threads.
+        """
+        threads = self.session.config["read_threads"].get(int)
+        if threads <= 1:
+            yield from groups
+            return
+
+        ctx = contextvars.copy_context()
+        pending: deque[tuple[list[util.PathBytes], list[util.PathBytes]]] = (
+            deque()
+        )
+        with ThreadPoolExecutor(threads) as executor:
+            for dirs, paths in groups:
+                if self.session.config["singletons"]:
+                    paths_to_read = [
+                        p
+                        for p in paths
+                        if not self.session.already_imported(self.toppath, [p])
+                    ]
+                elif self.session.already_imported(self.toppath, dirs):
+                    paths_to_read = []
+                else:
+                    paths_to_read = paths
+                for path in paths_to_read:
+                    self._reads[path] = executor.submit(
+                        ctx.copy().run, self._read_item, path
+                    )
+
+                pending.append((dirs, paths))
+                if len(pending) > threads:
+                    yield pending.popleft()
+            yield from pending
+
     def singleton(self, path: util.PathBytes) -> SingletonImportTask | None:
         """Return a `SingletonImportTask` for the music file."""
         if self.session.already_imported(self.toppath, [path]):
@@ -1358,7 +1434,11 @@ class ImportTaskFactory:
         If an item cannot be read, return `None` instead and log an
         error.
         """
+        if (read := self._reads.pop(path, None)) is not None:
+            return read.result()
+        return self._read_item(path)
 
+    def _read_item(self, path: util.PathBytes) -> library.Item | None:
         # Check if the file has an extension,
         # Add an extension if there isn't one.
         if os.path.isfile(path):
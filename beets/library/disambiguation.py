@@ -0,0 +1,168 @@
+"""An index of the groups of albums or items that share the values of
+some fields, which lets ``%aunique`` and ``%sunique`` tell whether an
+object needs disambiguating without querying the library.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from beets.dbcore.db import StreamingResults
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .library import Library
+    from .models import LibModel
+
+    Key = tuple[Any, ...]
+
+
+def find_disambiguator(
+    lib: Library, obj: LibModel, keys: Sequence[str], disam: Sequence[str]
+) -> tuple[bool, str | None]:
+    """Look up the objects that share the values of `keys` with `obj` and
+    return whether there are several of them, along with the first field
+    of `disam` whose values tell them all apart, if any.
+    """
+    query = obj.duplicates_query(list(keys))
+    ambiguous = lib._fetch(type(obj), query)
+
+    # If there's only one object matching these details, then do
+    # nothing.
+    if len(ambiguous) == 1:
+        return False, None
+
+    for disambiguator in disam:
+        # If the set of unique values is equal to the number of objects
+        # in the disambiguation set, this is sufficient disambiguation.
+        values = {o.get(disambiguator, "") for o in ambiguous}
+        if len(values) == len(ambiguous):
+            return True, disambiguator
+
+    return True, None
+
+
+class DisambiguationIndex:
+    """Count the objects of a model that share the values of `keys`.
+
+    The index reads the keys of every row of the model's table on first
+    use. The library reports each change through `update`, and the keys
+    of the changed rows are read again, together, before the next lookup.
+    Only the groups of objects that share their keys are queried, once
+    per group, to find the field of `disam` that tells them apart.
+    """
+
+    def __init__(
+        self,
+        lib: Library,
+        model_cls: type[LibModel],
+        keys: Sequence[str],
+        disam: Sequence[str],
+    ) -> None:
+        self.lib = lib
+        self.model_cls = model_cls
+        self.keys = tuple(keys)
+        self.disam = tuple(disam)
+
+        self._keys_by_id: dict[int, Key] = {}
+        self._counts: Counter[Key] = Counter()
+        # The results of `find_disambiguator` for ambiguous groups.
+        self._disambiguators: dict[Key, tuple[bool, str | None]] = {}
+        # The ids of the changed rows whose keys have not been read yet.
+        self._pending: set[int] = set()
+        # Whether the keys of all rows have been read.
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def supports(cls, model_cls: type[LibModel], keys: Sequence[str]) -> bool:
+        """Whether an index can group objects of `model_cls` by `keys`,
+        which have to be columns of the model's table.
+        """
+        return bool(keys) and all(k in model_cls._fields for k in keys)
+
+    def _read_keys(self, ids: Sequence[int] | None = None) -> None:
+        """Read the keys of the rows with the given `ids`, or of all rows."""
+        sql = f"SELECT id, {', '.join(self.keys)} FROM {self.model_cls._table}"
+        chunks: list[Sequence[int]] = [()]
+        if ids is not None:
+            chunk_size = StreamingResults.CHUNK_SIZE
+            chunks = [
+                ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)
+            ]
+
+        with self.lib.transaction() as tx:
+            for chunk in chunks:
+                rows = tx.query(
+                    f"{sql} WHERE id IN ({', '.join('?' * len(chunk))})"
+                    if chunk
+                    else sql,
+                    chunk,
+                )
+                for row in rows:
+                    # The row may have been read before it was changed.
+                    if (old := self._keys_by_id.get(row[0])) is not None:
+                        self._counts[old] -= 1
+                        self._disambiguators.pop(old, None)
+                    key = tuple(row[1:])
+                    self._keys_by_id[row[0]] = key
+                    self._counts[key] += 1
+                    self._disambiguators.pop(key, None)
+
+    def update(self, obj: LibModel) -> None:
+        """Account for a change to `obj` in the database, including its
+        removal.
+        """
+        with self._lock:
+            if (key := self._keys_by_id.pop(obj.id, None)) is not None:  # type: ignore[arg-type]
+                self._counts[key] -= 1
+                self._disambiguators.pop(key, None)
+            self._pending.add(obj.id)  # type: ignore[arg-type]
+
+    def count(self, obj: LibModel) -> int | None:
+        """Return the number of stored objects that share the values of
+        the keys with `obj`, or None if these values cannot be counted.
+        """
+        key = tuple(obj.get(k) for k in self.keys)
+        if any(not isinstance(v, (str, int, float)) for v in key):
+            return None
+
+        # Take the database lock first, like the library does when it
+        # reports a change through `update`.
+        with self.lib.transaction() as tx:
+            while True:
+                with self._lock:
+                    if tx.excludes_writers:
+                        if not self._loaded:
+                            self._read_keys()
+                            self._loaded = True
+                        if self._pending:
+                            self._read_keys(list(self._pending))
+                            self._pending.clear()
+                    if self._loaded and not self._pending:
+                        return self._counts.get(key, 0)
+
+                # In WAL mode, the rows may have changes that are not
+                # committed yet, and would be missed. Wait until they are.
+                tx.exclude_writers()
+
+    def disambiguator(self, obj: LibModel) -> tuple[bool, str | None]:
+        """Return the same as `find_disambiguator` for `obj`."""
+        key = tuple(obj.get(k) for k in self.keys)
+        count = self.count(obj)
+        if count == 1:
+            return False, None
+        if not count:
+            # No object is stored with these values, which the library
+            # may still compare differently.
+            return find_disambiguator(self.lib, obj, self.keys, self.disam)
+
+        with self.lib.transaction(), self._lock:
+            if (found := self._disambiguators.get(key)) is None:
+                found = self._disambiguators[key] = find_disambiguator(
+                    self.lib, obj, self.keys, self.disam
+                )
+            return found
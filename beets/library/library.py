@@ -1,27 +1,32 @@
 from __future__ import annotations
 
 import re
+import sqlite3
+import threading
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import platformdirs
 
 import beets
-from beets import config, context, dbcore
-from beets.dbcore.query import Query
+from beets import config, context, dbcore, logging, plugins
+from beets.dbcore.query import InQuery, Query
 from beets.dbcore.sort import NullSort
 from beets.exceptions import UserError
-from beets.util import normpath
-from beets.util.pathformats import get_path_formats
+from beets.util import normpath, par_map
+from beets.util.functemplate import get_template
+from beets.util.pathformats import PF_KEY_DEFAULT, get_path_formats
 
 from . import migrations
-from .models import Album, Item
+from .disambiguation import DisambiguationIndex, find_disambiguator
+from .exceptions import FileOperationError
+from .models import Album, DefaultTemplateFunctions, Item, TemplateFunctions
 from .queries import parse_query_parts, parse_query_string
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from beets.dbcore.sort import Sort
     from beets.util import PathLike, Replacements
@@ -31,6 +36,9 @@ if TYPE_CHECKING:
 
     LM = TypeVar("LM", bound=LibModel)
 
+# Global logger.
+log = logging.getLogger("beets")
+
 
 class Library(dbcore.Database):
     """A database of music containing songs and albums."""
@@ -80,10 +88,33 @@ class Library(dbcore.Database):
         if set_music_dir:
             context.set_music_dir(self.directory)
 
-        super().__init__(path, timeout=beets.config["timeout"].as_number())
+        search_index = None
+        if beets.config["search_index"]["enabled"].get(bool):
+            if sqlite3.sqlite_version_info < (3, 34):
+                # The trigram tokenizer was added in SQLite 3.34.
+                raise UserError("search_index requires SQLite 3.34 or later")
+            search_index = dbcore.SearchIndex(
+                beets.config["search_index"]["asciify"].get(bool)
+            )
+        super().__init__(
+            path,
+            timeout=beets.config["timeout"].as_number(),
+            search_index=search_index,
+            wal=beets.config["wal"].get(bool),
+        )
 
         self.replacements = self.get_replacements()
         self._memotable = {}
+        self._disambiguation_indexes: dict[
+            tuple[type[LibModel], tuple[str, ...], tuple[str, ...]],
+            DisambiguationIndex,
+        ] = {}
+        self._disambiguation_lock = threading.Lock()
+        self._path_format_cache: dict[
+            tuple[PathFormat, ...], tuple[list[tuple[Query, str]], str | None]
+        ] = {}
+        # The changes collected by the `bulk` block of each thread.
+        self._bulk = threading.local()
 
     @contextmanager
     def music_dir_context(self) -> Iterator[Library]:
@@ -91,6 +122,47 @@ class Library(dbcore.Database):
         with context.music_dir(self.directory):
             yield self
 
+    # Reporting changes to plugins.
+
+    @contextmanager
+    def bulk(self) -> Iterator[Library]:
+        """Make the database changes in the block in a single transaction
+        and report them together.
+
+        Instead of a `database_change` event for each changed item or
+        album, plugins get a single `database_bulk_change` event with all of
+        them when the block ends. Nested blocks are part of the outermost
+        one.
+        """
+        if getattr(self._bulk, "changes", None) is not None:
+            with self.transaction():
+                yield self
+            return
+
+        self._bulk.changes = changes = []
+        try:
+            with self.transaction():
+                yield self
+        finally:
+            self._bulk.changes = None
+            if changes:
+                plugins.send("database_bulk_change", lib=self, models=changes)
+
+    def _model_changed(self, obj: LibModel) -> None:
+        """Report a change to `obj` to plugins, or collect it for the
+        current `bulk` block.
+        """
+        with self._disambiguation_lock:
+            indexes = list(self._disambiguation_indexes.values())
+        for index in indexes:
+            if isinstance(obj, index.model_cls):
+                index.update(obj)
+
+        if (changes := getattr(self._bulk, "changes", None)) is not None:
+            changes.append(obj)
+        else:
+            plugins.send("database_change", lib=self, model=obj)
+
     # Adding objects to the database.
 
     def add(self, obj: LibModel) -> int | None:
@@ -103,6 +175,74 @@ class Library(dbcore.Database):
         self._memotable = {}
         return obj.id
 
+    def add_many(self, objs: Iterable[LibModel]) -> None:
+        """Add several :class:`Item` or :class:`Album` objects to the
+        library database, batching the writes.
+        """
+        super().add_many(objs)
+        self._memotable = {}
+
+    def store_many(
+        self, objs: Iterable[LibModel], fields: Iterable[str] | None = None
+    ) -> None:
+        """Store several :class:`Item` or :class:`Album` objects, like
+        calling their `store` methods, but batching the writes.
+
+        Albums are stored one by one, so that their items inherit their
+        changes.
+        """
+        items = []
+        with self.transaction():
+            for obj in objs:
+                if isinstance(obj, Album):
+                    obj.store(fields)
+                else:
+                    items.append(obj)
+            super().store_many(items, fields)
+
+    def try_write_many(
+        self, items: Sequence[Item], jobs: int = 1
+    ) -> list[bool]:
+        """Write the tags of several items to their files, like calling
+        their `try_write` methods, and return whether each write succeeded.
+
+        A pool of `jobs` threads saves the files, while the `write` and
+        `after_write` events are sent from the calling thread, in the order
+        of the items.
+        """
+        id3v23 = config["id3v23"].get(bool)
+        written = [False] * len(items)
+
+        prepared = []
+        for index, item in enumerate(items):
+            try:
+                path, tags = item._prepare_write(None, None)
+            except FileOperationError as exc:
+                log.error("{}", exc)
+            else:
+                prepared.append((index, item, path, tags))
+
+        def save(
+            args: tuple[int, Item, bytes, dict[str, Any]],
+        ) -> FileOperationError | None:
+            _, item, path, tags = args
+            try:
+                item._save_tags(path, tags, id3v23)
+            except FileOperationError as exc:
+                return exc
+            return None
+
+        for (index, item, path, _), exc in zip(
+            prepared, par_map(save, prepared, jobs)
+        ):
+            if exc is not None:
+                log.error("{}", exc)
+                continue
+            item._finish_write(path)
+            written[index] = True
+
+        return written
+
     def add_album(self, items: list[Item]) -> Album:
         """Create a new album consisting of a list of items.
 
@@ -123,13 +263,181 @@ class Library(dbcore.Database):
             album.add(self)
             for item in items:
                 item.album_id = album.id
-                if item.id is None:
-                    item.add(self)
-                else:
-                    item.store()
+            self.add_many(item for item in items if item.id is None)
+            self.store_many(item for item in items if item.id is not None)
 
         return album
 
+    # Path formats.
+
+    def _compile_path_formats(
+        self, path_formats: Sequence[PathFormat]
+    ) -> tuple[list[tuple[Query, str]], str | None]:
+        """Parse the queries of `path_formats` and return them along with
+        their templates, followed by the default template.
+
+        The result is cached for each list of path formats, so that the
+        queries are parsed once rather than for every item.
+        """
+        key = tuple(path_formats)
+        if (compiled := self._path_format_cache.get(key)) is None:
+            queries = []
+            default = None
+            with (
+                context.music_dir(self.directory),
+                context.search_index(self.search_index),
+            ):
+                for query_str, path_format in path_formats:
+                    if query_str != PF_KEY_DEFAULT:
+                        query, _ = parse_query_string(query_str, Item)
+                        queries.append((query, path_format))
+                    elif default is None:
+                        default = path_format
+            compiled = self._path_format_cache[key] = (queries, default)
+        return compiled
+
+    def select_path_format(
+        self, item: Item, path_formats: Sequence[PathFormat] | None = None
+    ) -> str:
+        """Return the template of the first of `path_formats` (by
+        default, the library's) whose query matches `item`, falling back
+        to the default one.
+        """
+        queries, default = self._compile_path_formats(
+            path_formats or self.path_formats
+        )
+        for query, path_format in queries:
+            if query.match(item):
+                return path_format
+
+        assert default is not None, "no default path format"
+        return default
+
+    def select_path_formats(
+        self,
+        items: Sequence[Item],
+        path_formats: Sequence[PathFormat] | None = None,
+    ) -> list[str]:
+        """Like `select_path_format`, for each of `items`.
+
+        Path format queries that the database can evaluate are run on all
+        the stored items at once instead of being matched against each
+        item. Items with unsaved changes are matched one by one.
+        """
+        queries, default = self._compile_path_formats(
+            path_formats or self.path_formats
+        )
+        selected: list[str | None] = [None] * len(items)
+        for query, path_format in queries:
+            pending = [i for i, fmt in enumerate(selected) if fmt is None]
+            if not pending:
+                break
+
+            stored = [
+                items[i].id
+                for i in pending
+                if items[i].id is not None and not items[i]._dirty
+            ]
+            matching = self._matching_ids(Item, query, stored)
+            for i in pending:
+                item = items[i]
+                if matching is None or item.id is None or item._dirty:
+                    matches = query.match(item)
+                else:
+                    matches = item.id in matching
+                if matches:
+                    selected[i] = path_format
+
+        if None in selected:
+            assert default is not None, "no default path format"
+        return [fmt or default for fmt in selected]  # type: ignore[misc]
+
+    def destinations(
+        self,
+        items: Sequence[Item],
+        relative_to_libdir: bool = False,
+        basedir: bytes | None = None,
+        path_formats: Sequence[PathFormat] | None = None,
+    ) -> list[bytes]:
+        """Return the destination of each of `items`, as computed by
+        `Item.destination` with the same arguments.
+
+        The albums of the items are fetched together, the path formats
+        are selected with `select_path_formats`, and all the templates
+        are evaluated with the same template functions.
+        """
+        if not items:
+            return []
+
+        self._prefetch_albums(items)
+        selected = self.select_path_formats(items, path_formats)
+        basedir = basedir or self.directory
+
+        default_funcs = DefaultTemplateFunctions(items[0], self)
+        funcs = TemplateFunctions(default_funcs)
+        destinations = []
+        for item, path_format in zip(items, selected):
+            default_funcs.item = item
+            template = get_template(path_format)
+            subpath = template.substitute(
+                item.template_values(template, for_path=True), funcs
+            )
+            destinations.append(
+                item._legalize_destination(subpath, relative_to_libdir, basedir)
+            )
+        return destinations
+
+    def _prefetch_albums(self, items: Iterable[Item]) -> None:
+        """Fetch the albums of the `items` that have not loaded theirs yet
+        in a few queries, rather than one query per item.
+        """
+        pending: dict[int, list[Item]] = {}
+        for item in items:
+            if item.album_id is not None and not item._has_cached_album:
+                pending.setdefault(item.album_id, []).append(item)
+
+        album_ids = list(pending)
+        chunk_size = dbcore.db.StreamingResults.CHUNK_SIZE
+        for start in range(0, len(album_ids), chunk_size):
+            chunk = album_ids[start : start + chunk_size]
+            for album in self._get_results(Album, InQuery("id", chunk)):
+                for item in pending[album.id]:
+                    item._cached_album = album
+
+    def _disambiguator(
+        self, obj: LibModel, keys: Sequence[str], disam: Sequence[str]
+    ) -> tuple[bool, str | None]:
+        """Find whether other objects share the values of `keys` with `obj`
+        and which field of `disam` tells them apart, as
+        `disambiguation.find_disambiguator` does.
+
+        Where possible, the answer comes from an index of the groups of
+        objects that share their keys, which is built on first use.
+        """
+        model_cls = type(obj)
+        if not DisambiguationIndex.supports(model_cls, keys):
+            return find_disambiguator(self, obj, keys, disam)
+
+        return self._disambiguation_index(model_cls, keys, disam).disambiguator(
+            obj
+        )
+
+    def _disambiguation_index(
+        self,
+        model_cls: type[LibModel],
+        keys: Sequence[str],
+        disam: Sequence[str],
+    ) -> DisambiguationIndex:
+        """Return the index of `model_cls` objects grouped by `keys`,
+        building it on first use.
+        """
+        spec = (model_cls, tuple(keys), tuple(disam))
+        with self._disambiguation_lock:
+            if (index := self._disambiguation_indexes.get(spec)) is None:
+                index = DisambiguationIndex(self, *spec)
+                self._disambiguation_indexes[spec] = index
+        return index
+
     # Querying.
 
     def _fetch(
@@ -137,19 +445,25 @@ class Library(dbcore.Database):
         model_cls: type[LM],
         query: str | Sequence[str] | Query | None = None,
         sort: Sort | None = None,
+        stream: bool = False,
     ) -> dbcore.Results[LM]:
         """Parse a query and fetch.
 
         If an order specification is present in the query string
-        the `sort` argument is ignored.
+        the `sort` argument is ignored. See `Database._get_results` for
+        `stream`.
         """
         # Parse the query, if necessary.
         parsed_sort = None
         parsed_query = None
         try:
-            # Query parsing needs the library root, but keeping it scoped here
-            # avoids leaking one Library's directory into another's work.
-            with context.music_dir(self.directory):
+            # Query parsing needs the library root and search index, but
+            # keeping them scoped here avoids leaking one Library's settings
+            # into another's work.
+            with (
+                context.music_dir(self.directory),
+                context.search_index(self.search_index),
+            ):
                 if isinstance(query, Query):
                     parsed_query = query
                 if isinstance(query, str):
@@ -168,7 +482,7 @@ class Library(dbcore.Database):
         if parsed_sort and not isinstance(parsed_sort, NullSort):
             sort = parsed_sort
 
-        return super()._get_results(model_cls, parsed_query, sort)
+        return super()._get_results(model_cls, parsed_query, sort, stream)
 
     @staticmethod
     def get_default_album_sort() -> Sort:
@@ -188,17 +502,37 @@ class Library(dbcore.Database):
         self,
         query: str | Sequence[str] | Query | None = None,
         sort: Sort | None = None,
+        stream: bool = False,
     ) -> dbcore.Results[Album]:
-        """Get :class:`Album` objects matching the query."""
-        return self._fetch(Album, query, sort or self.get_default_album_sort())
+        """Get :class:`Album` objects matching the query.
+
+        If `stream` is true, rows are read from the database while the
+        results are consumed.
+        """
+        return self._fetch(
+            Album, query, sort or self.get_default_album_sort(), stream
+        )
 
     def items(
         self,
         query: str | Sequence[str] | Query | None = None,
         sort: Sort | None = None,
+        stream: bool = False,
+        with_albums: bool = False,
     ) -> dbcore.Results[Item]:
-        """Get :class:`Item` objects matching the query."""
-        return self._fetch(Item, query, sort or self.get_default_item_sort())
+        """Get :class:`Item` objects matching the query.
+
+        If `stream` is true, rows are read from the database while the
+        results are consumed. If `with_albums` is true, the albums of the
+        items are fetched together for each chunk of items, rather than
+        one by one when each item first needs its album.
+        """
+        results = self._fetch(
+            Item, query, sort or self.get_default_item_sort(), stream
+        )
+        if with_albums:
+            results.prefetch(self._prefetch_albums)
+        return results
 
     # Convenience accessors.
     def get_item(self, id_: int) -> Item | None:
@@ -3,16 +3,19 @@ from __future__ import annotations
 import os
 import string
 import time
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from functools import cached_property
+from inspect import getattr_static
 from pathlib import Path
+from types import MethodType
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from mediafile import MediaFile, UnreadableFileError
 from typing_extensions import Self
 
 import beets
-from beets import dbcore, logging, plugins, util
+from beets import context, dbcore, logging, plugins, util
 from beets.dbcore import types
 from beets.dbcore.db import FormattedMapping
 from beets.dbcore.pathutils import normalize_path_for_db
@@ -26,18 +29,17 @@ from beets.util import (
     syspath,
 )
 from beets.util.deprecation import maybe_replace_legacy_field
-from beets.util.pathformats import PF_KEY_DEFAULT
 
 from .exceptions import FileOperationError, ReadError, WriteError
 from .fields import TYPE_BY_FIELD
-from .queries import parse_query_string
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping
+    from collections.abc import Iterable, Iterator, KeysView
 
     from beets.dbcore import Results
     from beets.dbcore.query import FieldQuery, FieldQueryType
     from beets.dbcore.sort import FieldSort
+    from beets.util.functemplate import Template
     from beets.util.pathformats import PathFormat
 
     from .library import Library
@@ -83,17 +85,7 @@ class LibModel(dbcore.Model["Library"]):
         return Path(os.fsdecode(self.path))
 
     def _template_funcs(self) -> Mapping[str, Callable[[str], str]]:
-        funcs = DefaultTemplateFunctions(self, self._db).functions()
-        funcs.update(plugins.template_funcs())
-        return funcs
-
-    def store(self, fields: Iterable[str] | None = None) -> None:
-        super().store(fields)
-        plugins.send("database_change", lib=self.db, model=self)
-
-    def remove(self) -> None:
-        super().remove()
-        plugins.send("database_change", lib=self.db, model=self)
+        return TemplateFunctions(DefaultTemplateFunctions(self, self._db))
 
     def add(self, lib: Library | None = None) -> None:
         # super().add() calls self.store(), which sends `database_change`,
@@ -116,6 +108,16 @@ class LibModel(dbcore.Model["Library"]):
     @classmethod
     def field_query(
         cls, field: str, pattern: str, query_cls: FieldQueryType
+    ) -> dbcore.Query:
+        """Get a query for the given field on this model."""
+        query = cls._field_query(field, pattern, query_cls)
+        if field in cls._search_fields:
+            return cls._search_index_query(query, pattern, query_cls, [field])
+        return query
+
+    @classmethod
+    def _field_query(
+        cls, field: str, pattern: str, query_cls: FieldQueryType
     ) -> FieldQuery:
         """Get a `FieldQuery` for the given field on this model."""
         field = maybe_replace_legacy_field(field, cls is Album)
@@ -138,15 +140,49 @@ class LibModel(dbcore.Model["Library"]):
             # Using an explicit table name resolves this.
             field = f"{cls._table}.{field}"
 
-        return query_cls(field, pattern, fast)
+        query = query_cls(field, pattern, fast)
+        if (
+            not fast
+            and query_cls.flex_col_clause
+            and (field_sql := cls.flex_field_sql(field))
+        ):
+            # Evaluate the query on the flexible attribute in the database
+            # instead of filtering every object in Python.
+            if issubclass(query_cls, dbcore.query.StringFieldQuery):
+                # String queries see missing values as empty strings.
+                field_sql = f"COALESCE({field_sql}, '')"
+            query.field_sql = field_sql
+            query.fast = True
+
+        return query
 
     @classmethod
     def any_field_query(
         cls, pattern: str, query_cls: FieldQueryType
-    ) -> dbcore.OrQuery:
-        return dbcore.OrQuery(
-            [cls.field_query(f, pattern, query_cls) for f in cls._search_fields]
+    ) -> dbcore.Query:
+        query = dbcore.OrQuery(
+            [
+                cls._field_query(f, pattern, query_cls)
+                for f in cls._search_fields
+            ]
         )
+        return cls._search_index_query(query, pattern, query_cls)
+
+    @classmethod
+    def _search_index_query(
+        cls,
+        query: dbcore.Query,
+        pattern: str,
+        query_cls: FieldQueryType,
+        fields: list[str] | None = None,
+    ) -> dbcore.Query:
+        """Use the library's full-text search index, if there is one, to
+        find the candidates for `query` on `fields`.
+        """
+        index = context.get_search_index()
+        if index and index.supports(query_cls):
+            return index.query(cls, query, pattern, fields)
+        return query
 
     @classmethod
     def any_writable_media_field_query(
@@ -154,7 +190,7 @@ class LibModel(dbcore.Model["Library"]):
     ) -> dbcore.OrQuery:
         fields = cls.writable_media_fields
         return dbcore.OrQuery(
-            [cls.field_query(f, pattern, query_cls) for f in fields]
+            [cls._field_query(f, pattern, query_cls) for f in fields]
         )
 
     def duplicates_query(self, fields: list[str]) -> dbcore.AndQuery:
@@ -175,6 +211,12 @@ class FormattedItemMapping(dbcore.db.FormattedMapping):
 
     ALL_KEYS = "*"
 
+    # The keys whose values are used when those of the others are empty.
+    FALLBACK_KEYS: ClassVar[dict[str, str]] = {
+        "artist": "albumartist",
+        "albumartist": "artist",
+    }
+
     def __init__(
         self,
         item: Item,
@@ -201,17 +243,16 @@ class FormattedItemMapping(dbcore.db.FormattedMapping):
     def album_keys(self) -> list[str]:
         album_keys = []
         if self.album:
+            for key in self.album.keys(computed=True):
+                if key in Album.item_keys or key not in self.item._fields:
+                    album_keys.append(key)
             if isinstance(self.included_keys, list):
-                album_keys = self.included_keys
-            else:
-                # Performance note: this triggers a database query.
-                for key in self.album.keys(computed=True):
-                    if key in Album.item_keys or key not in self.item._fields:
-                        album_keys.append(key)
+                album_keys = [k for k in album_keys if k in self.included_keys]
         return album_keys
 
-    @property
+    @cached_property
     def album(self) -> Album | None:
+        # Performance note: this triggers a database query.
         return self.item._cached_album
 
     def _get(self, key: str) -> str:
@@ -219,7 +260,7 @@ class FormattedItemMapping(dbcore.db.FormattedMapping):
 
         Raise a KeyError for invalid keys.
         """
-        if self.album and self.for_path and key in self.album_keys:
+        if self.for_path and self.album and key in self.album_keys:
             return self._get_formatted(self.album, key)
         if key in self.model_keys:
             return self._get_formatted(self.model, key)
@@ -239,10 +280,8 @@ class FormattedItemMapping(dbcore.db.FormattedMapping):
         # This is helpful in path formats when the album artist is unset
         # on as-is imports.
         try:
-            if key == "artist" and not value:
-                return self._get("albumartist")
-            if key == "albumartist" and not value:
-                return self._get("artist")
+            if not value and key in self.FALLBACK_KEYS:
+                return self._get(self.FALLBACK_KEYS[key])
         except KeyError:
             pass
 
@@ -487,10 +526,17 @@ class Album(LibModel):
 
         # Move items.
         items = list(self.items())
+        destinations = self.db.destinations(items, basedir=basedir)
         moved_item_dir = None
-        for item in items:
+        for item, dest in zip(items, destinations):
             old_path = item.path
-            item.move(operation, basedir=basedir, with_album=False, store=store)
+            item.move(
+                operation,
+                basedir=basedir,
+                with_album=False,
+                store=store,
+                dest=dest,
+            )
             if moved_item_dir is None and item.path != old_path:
                 moved_item_dir = os.path.dirname(item.path)
 
@@ -783,6 +829,11 @@ class Item(LibModel):
     def _cached_album(self, album: Album | None) -> None:
         self.__album = album
 
+    @property
+    def _has_cached_album(self) -> bool:
+        """Whether the item has already loaded its album."""
+        return self.__album is not None
+
     @classmethod
     def _getters(cls) -> dict[str, Callable[[Self], object]]:
         return {
@@ -792,6 +843,21 @@ class Item(LibModel):
             "has_cover_art": Item.has_cover_art,
         }
 
+    @classmethod
+    def flex_field_sql(cls, key: str) -> str | None:
+        """Like `Model.flex_field_sql`, but fall back to the album's
+        attribute for items that do not have it, as `get` does.
+        """
+        if key in cls.other_db_fields or key in Album._getters():
+            # Album columns and computed fields cannot be looked up in the
+            # attribute tables.
+            return None
+        if not (item_sql := super().flex_field_sql(key)):
+            return None
+
+        album_sql = Album._flex_value_sql(key, f"{cls._table}.album_id")
+        return f"COALESCE({item_sql}, {album_sql})"
+
     def duplicates_query(self, fields: list[str]) -> dbcore.AndQuery:
         """Return a query for entities with same values in the given fields."""
         return super().duplicates_query(fields) & dbcore.query.NoneQuery(
@@ -858,6 +924,28 @@ class Item(LibModel):
 
         return dict.fromkeys(keys).keys()
 
+    def template_values(
+        self, template: Template, for_path: bool = False
+    ) -> FormattedMapping:
+        """Get a mapping of the formatted values on this item and its
+        album that `template` refers to.
+
+        The album is only loaded if the item does not have all the fields
+        that `template` refers to, or if `for_path` is true.
+        """
+        fallbacks = FormattedItemMapping.FALLBACK_KEYS
+        varnames = template.varnames.union(
+            fallbacks[k] for k in template.varnames if k in fallbacks
+        )
+        keys = self.keys(computed=True, with_album=False)
+        included = [k for k in varnames if k in keys]
+        if len(included) < len(varnames) and self._cached_album:
+            album_keys = self._cached_album.keys(computed=True)
+            included.extend(
+                k for k in varnames if k not in keys and k in album_keys
+            )
+        return self.formatted(included, for_path)
+
     def get(
         self, key: str, default: Any = None, with_album: bool = True
     ) -> Any:
@@ -951,14 +1039,24 @@ class Item(LibModel):
 
         Can raise either a `ReadError` or a `WriteError`.
         """
+        if id3v23 is None:
+            id3v23 = beets.config["id3v23"].get(bool)
+
+        path, item_tags = self._prepare_write(path, tags)
+        self._save_tags(path, item_tags, id3v23)
+        self._finish_write(path)
+
+    def _prepare_write(
+        self, path: bytes | None, tags: Mapping[str, Any] | None
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Return the path to write and the tags to write to it, after
+        letting plugins change them with the `write` event.
+        """
         if path is None:
             path = self.path
         else:
             path = normpath(path)
 
-        if id3v23 is None:
-            id3v23 = beets.config["id3v23"].get(bool)
-
         # Get the data to write to the file.
         item_tags = dict(self)
         item_tags = {
@@ -967,7 +1065,16 @@ class Item(LibModel):
         if tags is not None:
             item_tags.update(tags)
         plugins.send("write", item=self, path=path, tags=item_tags)
+        return path, item_tags
+
+    def _save_tags(
+        self, path: bytes, item_tags: Mapping[str, Any], id3v23: bool
+    ) -> None:
+        """Save `item_tags` to the media file at `path`.
 
+        This only touches the file, so it may run outside of the main
+        thread.
+        """
         # Open the file.
         try:
             mediafile = MediaFile(syspath(path), id3v23=id3v23)
@@ -981,6 +1088,10 @@ class Item(LibModel):
         except UnreadableFileError as exc:
             raise WriteError(self.path, exc)
 
+    def _finish_write(self, path: bytes) -> None:
+        """Update the mtime after the file at `path` has been written and
+        send the `after_write` event.
+        """
         # The file has a new mtime.
         if path == self.path:
             self.mtime = self.current_mtime()
@@ -1005,7 +1116,11 @@ class Item(LibModel):
             return False
 
     def try_sync(
-        self, write: bool, move: bool, with_album: bool = True
+        self,
+        write: bool,
+        move: bool,
+        with_album: bool = True,
+        store: bool = True,
     ) -> None:
         """Synchronize the item with the database and, possibly, update its
         tags on disk and its path (by moving the file).
@@ -1016,7 +1131,9 @@ class Item(LibModel):
         library's directory (if any).
 
         Similar to calling :meth:`write`, :meth:`move`, and :meth:`store`
-        (conditionally).
+        (conditionally). If `store` is `False`, the item is only stored if
+        it is moved, and it will have to be stored after invoking this
+        method.
         """
         if write:
             self.try_write()
@@ -1025,7 +1142,8 @@ class Item(LibModel):
             if self._db and self._db.directory in util.ancestry(self.path):
                 log.debug("moving {.filepath} to synchronize path", self)
                 self.move(with_album=with_album)
-        self.store()
+        if store:
+            self.store()
 
     # Files themselves.
 
@@ -1149,6 +1267,7 @@ class Item(LibModel):
         basedir: bytes | None = None,
         with_album: bool = True,
         store: bool = True,
+        dest: bytes | None = None,
     ) -> None:
         """Move the item to its designated location within the library
         directory (provided by destination()).
@@ -1170,8 +1289,11 @@ class Item(LibModel):
         as a side effect.
         If `store` is `False` however, the item won't be stored and it will
         have to be manually stored after invoking this method.
+
+        `dest` is the item's destination, if it has already been computed.
         """
-        dest = self.destination(basedir=basedir)
+        if dest is None:
+            dest = self.destination(basedir=basedir)
 
         # If the source file is missing, skip the move.
         if not self.filepath.exists():
@@ -1221,6 +1343,7 @@ class Item(LibModel):
         relative_to_libdir: bool = False,
         basedir: bytes | None = None,
         path_formats: list[PathFormat] | None = None,
+        path_format: str | None = None,
     ) -> bytes:
         """Return the path in the library directory designated for the item
         (i.e., where the file ought to be).
@@ -1228,29 +1351,24 @@ class Item(LibModel):
         The path is returned as a bytestring. ``basedir`` can override the
         library's base directory for the destination. If ``relative_to_libdir``
         is true, returns just the fragment of the path underneath the library
-        base directory.
+        base directory. ``path_format`` is the template to use if it has
+        already been selected from ``path_formats``, for example by
+        :meth:`Library.select_path_formats`.
         """
         basedir = basedir or self.db.directory
-        path_formats = path_formats or self.db.path_formats
+        if path_format is None:
+            path_format = self.db.select_path_format(self, path_formats)
 
-        for query_str, path_format in path_formats:
-            if query_str == PF_KEY_DEFAULT:
-                continue
-            query, _ = parse_query_string(query_str, type(self))
-            if query.match(self):
-                # The query matches the item! Use the corresponding path
-                # format.
-                break
-        else:
-            # No query matched; fall back to default.
-            for query_str, path_format in path_formats:
-                if query_str == PF_KEY_DEFAULT:
-                    break
-            else:
-                assert False, "no default path format"
         # Evaluate the selected template.
         subpath = self.evaluate_template(path_format, for_path=True)
+        return self._legalize_destination(subpath, relative_to_libdir, basedir)
 
+    def _legalize_destination(
+        self, subpath: str, relative_to_libdir: bool, basedir: bytes
+    ) -> bytes:
+        """Turn the evaluated path format `subpath` into the item's
+        destination, as returned by `destination`.
+        """
         if beets.config["asciify_paths"]:
             subpath = util.asciify_path(subpath)
 
@@ -1293,6 +1411,15 @@ class DefaultTemplateFunctions:
     """
 
     _prefix = "tmpl_"
+    # The template functions, the plugin functions they include and the
+    # names of the methods among them, as returned by `table`.
+    _table: ClassVar[
+        tuple[
+            Mapping[str, Callable[..., str]] | None,
+            dict[str, Callable[..., str]],
+            frozenset[str],
+        ]
+    ] = (None, {}, frozenset())
 
     @cached_classproperty
     def _func_names(cls) -> list[str]:
@@ -1320,6 +1447,33 @@ class DefaultTemplateFunctions:
             out[key[len(self._prefix) :]] = getattr(self, key)
         return out
 
+    @classmethod
+    def table(cls) -> tuple[dict[str, Callable[..., str]], frozenset[str]]:
+        """Return all the functions available to templates, along with the
+        names of those that are methods of this class, which still have to
+        be bound to an instance.
+
+        Plugin functions take precedence over the default ones. The table
+        is built again only when the plugin functions change.
+        """
+        plugin_funcs = plugins.template_funcs()
+        merged_from, table, methods = cls._table
+        if merged_from is not plugin_funcs:
+            table = {}
+            for key in cls._func_names:
+                table[key[len(cls._prefix) :]] = getattr(cls, key)
+            methods = frozenset(
+                name
+                for name in table
+                if name not in plugin_funcs
+                and not isinstance(
+                    getattr_static(cls, f"{cls._prefix}{name}"), staticmethod
+                )
+            )
+            table.update(plugin_funcs)
+            cls._table = plugin_funcs, table, methods
+        return table, methods
+
     @staticmethod
     def tmpl_lower(s: str) -> str:
         """Convert a string to lower case."""
@@ -1408,7 +1562,12 @@ class DefaultTemplateFunctions:
         if memoval is not None:
             return memoval
 
-        album: Album = self.lib.get_album(album_id)  # type: ignore[assignment]
+        # Reuse the item's album if it has been loaded already.
+        album: Album
+        if isinstance(self.item, Item) and self.item._has_cached_album:
+            album = self.item._cached_album  # type: ignore[assignment]
+        else:
+            album = self.lib.get_album(album_id)  # type: ignore[assignment]
 
         return self._tmpl_unique(
             "aunique",
@@ -1530,29 +1689,16 @@ class DefaultTemplateFunctions:
             bracket_l = ""
             bracket_r = ""
 
-        # Find matching items to disambiguate with.
-        query = db_item.duplicates_query(keys_list)
-        ambigous_items = (
-            lib.items(query) if isinstance(db_item, Item) else lib.albums(query)
+        # Find the first disambiguator that distinguishes the items that
+        # match these details.
+        ambiguous, disambiguator = lib._disambiguator(
+            db_item, keys_list, disam_list
         )
-
-        # If there's only one item to matching these details, then do
-        # nothing.
-        if len(ambigous_items) == 1:
+        if not ambiguous:
             lib._memotable[memokey] = ""
             return ""
 
-        # Find the first disambiguator that distinguishes the items.
-        for disambiguator in disam_list:
-            # Get the value for each item for the current field.
-            disam_values = {s.get(disambiguator, "") for s in ambigous_items}
-
-            # If the set of unique values is equal to the number of
-            # items in the disambiguation set, we're done -- this is
-            # sufficient disambiguation.
-            if len(disam_values) == len(ambigous_items):
-                break
-        else:
+        if disambiguator is None:
             # No disambiguator distinguished all fields.
             res = f" {bracket_l}{item_id}{bracket_r}"
             lib._memotable[memokey] = res
@@ -1609,3 +1755,32 @@ class DefaultTemplateFunctions:
         if field in self.item:
             return trueval if trueval else self.item.formatted().get(field)
         return falseval
+
+
+class TemplateFunctions(Mapping[str, Callable[..., str]]):
+    """The functions available to a template evaluated for the object of
+    `context`.
+
+    All evaluations share the table of functions from
+    `DefaultTemplateFunctions.table`. The methods of `context` are only
+    bound when a template calls them.
+    """
+
+    def __init__(self, context: DefaultTemplateFunctions) -> None:
+        self.context = context
+        self._table, self._methods = context.table()
+
+    def __getitem__(self, name: str) -> Callable[..., str]:
+        func = self._table[name]
+        if name in self._methods:
+            return MethodType(func, self.context)
+        return func
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import abc
+import hashlib
 import inspect
+import json
+import os
 import re
 import sys
+import tempfile
+import threading
 from collections import defaultdict
+from contextlib import suppress
 from functools import cached_property, wraps
 from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, overload
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, TypeVar, overload
 
 import mediafile
 from typing_extensions import Never, ParamSpec, Unpack
@@ -384,6 +391,12 @@ class BeetsPlugin(metaclass=BeetsPluginMeta):
         func: Callable[[Unpack[events.DatabaseChangeEventArgs]], None],
     ) -> None: ...
     @overload
+    def register_listener(
+        self,
+        event: events.DatabaseBulkChangeEventType,
+        func: Callable[[Unpack[events.DatabaseBulkChangeEventArgs]], None],
+    ) -> None: ...
+    @overload
     def register_listener(
         self,
         event: events.ImportBeginEventType,
@@ -545,25 +558,270 @@ def _get_plugin(name: str) -> BeetsPlugin | None:
 _instances: list[BeetsPlugin] = []
 
 
+class CommandManifest(TypedDict):
+    name: str
+    help: str
+    aliases: list[str]
+    hide: bool
+
+
+class PluginManifest(TypedDict):
+    """What a plugin was found to provide when it was last imported."""
+
+    key: str
+    #: Whether the plugin only provides commands and event listeners, so
+    #: that it can be imported when one of them is used.
+    lazy: bool
+    commands: list[CommandManifest]
+    events: list[str]
+
+
+class DeferredPlugin:
+    """A configured plugin whose module has not been imported yet,
+    because its manifest says it only provides commands and event
+    listeners. It is imported when one of them is used.
+    """
+
+    def __init__(self, name: str, manifest: PluginManifest) -> None:
+        self.name = name
+        self.manifest = manifest
+        self._plugin: BeetsPlugin | None = None
+        self._loaded = False
+
+    def load(self) -> BeetsPlugin | None:
+        """Import the plugin and add it to the loaded ones, unless that
+        has happened already.
+        """
+        with _deferred_lock:
+            if not self._loaded:
+                log.debug("Loading deferred plugin: {}", self.name)
+                if plugin := _get_plugin(self.name):
+                    # Keep the plugins in the configured order. Its event
+                    # listeners still run after those of the plugins
+                    # loaded before it.
+                    position = _positions.get(self.name, len(_positions))
+                    index = next(
+                        (
+                            i
+                            for i, p in enumerate(_instances)
+                            if _positions.get(p.name, -1) > position
+                        ),
+                        len(_instances),
+                    )
+                    _instances.insert(index, plugin)
+                self._plugin = plugin
+                self._loaded = True
+                if self in _deferred:
+                    _deferred.remove(self)
+        return self._plugin
+
+    def commands(self) -> list[Subcommand]:
+        """Return stand-ins for the commands of the plugin, which import
+        it when they are used.
+        """
+        from beets.ui import DeferredSubcommand
+
+        return [
+            DeferredSubcommand(self, **command)
+            for command in self.manifest["commands"]
+        ]
+
+
+# The plugins whose import is deferred until they are used.
+_deferred: list[DeferredPlugin] = []
+_deferred_lock = threading.RLock()
+# The position of each plugin in the configuration.
+_positions: dict[str, int] = {}
+
+
+def _manifest_key(name: str) -> str | None:
+    """Return a key that changes whenever the module or the
+    configuration of the plugin `name` does, or None if its module
+    cannot be found without importing it.
+    """
+    try:
+        spec = find_spec(f"{PLUGIN_NAMESPACE}.{name}")
+        origin = spec.origin if spec else None
+        if origin is None:
+            return None
+        state = (
+            beets.__version__,
+            origin,
+            os.stat(origin).st_mtime_ns,
+            beets.config[name].flatten(),
+        )
+    except Exception:
+        return None
+    return hashlib.sha256(repr(state).encode()).hexdigest()
+
+
+def _plugin_manifest(
+    plugin: BeetsPlugin,
+    key: str,
+    listeners: dict[events.EventType, int],
+    media_fields: int,
+) -> PluginManifest:
+    """Describe what `plugin` provides, given the number of listeners
+    each event had and the number of media fields before it was
+    instantiated.
+    """
+    from beets.library import Item
+
+    new_listeners = {
+        event: funcs[listeners.get(event, 0) :]
+        for event, funcs in BeetsPlugin._raw_listeners.items()
+    }
+    # Every plugin checks its configuration when plugins are loaded, which
+    # only does anything for metadata sources. These are never deferred.
+    verifies_config = all(
+        getattr(func, "__func__", None) is BeetsPlugin._verify_config
+        for func in new_listeners.pop("pluginload", [])
+    )
+    events = sorted(event for event, funcs in new_listeners.items() if funcs)
+    lazy = (
+        verifies_config
+        and not hasattr(plugin, "data_source")
+        and not plugin.template_funcs
+        and not plugin.template_fields
+        and not plugin.album_template_fields
+        and not plugin.early_import_stages
+        and not plugin.import_stages
+        and not plugin.queries()
+        and not any(
+            getattr(plugin, attr, None)
+            for attr in (
+                "item_types",
+                "album_types",
+                "item_queries",
+                "album_queries",
+            )
+        )
+        and len(Item._media_fields) == media_fields
+    )
+    commands: list[CommandManifest] = []
+    if lazy:
+        commands = [
+            {
+                "name": command.name,
+                "help": command.help,
+                "aliases": list(command.aliases),
+                "hide": command.hide,
+            }
+            for command in plugin.commands()
+        ]
+    return {"key": key, "lazy": lazy, "commands": commands, "events": events}
+
+
+def _read_manifests(path: str) -> dict[str, PluginManifest]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        log.debug("plugin manifest could not be read: {}", exc)
+        return {}
+
+
+def _write_manifests(path: str, manifests: dict[str, PluginManifest]) -> None:
+    # Concurrent runs each write their own temporary file.
+    directory, name = os.path.split(path)
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            prefix=f".{name}.",
+            suffix=".tmp",
+            dir=directory,
+            delete=False,
+        ) as f:
+            tmp_path = f.name
+            json.dump(manifests, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as exc:
+        log.debug("plugin manifest could not be written: {}", exc)
+        if tmp_path is not None:
+            with suppress(OSError):
+                os.remove(tmp_path)
+
+
 def load_plugins() -> None:
     """Initialize the plugin system by loading all configured plugins.
 
     Performs one-time plugin discovery and instantiation, storing loaded plugin
     instances globally. Emits a pluginload event after successful initialization
     to notify other components.
+
+    With the ``lazy_plugins`` option, a manifest of what each plugin
+    provides is kept in the configuration directory, and plugins that
+    only provide commands and event listeners are deferred: they are
+    imported when one of their commands is run or one of their events is
+    sent.
     """
-    if not _instances:
+    if not _instances and not _deferred:
+        from beets.library import Item
+
         names = get_plugin_names()
         log.debug("Loading plugins: {}", ", ".join(sorted(names)))
-        _instances.extend(filter(None, map(_get_plugin, names)))
+        _positions.clear()
+        _positions.update((name, i) for i, name in enumerate(names))
+
+        manifest_path = None
+        manifests: dict[str, PluginManifest] = {}
+        if beets.config["lazy_plugins"].get(bool):
+            manifest_path = os.path.join(
+                beets.config.config_dir(), "plugins.cache"
+            )
+            manifests = _read_manifests(manifest_path)
+        changed = False
+
+        for name in names:
+            key = _manifest_key(name) if manifest_path else None
+            manifest = manifests.get(name)
+            if key and manifest and manifest["key"] == key and manifest["lazy"]:
+                _deferred.append(DeferredPlugin(name, manifest))
+                continue
+
+            listeners = {
+                event: len(funcs)
+                for event, funcs in BeetsPlugin._raw_listeners.items()
+            }
+            media_fields = len(Item._media_fields)
+            if plugin := _get_plugin(name):
+                _instances.append(plugin)
+                if key:
+                    manifest = _plugin_manifest(
+                        plugin, key, listeners, media_fields
+                    )
+                    changed |= manifests.get(name) != manifest
+                    manifests[name] = manifest
+
+        if manifest_path and changed:
+            _write_manifests(manifest_path, manifests)
+        if _deferred:
+            log.debug(
+                "Deferred plugins: {}", ", ".join(d.name for d in _deferred)
+            )
 
         send("pluginload")
 
 
+def load_deferred_plugins() -> None:
+    """Import all the plugins whose import is deferred, for instance to
+    add their default configuration.
+    """
+    for deferred in list(_deferred):
+        deferred.load()
+
+
 def find_plugins() -> Iterable[BeetsPlugin]:
     return _instances
 
 
+def plugin_names() -> list[str]:
+    """Return the names of the loaded and the deferred plugins."""
+    return [p.name for p in _instances] + [d.name for d in _deferred]
+
+
 # Communication with plugins.
 
 
@@ -572,6 +830,8 @@ def commands() -> list[Subcommand]:
     out: list[Subcommand] = []
     for plugin in find_plugins():
         out += plugin.commands()
+    for deferred in list(_deferred):
+        out += deferred.commands()
     return out
 
 
@@ -645,13 +905,26 @@ def notify_info_yielded(
     return decorator
 
 
+# The template functions declared by the plugins they were merged from.
+_template_funcs: tuple[tuple[BeetsPlugin, ...], TFuncMap[str]] = ((), {})
+
+
 def template_funcs() -> TFuncMap[str]:
     """Get all the template functions declared by plugins as a
     dictionary.
+
+    The dictionary is only merged again when the loaded plugins change,
+    so it must not be modified.
     """
-    funcs: TFuncMap[str] = {}
-    for plugin in find_plugins():
-        funcs.update(plugin.template_funcs)
+    global _template_funcs
+
+    instances = tuple(find_plugins())
+    merged_from, funcs = _template_funcs
+    if merged_from != instances:
+        funcs = {}
+        for plugin in instances:
+            funcs.update(plugin.template_funcs)
+        _template_funcs = instances, funcs
     return funcs
 
 
@@ -782,6 +1055,11 @@ def send(
     **arguments: Unpack[events.DatabaseChangeEventArgs],
 ) -> list[Never]: ...
 @overload
+def send(
+    event: events.DatabaseBulkChangeEventType,
+    **arguments: Unpack[events.DatabaseBulkChangeEventArgs],
+) -> list[Never]: ...
+@overload
 def send(
     event: events.ImportBeginEventType,
     **arguments: Unpack[events.ImportBeginEventArgs],
@@ -820,6 +1098,9 @@ def send(event: events.EventType, **arguments: Any) -> list[Any]:
     Return a list of non-None values returned from the handlers.
     """
     log.debug("Sending event: {}", event)
+    for deferred in list(_deferred):
+        if event in deferred.manifest["events"]:
+            deferred.load()
     return [
         r
         for handler in BeetsPlugin.listeners[event]
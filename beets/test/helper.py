@@ -116,6 +116,7 @@ class ConfigMixin:
         config.read(user=False, defaults=True)
 
         config["plugins"] = []
+        config["lazy_plugins"] = False
         config["verbose"] = 2
         config["ui"]["color"] = False
         config["threaded"] = False
@@ -478,6 +479,7 @@ class PluginMixin(ConfigMixin):
         beets.plugins.BeetsPlugin._raw_listeners.clear()
         self.config["plugins"] = []
         beets.plugins._instances.clear()
+        beets.plugins._deferred.clear()
 
     @contextmanager
     def configure_plugin(self, config: Any) -> Iterator[None]:
@@ -13,7 +13,7 @@ import sqlite3
 import sys
 import textwrap
 import traceback
-from functools import cache
+from functools import cache, cached_property
 from typing import TYPE_CHECKING, Any
 
 import confuse
@@ -22,13 +22,13 @@ from beets import config, library, logging, plugins, util
 from beets.dbcore import db
 from beets.dbcore import query as db_query
 from beets.exceptions import UserError
-from beets.util import as_string
+from beets.util import as_string, functemplate
 from beets.util.color import colorize
 from beets.util.deprecation import deprecate_for_maintainers
 from beets.util.diff import get_model_changes
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
 
 # On Windows platforms, use colorama to support "ANSI" terminal colors.
@@ -618,6 +618,59 @@ class Subcommand:
         )
 
 
+class DeferredSubcommand(Subcommand):
+    """A subcommand of a plugin that has not been imported yet. The
+    plugin is imported when the subcommand's options are needed or it is
+    run.
+    """
+
+    def __init__(
+        self,
+        plugin: plugins.DeferredPlugin,
+        name: str,
+        help: str = "",  # noqa: A002
+        aliases: Sequence[str] = (),
+        hide: bool = False,
+    ) -> None:
+        self.name = name
+        self.aliases = aliases
+        self.help = help
+        self.hide = hide
+        self._root_parser = None
+        self._plugin = plugin
+
+    @cached_property
+    def command(self) -> Subcommand:
+        """The subcommand of the imported plugin."""
+        plugin = self._plugin.load()
+        for command in plugin.commands() if plugin else ():
+            if command.name == self.name:
+                if self._root_parser:
+                    command.root_parser = self._root_parser
+                return command
+        raise UserError(
+            f"plugin {self._plugin.name} does not provide command '{self.name}'"
+        )
+
+    @property
+    def parser(self):
+        return self.command.parser
+
+    @property
+    def func(self):
+        return self.command.func
+
+    @property
+    def root_parser(self):
+        return self._root_parser
+
+    @root_parser.setter
+    def root_parser(self, root_parser):
+        self._root_parser = root_parser
+        if "command" in self.__dict__:
+            self.command.root_parser = root_parser
+
+
 class SubcommandsOptionParser(CommonOptionsParser):
     """A variant of OptionParser that parses subcommands and their
     arguments.
@@ -755,6 +808,7 @@ def _setup() -> tuple[list[Subcommand], library.Library]:
     Returns a list of subcommands, a list of plugins, and a library instance.
     """
 
+    _configure_template_cache()
     plugins.load_plugins()
 
     # Get the default subcommands.
@@ -769,6 +823,18 @@ def _setup() -> tuple[list[Subcommand], library.Library]:
     return subcommands, lib
 
 
+def _configure_template_cache() -> None:
+    """Size the template cache and load the compiled templates kept by
+    earlier runs, if enabled.
+    """
+    cache_config = config["template_cache"]
+    functemplate.set_template_cache_size(cache_config["size"].get(int))
+    if cache_config["persist"].get(bool):
+        functemplate.code_cache.load(
+            os.path.join(config.config_dir(), "templates.cache")
+        )
+
+
 def _ensure_db_directory_exists(path):
     dbpath = os.fspath(path)
     if dbpath in (":memory:", b":memory:"):  # in memory db
@@ -907,6 +973,12 @@ def _raw_main(args: list[str] | None) -> None:
 
     plugins.send("cli_exit", lib=lib)
     lib._close()
+
+    functemplate.code_cache.save()
+    log.debug(
+        "template cache: {0.hits} hits, {0.misses} misses",
+        functemplate.template_cache_info(),
+    )
     return None
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Protocol
 
-from beets import config, ui
+from beets import config, plugins, ui
 from beets.exceptions import UserError
 from beets.util import displayable_path, editor_command, interactive_open
 
@@ -22,8 +22,10 @@ class ConfigCLIOpts(Protocol):
 
 
 def config_func(lib: Library, opts: ConfigCLIOpts, args: list[str]) -> None:
-    # Make sure lazy configuration is loaded
+    # Make sure lazy configuration is loaded, including the defaults of
+    # the plugins that have not been imported yet.
     config.resolve()
+    plugins.load_deferred_plugins()
 
     # Print paths.
     if opts.paths:
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from beets import ui
+from beets import config, ui
+from beets.library import Item
+from beets.util.functemplate import get_template
 
 if TYPE_CHECKING:
     from beets.library import Library
@@ -19,10 +21,13 @@ def list_items(lib, query, album, fmt=""):
     albums instead of single items.
     """
     if album:
-        for album in lib.albums(query):
+        for album in lib.albums(query, stream=True):
             ui.print_(format(album, fmt))
     else:
-        for item in lib.items(query):
+        template = get_template(fmt or config["format_item"].as_str())
+        # Only fetch the albums if the template may refer to their fields.
+        with_albums = not template.varnames.issubset(Item.all_keys())
+        for item in lib.items(query, stream=True, with_albums=with_albums):
             ui.print_(format(item, fmt))
 
 
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 class ModifyCLIOpts(Protocol):
     album: bool
     inherit: bool
+    jobs: int
     move: bool | None
     write: bool | None
     yes: bool | None
@@ -57,7 +58,9 @@ def _check_modify_operations(
             )
 
 
-def modify_items(lib, mods, dels, query, write, move, album, confirm, inherit):
+def modify_items(
+    lib, mods, dels, query, write, move, album, confirm, inherit, jobs=1
+):
     """Modifies matching items according to user-specified assignments and
     deletions.
 
@@ -111,9 +114,18 @@ def modify_items(lib, mods, dels, query, write, move, album, confirm, inherit):
         )
 
     # Apply changes to database and files
-    with lib.transaction():
-        for obj in changed:
-            obj.try_sync(write, move, inherit)
+    with lib.bulk():
+        if album:
+            for obj in changed:
+                obj.store(inherit=inherit)
+            items = [item for obj in changed for item in obj.items()]
+        else:
+            items = changed
+        if write:
+            lib.try_write_many(items, jobs)
+        for item in items:
+            item.try_sync(False, move, album or inherit, store=False)
+        lib.store_many(items)
 
 
 def print_and_modify(obj, mods, dels):
@@ -162,6 +174,8 @@ def modify_func(lib: Library, opts: ModifyCLIOpts, args: list[str]) -> None:
     query, mods, dels = modify_parse_args(args, is_album=opts.album)
     if not mods and not dels:
         raise UserError("no modifications specified")
+    if opts.jobs < 1:
+        raise UserError("the number of jobs must be at least 1")
     modify_items(
         lib,
         mods,
@@ -172,6 +186,7 @@ def modify_func(lib: Library, opts: ModifyCLIOpts, args: list[str]) -> None:
         opts.album,
         not opts.yes,
         opts.inherit,
+        opts.jobs,
     )
 
 
@@ -219,4 +234,11 @@ modify_cmd.parser.add_option(
     default=True,
     help="when modifying albums, don't also change item data",
 )
+modify_cmd.parser.add_option(
+    "-j",
+    "--jobs",
+    type="int",
+    default=1,
+    help="number of threads writing files",
+)
 modify_cmd.func = modify_func
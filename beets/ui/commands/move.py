@@ -83,13 +83,21 @@ def move_items(
     dest is None, then the library's base directory is used, making the
     command "consolidate" files.
     """
-    items, albums = do_query(lib, query, album, False)
+    items, albums = do_query(lib, query, album)
     objs = albums if album else items
     num_objs = len(objs)
 
+    # Compute the destinations of all the items at once.
+    destinations = dict(
+        zip((i.id for i in items), lib.destinations(items, basedir=dest))
+    )
+
+    def destination(item):
+        return destinations[item.id]
+
     # Filter out files that don't need to be moved.
     def isitemmoved(item):
-        return item.path != item.destination(basedir=dest)
+        return item.path != destination(item)
 
     def isalbummoved(album):
         return any(isitemmoved(i) for i in album.items())
@@ -120,39 +128,50 @@ def move_items(
         if album:
             show_path_changes(
                 [
-                    (item.path, item.destination(basedir=dest))
+                    (item.path, destination(item))
                     for obj in objs
                     for item in obj.items()
                 ]
             )
         else:
-            show_path_changes(
-                [(obj.path, obj.destination(basedir=dest)) for obj in objs]
-            )
+            show_path_changes([(obj.path, destination(obj)) for obj in objs])
     else:
         if confirm:
             objs = ui.input_select_objects(
                 f"Really {act}",
                 objs,
                 lambda o: show_path_changes(
-                    [(o.path, o.destination(basedir=dest))]
+                    [
+                        (i.path, destination(i))
+                        for i in (o.items() if album else [o])
+                    ]
                 ),
             )
 
         for obj in objs:
             log.debug("moving: {.filepath}", obj)
 
+            # Items reuse the destinations computed above, while albums
+            # compute the ones of their items together.
+            kwargs = {} if album else {"dest": destination(obj)}
             if export:
                 # Copy without affecting the database.
                 obj.move(
-                    operation=MoveOperation.COPY, basedir=dest, store=False
+                    operation=MoveOperation.COPY,
+                    basedir=dest,
+                    store=False,
+                    **kwargs,
                 )
             else:
                 # Ordinary move/copy: store the new path.
                 if copy:
-                    obj.move(operation=MoveOperation.COPY, basedir=dest)
+                    obj.move(
+                        operation=MoveOperation.COPY, basedir=dest, **kwargs
+                    )
                 else:
-                    obj.move(operation=MoveOperation.MOVE, basedir=dest)
+                    obj.move(
+                        operation=MoveOperation.MOVE, basedir=dest, **kwargs
+                    )
 
 
 def move_func(lib: Library, opts: MoveCLIOpts, args: list[str]) -> None:
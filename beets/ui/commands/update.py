@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import os
+from collections import defaultdict
 from typing import TYPE_CHECKING, Protocol
 
 from beets import library, logging, ui
-from beets.util import ancestry, syspath
+from beets.exceptions import UserError
+from beets.util import ancestry, par_map, syspath
 from beets.util.color import colorize
 
 from .utils import do_query
 
 if TYPE_CHECKING:
-    from beets.library import Library
+    from collections.abc import Sequence
+
+    from beets.library import Item, Library
 
 
 # Global logger.
@@ -23,50 +27,123 @@ class UpdateCLIOpts(Protocol):
     album: bool
     exclude_fields: list[str] | None
     fields: list[str] | None
+    jobs: int
     move: bool | None
     pretend: bool | None
 
 
-def update_items(lib, query, album, move, pretend, fields, exclude_fields=None):
+def _scan_directory(paths: Sequence[bytes]) -> list[int | None]:
+    """Return the mtimes of the files at `paths`, which all share a
+    directory, or None for the files that do not exist.
+
+    The directory is listed once, so that files are only looked up on
+    their own when they are missing from the listing.
+    """
+    try:
+        with os.scandir(syspath(os.path.dirname(paths[0]))) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+
+    mtimes: list[int | None] = []
+    for path in paths:
+        entry = entries.get(os.path.basename(syspath(path)))
+        try:
+            # The filesystem may spell the names it lists differently.
+            stat = entry.stat() if entry else os.stat(syspath(path))
+        except OSError:
+            mtimes.append(None)
+        else:
+            mtimes.append(int(stat.st_mtime))
+    return mtimes
+
+
+def current_mtimes(items: Sequence[Item], jobs: int = 1) -> list[int | None]:
+    """Return the on-disk mtimes of `items`, rounded like
+    `Item.current_mtime`, or None for the items whose files are missing.
+
+    Each directory is scanned once for all its items, and `jobs`
+    directories are scanned concurrently.
+    """
+    by_directory: dict[bytes, list[int]] = defaultdict(list)
+    for index, item in enumerate(items):
+        if item.path:
+            by_directory[os.path.dirname(item.path)].append(index)
+
+    groups = list(by_directory.values())
+    scans = par_map(
+        lambda indices: _scan_directory([items[i].path for i in indices]),
+        groups,
+        jobs,
+    )
+    mtimes: list[int | None] = [None] * len(items)
+    for indices, scan in zip(groups, scans):
+        for index, mtime in zip(indices, scan):
+            mtimes[index] = mtime
+    return mtimes
+
+
+def _read(item: Item) -> library.ReadError | None:
+    """Read the tags of `item` and return the error doing so, if any."""
+    try:
+        item.read()
+    except library.ReadError as exc:
+        return exc
+    return None
+
+
+def update_items(
+    lib, query, album, move, pretend, fields, exclude_fields=None, jobs=1
+):
     """For all the items matched by the query, update the library to
     reflect the item's embedded tags.
     :param fields: The fields to be stored. If not specified, all fields will
     be.
     :param exclude_fields: The fields to not be stored. If not specified, all
     fields will be.
+    :param jobs: The number of threads checking and reading the files.
     """
-    with lib.transaction():
-        items, _ = do_query(lib, query, album)
-        if move and fields is not None and "path" not in fields:
-            # Special case: if an item needs to be moved, the path field has to
-            # updated; otherwise the new path will not be reflected in the
-            # database.
-            fields.append("path")
-        if fields is None:
-            # no fields were provided, update all media fields
-            item_fields = fields or library.Item._media_fields
-            if move and "path" not in item_fields:
-                # move is enabled, add 'path' to the list of fields to update
-                item_fields.add("path")
-        else:
-            # fields was provided, just update those
-            item_fields = fields
-        # get all the album fields to update
-        album_fields = fields or library.Album._fields.keys()
-        if exclude_fields_set := set(exclude_fields or []):
-            # remove any excluded fields from the item and album sets
-            item_fields = [
-                f for f in item_fields if f not in exclude_fields_set
-            ]
-            album_fields = [
-                f for f in album_fields if f not in exclude_fields_set
-            ]
+    items, _ = do_query(lib, query, album)
+    if move and fields is not None and "path" not in fields:
+        # Special case: if an item needs to be moved, the path field has to
+        # updated; otherwise the new path will not be reflected in the
+        # database.
+        fields.append("path")
+    if fields is None:
+        # no fields were provided, update all media fields
+        item_fields = fields or library.Item._media_fields
+        if move and "path" not in item_fields:
+            # move is enabled, add 'path' to the list of fields to update
+            item_fields.add("path")
+    else:
+        # fields was provided, just update those
+        item_fields = fields
+    # get all the album fields to update
+    album_fields = fields or library.Album._fields.keys()
+    if exclude_fields_set := set(exclude_fields or []):
+        # remove any excluded fields from the item and album sets
+        item_fields = [f for f in item_fields if f not in exclude_fields_set]
+        album_fields = [f for f in album_fields if f not in exclude_fields_set]
 
+    # Check the files and read the changed ones before touching the
+    # database.
+    mtimes = current_mtimes(items, jobs)
+    to_read = [
+        item
+        for item, mtime in zip(items, mtimes)
+        if mtime is not None and mtime > item.mtime
+    ]
+    read_errors = dict(
+        zip((i.id for i in to_read), par_map(_read, to_read, jobs))
+    )
+
+    with lib.bulk():
         # Walk through the items and pick up their changes.
         affected_albums = set()
-        for item in items:
+        changed_items = []
+        for item, mtime in zip(items, mtimes):
             # Item deleted?
-            if not item.path or not os.path.exists(syspath(item.path)):
+            if mtime is None:
                 ui.print_(format(item))
                 ui.print_(colorize("text_error", "  deleted"))
                 if not pretend:
@@ -75,17 +152,15 @@ def update_items(lib, query, album, move, pretend, fields, exclude_fields=None):
                 continue
 
             # Did the item change since last checked?
-            if item.current_mtime() <= item.mtime:
+            if item.id not in read_errors:
                 log.debug(
                     "skipping {0.filepath} because mtime is up to date ({0.mtime})",
                     item,
                 )
                 continue
 
-            # Read new data.
-            try:
-                item.read()
-            except library.ReadError as exc:
+            # Did reading the new data fail?
+            if (exc := read_errors[item.id]) is not None:
                 log.error("error reading {.filepath}: {}", item, exc)
                 continue
 
@@ -107,19 +182,19 @@ def update_items(lib, query, album, move, pretend, fields, exclude_fields=None):
                     if move and lib.directory in ancestry(item.path):
                         item.move(store=False)
 
-                    item.store(fields=item_fields)
                     affected_albums.add(item.album_id)
-                else:
-                    # The file's mtime was different, but there were no
-                    # changes to the metadata. Store the new mtime,
-                    # which is set in the call to read(), so we don't
-                    # check this again in the future.
-                    item.store(fields=item_fields)
+                # If there were no changes to the metadata, the file's mtime
+                # was still different. Store the new mtime, which is set in
+                # the call to read(), so we don't check this again in the
+                # future.
+                changed_items.append(item)
 
         # Skip album changes while pretending.
         if pretend:
             return
 
+        lib.store_many(changed_items, fields=item_fields)
+
         # Modify affected albums to reflect changes in their items.
         for album_id in affected_albums:
             if album_id is None:  # Singletons.
@@ -143,12 +218,15 @@ def update_items(lib, query, album, move, pretend, fields, exclude_fields=None):
                 items = list(album.items())
                 for item in items:
                     item.move(store=False, with_album=False)
-                    item.store(fields=item_fields)
+                lib.store_many(items, fields=item_fields)
                 album.move(store=False)
                 album.store(fields=album_fields)
 
 
 def update_func(lib: Library, opts: UpdateCLIOpts, args: list[str]) -> None:
+    if opts.jobs < 1:
+        raise UserError("the number of jobs must be at least 1")
+
     # Verify that the library folder exists to prevent accidental wipes.
     if not os.path.isdir(syspath(lib.directory)):
         ui.print_("Library path is unavailable or does not exist.")
@@ -163,6 +241,7 @@ def update_func(lib: Library, opts: UpdateCLIOpts, args: list[str]) -> None:
         opts.pretend,
         opts.fields,
         opts.exclude_fields,
+        opts.jobs,
     )
 
 
@@ -207,4 +286,11 @@ update_cmd.parser.add_option(
     dest="exclude_fields",
     help="list of fields to exclude from updates",
 )
+update_cmd.parser.add_option(
+    "-j",
+    "--jobs",
+    type="int",
+    default=1,
+    help="number of threads checking and reading files",
+)
 update_cmd.func = update_func
@@ -18,7 +18,7 @@ def show_version(lib: Library, opts: optparse.Values, args: list[str]) -> None:
     ui.print_(f"beets version {beets.__version__}")
     ui.print_(f"Python version {python_version()}")
     # Show plugins.
-    names = sorted(p.name for p in plugins.find_plugins())
+    names = sorted(plugins.plugin_names())
     if names:
         ui.print_("plugins:", ", ".join(names))
     else:
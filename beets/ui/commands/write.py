@@ -6,7 +6,8 @@ import os
 from typing import TYPE_CHECKING, Protocol
 
 from beets import library, logging, ui
-from beets.util import syspath
+from beets.exceptions import UserError
+from beets.util import par_map, syspath
 
 from .utils import do_query
 
@@ -20,26 +21,37 @@ log = logging.getLogger("beets")
 
 class WriteCLIOpts(Protocol):
     force: bool
+    jobs: int
     pretend: bool
 
 
-def write_items(lib, query, pretend, force):
+def _read_clean_item(item):
+    """Return an item reflecting the "clean" (on-disk) state of `item`,
+    the error reading its file, or None if the file is missing.
+    """
+    if not os.path.exists(syspath(item.path)):
+        return None
+    try:
+        return library.Item.from_path(item.path)
+    except library.ReadError as exc:
+        return exc
+
+
+def write_items(lib, query, pretend, force, jobs=1):
     """Write tag information from the database to the respective files
-    in the filesystem.
+    in the filesystem, reading and writing `jobs` files at once.
     """
     items, _ = do_query(lib, query, False, False)
 
-    for item in items:
+    to_write = []
+    for item, clean_item in zip(items, par_map(_read_clean_item, items, jobs)):
         # Item deleted?
-        if not os.path.exists(syspath(item.path)):
+        if clean_item is None:
             log.info("missing file: {.filepath}", item)
             continue
 
-        # Get an Item object reflecting the "clean" (on-disk) state.
-        try:
-            clean_item = library.Item.from_path(item.path)
-        except library.ReadError as exc:
-            log.error("error reading {.filepath}: {}", item, exc)
+        if isinstance(clean_item, library.ReadError):
+            log.error("error reading {.filepath}: {}", item, clean_item)
             continue
 
         # Check for and display changes.
@@ -47,13 +59,20 @@ def write_items(lib, query, pretend, force):
             item, clean_item, library.Item._media_tag_fields, force
         )
         if (changed or force) and not pretend:
-            # We use `try_sync` here to keep the mtime up to date in the
-            # database.
-            item.try_sync(True, False)
+            to_write.append(item)
+
+    # Store the items after writing them to keep their mtimes up to date
+    # in the database.
+    with lib.bulk():
+        lib.try_write_many(to_write, jobs)
+        lib.store_many(to_write)
 
 
 def write_func(lib: Library, opts: WriteCLIOpts, args: list[str]) -> None:
-    write_items(lib, args, opts.pretend, opts.force)
+    if opts.jobs < 1:
+        raise UserError("the number of jobs must be at least 1")
+
+    write_items(lib, args, opts.pretend, opts.force, opts.jobs)
 
 
 write_cmd = ui.Subcommand("write", help="write tag information to files")
@@ -71,4 +90,11 @@ write_cmd.parser.add_option(
     default=False,
     help="write tags even if the existing tags match the database",
 )
+write_cmd.parser.add_option(
+    "-j",
+    "--jobs",
+    type="int",
+    default=1,
+    help="number of threads reading and writing files",
+)
 write_cmd.func = write_func
@@ -53,6 +53,7 @@ if TYPE_CHECKING:
 MAX_FILENAME_LENGTH = 200
 WINDOWS_MAGIC_PREFIX = "\\\\?\\"
 T = TypeVar("T")
+R = TypeVar("R")
 AnyPath = TypeVar("AnyPath", str, bytes, Path)
 StrPath = str | Path
 PathLike = StrPath | bytes
@@ -206,6 +207,94 @@ def ancestry(path: AnyStr) -> list[AnyStr]:
     return out
 
 
+def _ignore_pattern(ignore: Sequence[AnyStr]) -> Pattern[AnyStr] | None:
+    """Compile the glob patterns in `ignore` into a single regular
+    expression matching the names `fnmatch` matches against any of them.
+    """
+    if not ignore:
+        return None
+    translated = []
+    for pat in ignore:
+        # `fnmatch` translates bytes patterns the same way.
+        pat_str = pat.decode("latin-1") if isinstance(pat, bytes) else pat
+        translated.append(fnmatch.translate(os.path.normcase(pat_str)))
+    regex = "|".join(translated)
+    if isinstance(ignore[0], bytes):
+        return re.compile(regex.encode("latin-1"))  # type: ignore[return-value]
+    return re.compile(regex)  # type: ignore[return-value]
+
+
+def sorted_scandir(
+    path: AnyStr,
+    ignore: Sequence[AnyStr] = (),
+    ignore_hidden: bool = False,
+    logger: Logger | None = None,
+) -> Iterator[
+    tuple[AnyStr, list[os.DirEntry[AnyStr]], list[os.DirEntry[AnyStr]]]
+]:
+    """Like `sorted_walk`, but yield the `os.DirEntry` objects of the
+    directories and files, which cache the results of their `stat`
+    methods.
+    """
+    ignore_pat = _ignore_pattern(ignore)
+    sort_key = path.__class__.lower
+
+    def name_key(entry: os.DirEntry[AnyStr]) -> AnyStr:
+        return sort_key(entry.name)
+
+    # The directories still to list, with the next one at the end.
+    pending = [path]
+    while pending:
+        path = pending.pop()
+
+        # Get all the directories and files at this level.
+        dirs = []
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Skip ignored filenames.
+                    if ignore_pat and ignore_pat.match(
+                        os.path.normcase(entry.name)
+                    ):
+                        if logger:
+                            pat = next(
+                                p
+                                for p in ignore
+                                if fnmatch.fnmatch(entry.name, p)
+                            )
+                            logger.debug(
+                                "ignoring '{}' due to ignore rule '{}'",
+                                entry.name,
+                                pat,
+                            )
+                        continue
+
+                    # Add to output as either a file or a directory.
+                    if ignore_hidden and hidden.is_hidden(entry.path):
+                        continue
+                    if entry.is_dir():
+                        dirs.append(entry)
+                    else:
+                        files.append(entry)
+        except OSError:
+            if logger:
+                logger.warning(
+                    "could not list directory {}",
+                    displayable_path(path),
+                    exc_info=True,
+                )
+            continue
+
+        # Sort lists (case-insensitive) and yield the current level.
+        dirs.sort(key=name_key)
+        files.sort(key=name_key)
+        yield (path, dirs, files)
+
+        # Descend into the directories in order.
+        pending.extend(os.path.join(path, d.name) for d in reversed(dirs))
+
+
 def sorted_walk(
     path: AnyStr,
     ignore: Sequence[AnyStr] = (),
@@ -213,55 +302,14 @@ def sorted_walk(
     logger: Logger | None = None,
 ) -> Iterator[tuple[AnyStr, Sequence[AnyStr], Sequence[AnyStr]]]:
     """Like `os.walk`, but yields things in case-insensitive sorted,
-    breadth-first order.  Directory and file names matching any glob
+    depth-first order.  Directory and file names matching any glob
     pattern in `ignore` are skipped. If `logger` is provided, then
     warning messages are logged there when a directory cannot be listed.
     """
-    # Get all the directories and files at this level.
-    try:
-        contents = os.listdir(path)
-    except OSError:
-        if logger:
-            logger.warning(
-                "could not list directory {}",
-                displayable_path(path),
-                exc_info=True,
-            )
-        return
-    dirs = []
-    files = []
-    for base in contents:
-        # Skip ignored filenames.
-        skip = False
-        for pat in ignore:
-            if fnmatch.fnmatch(base, pat):
-                if logger:
-                    logger.debug(
-                        "ignoring '{}' due to ignore rule '{}'", base, pat
-                    )
-                skip = True
-                break
-        if skip:
-            continue
-
-        # Add to output as either a file or a directory.
-        cur = os.path.join(path, base)
-        if (ignore_hidden and not hidden.is_hidden(cur)) or not ignore_hidden:
-            if os.path.isdir(syspath(cur)):
-                dirs.append(base)
-            else:
-                files.append(base)
-
-    # Sort lists (case-insensitive) and yield the current level.
-    sort_key = path.__class__.lower
-    dirs.sort(key=sort_key)
-    files.sort(key=sort_key)
-    yield (path, dirs, files)
-
-    # Recurse into directories.
-    for base in dirs:
-        cur = os.path.join(path, base)
-        yield from sorted_walk(cur, ignore, ignore_hidden, logger)
+    for root, dirs, files in sorted_scandir(
+        path, ignore, ignore_hidden, logger
+    ):
+        yield root, [d.name for d in dirs], [f.name for f in files]
 
 
 def path_as_posix(path: bytes) -> bytes:
@@ -1038,22 +1086,41 @@ def asciify_path(path: str) -> str:
     return os.sep.join(replace(unidecode(p)) for p in path.split(os.sep))
 
 
-def par_map(transform: Callable[[T], Any], items: Sequence[T]) -> None:
-    """Apply a transformation to each item concurrently using a thread pool.
+def par_map(
+    transform: Callable[[T], R],
+    items: Sequence[T],
+    processes: int | None = None,
+) -> list[R]:
+    """Apply a transformation to each item concurrently using a thread pool
+    of `processes` threads, one per CPU by default, and return the results
+    in the order of the items. A single process runs the transformation
+    in the calling thread.
 
     Propagates the calling thread's context variables into each worker,
     ensuring that context-dependent state is available during parallel
     execution.
     """
+    if processes == 1:
+        return list(map(transform, items))
+
     ctx = contextvars.copy_context()  # snapshot parent context at call time
 
-    def _worker(item: T) -> Any:
+    def _worker(item: T) -> R:
         # ThreadPool workers may run concurrently, so each task needs its own
         # child context rather than sharing one Context instance.
         return ctx.copy().run(transform, item)
 
-    with ThreadPool() as pool:
-        pool.map(_worker, items)
+    with ThreadPool(processes) as pool:
+        return pool.map(_worker, items)
+
+
+# The hit and miss counts of an `lru_cache`, like `functools`' own
+# `cache_info` results.
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
 
 
 class cached_classproperty(Generic[T]):
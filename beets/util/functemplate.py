@@ -15,12 +15,22 @@ engine like Jinja2 or Mustache.
 from __future__ import annotations
 
 import ast
+import builtins
 import dis
+import marshal
+import os
 import re
+import sys
+import tempfile
+import threading
 import types
+from contextlib import suppress
 from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any, TypeAlias
 
+import beets
+from beets.util import CacheInfo
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
 
@@ -36,6 +46,12 @@ ESCAPE_CHAR = "$"
 VARIABLE_PREFIX = "__var_"
 FUNCTION_PREFIX = "__func_"
 
+#: The number of templates `get_template` keeps by default.
+TEMPLATE_CACHE_SIZE = 1024
+
+#: The number of compiled templates a code cache file keeps.
+CODE_CACHE_SIZE = 4096
+
 
 class Environment:
     """Contains the values and functions to be substituted into a
@@ -86,7 +102,7 @@ def compile_func(
     statements: list[ast.stmt],
     name: str = "_the_func",
     debug: bool = False,
-) -> Callable[..., list[str]]:
+) -> Callable[..., Any]:
     """Compile a list of statements as the body of a function and return
     the resulting Python function. If `debug`, then print out the
     bytecode of the compiled function.
@@ -523,23 +539,124 @@ def _parse(template: str) -> Expression:
     return Expression(parts)
 
 
-@lru_cache(maxsize=128)
-def get_template(fmt: str) -> Template:
-    return Template(fmt)
+class CodeCache:
+    """The code of compiled templates by their source, which can be
+    saved to a file so that later runs do not need to parse and compile
+    the same templates again.
+
+    The file is only valid for the beets and Python versions that wrote
+    it and is ignored otherwise. Nothing is kept until a file is
+    `load`ed.
+    """
+
+    def __init__(self, maxsize: int = CODE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.path: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._codes: dict[str, tuple[types.CodeType, tuple[str, ...]]] = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> tuple[str, str | None]:
+        return beets.__version__, sys.implementation.cache_tag
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def load(self, path: str) -> None:
+        """Replace the cached code with the contents of the file at
+        `path`, which is also where `save` writes to.
+        """
+        codes = {}
+        try:
+            with open(path, "rb") as f:
+                key, file_codes = marshal.load(f)
+            if key == self.key:
+                codes = file_codes
+        except (OSError, EOFError, ValueError, TypeError):
+            # A missing, truncated or outdated file is just an empty
+            # cache.
+            pass
+
+        with self._lock:
+            self.path = path
+            self._codes = codes
+            self._changed = False
+
+    def save(self) -> None:
+        """Write the cached code to the file it was loaded from, if any
+        template was compiled since, keeping the most recently used
+        ones.
+        """
+        with self._lock:
+            if self.path is None or not self._changed:
+                return
+            codes = dict(list(self._codes.items())[-self.maxsize :])
+            self._changed = False
+
+        # Other processes may save the same file at the same time, so
+        # each writes its own temporary file and replaces the cache.
+        directory, name = os.path.split(self.path)
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                prefix=f".{name}.", suffix=".tmp", dir=directory, delete=False
+            ) as f:
+                tmp_path = f.name
+                marshal.dump((self.key, codes), f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.remove(tmp_path)
+
+    def get(self, source: str) -> tuple[types.CodeType, tuple[str, ...]] | None:
+        """Return the code of the template `source` and the names of its
+        variables, or None if it has not been compiled yet.
+        """
+        with self._lock:
+            if self.path is None:
+                return None
+            if (cached := self._codes.pop(source, None)) is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Move the template to the end, which is kept on `save`.
+            self._codes[source] = cached
+            return cached
+
+    def add(
+        self, source: str, code: types.CodeType, varnames: tuple[str, ...]
+    ) -> None:
+        with self._lock:
+            if self.path is not None:
+                self._codes[source] = code, varnames
+                self._changed = True
+
+
+code_cache = CodeCache()
 
 
 # External interface.
 class Template:
     """A string template, including text, Symbols, and Calls."""
 
+    #: The names of the variables the template refers to.
+    varnames: frozenset[str]
+
     def __init__(self, template: str) -> None:
-        self.expr = _parse(template)
         self.original = template
         self.compiled = self.translate()
 
     def __eq__(self, other: object) -> bool:
         return type(self) is type(other) and self.original == other.original
 
+    @cached_property
+    def expr(self) -> Expression:
+        return _parse(self.original)
+
     def interpret(
         self,
         values: Mapping[str, str] = {},
@@ -566,32 +683,73 @@ class Template:
         return res
 
     def translate(self) -> Callable[..., str]:
-        """Compile the template to a Python function."""
-        expressions, varnames, funcnames = self.expr.translate()
+        """Compile the template to a Python function taking the values
+        and the functions to substitute, or reuse the code `code_cache`
+        holds for it.
+        """
+        if cached := code_cache.get(self.original):
+            code, varnames = cached
+            self.varnames = frozenset(varnames)
+            return types.FunctionType(code, {"__builtins__": builtins})
 
-        argnames = []
-        for varname in varnames:
-            argnames.append(f"{VARIABLE_PREFIX}{varname}")
-        for funcname in funcnames:
-            argnames.append(f"{FUNCTION_PREFIX}{funcname}")
+        expressions, varnames, funcnames = self.expr.translate()
+        self.varnames = frozenset(varnames)
+
+        # Look up the values and functions up front, so that a missing
+        # one fails before anything is evaluated.
+        statements: list[ast.stmt] = []
+        for prefix, names, mapping in (
+            (VARIABLE_PREFIX, varnames, "values"),
+            (FUNCTION_PREFIX, funcnames, "functions"),
+        ):
+            for name in sorted(names):
+                statements.append(
+                    ast.Assign(
+                        [ast.Name(f"{prefix}{name}", ast.Store())],
+                        ast.Subscript(
+                            ex_rvalue(mapping), ex_literal(name), ast.Load()
+                        ),
+                    )
+                )
+        statements.append(
+            ast.Return(
+                ex_call(
+                    ast.Attribute(ex_literal(""), "join", ast.Load()),
+                    [ast.List(expressions, ast.Load())],
+                )
+            )
+        )
 
-        func = compile_func(
-            argnames, [ast.Return(ast.List(expressions, ast.Load()))]
+        func = compile_func(["values", "functions"], statements)
+        code_cache.add(
+            self.original, func.__code__, tuple(sorted(self.varnames))
         )
+        return func
+
+
+_template_cache = lru_cache(maxsize=TEMPLATE_CACHE_SIZE)(Template)
 
-        def wrapper_func(
-            values: Mapping[str, str] = {},
-            functions: Mapping[str, Callable[[str], str]] = {},
-        ) -> str:
-            args: dict[str, str | Callable[[str], str]] = {}
-            for varname in varnames:
-                args[f"{VARIABLE_PREFIX}{varname}"] = values[varname]
-            for funcname in funcnames:
-                args[f"{FUNCTION_PREFIX}{funcname}"] = functions[funcname]
-            parts = func(**args)
-            return "".join(parts)
-
-        return wrapper_func
+
+def get_template(fmt: str) -> Template:
+    """Return the template for `fmt`, reusing the most recently used
+    ones.
+    """
+    return _template_cache(fmt)
+
+
+def set_template_cache_size(maxsize: int | None) -> None:
+    """Let `get_template` keep up to `maxsize` templates, or any number
+    of them if `maxsize` is None. This empties the cache.
+    """
+    global _template_cache
+    _template_cache = lru_cache(maxsize=maxsize)(Template)
+
+
+def template_cache_info() -> CacheInfo:
+    """Return the hit and miss counts of the cache behind
+    `get_template`.
+    """
+    return CacheInfo(*_template_cache.cache_info())
 
 
 # Performance tests.
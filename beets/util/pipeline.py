@@ -14,7 +14,8 @@ When running a parallel pipeline, it is also possible to use
 multiple coroutines for the same pipeline stage; this lets you speed
 up a bottleneck stage by dividing its work among multiple threads.
 To do so, pass an iterable of coroutines to the Pipeline constructor
-in place of any single coroutine.
+in place of any single coroutine. Wrap them in `ordered` to have the
+stage pass its messages on in the order it received them.
 """
 
 from __future__ import annotations
@@ -22,7 +23,7 @@ from __future__ import annotations
 import contextvars
 import queue
 import sys
-from threading import Lock, Thread
+from threading import Condition, Lock, Thread
 from typing import TYPE_CHECKING, Any, Generic, overload
 
 from typing_extensions import ParamSpec, TypeVar, TypeVarTuple, Unpack
@@ -164,6 +165,85 @@ def multiple(messages: Iterable[Tq]) -> MultiMessage:
     return MultiMessage(messages)
 
 
+class OrderedStage(tuple[Tstage, ...]):
+    """Coroutines that run a middle stage of a parallel pipeline
+    together, like any other iterable of coroutines, but send their
+    messages on in the order the stage received them.
+    """
+
+
+def ordered(coros: Iterable[Tstage]) -> OrderedStage[Tstage]:
+    """Pass ordered([coro, ..]) to the Pipeline constructor in place of a
+    coroutine to run a stage in several threads that keep the order of
+    its messages.
+    """
+    return OrderedStage(coros)
+
+
+class _Reorderer:
+    """Number the messages a stage run by several threads receives, and
+    send the messages the threads yield for them on in that order.
+
+    At most as many messages as the output queue holds are taken from
+    the input queue before they are sent on, so that a slow message
+    does not let the other threads pile up the messages after it.
+    """
+
+    def __init__(
+        self, in_queue: CountedQueue[Any], out_queue: CountedQueue[Any]
+    ) -> None:
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.max_pending = out_queue.maxsize or DEFAULT_QUEUE_SIZE
+        self.get_lock = Lock()
+        self.put_lock = Lock()
+        self.sent_cond = Condition(self.put_lock)
+        self.received = 0
+        self.sent = 0
+        self.aborted = False
+        # The messages yielded for the received messages that cannot
+        # be sent yet, by the numbers of the latter.
+        self.pending: dict[int, list[Any]] = {}
+
+    def get(self) -> tuple[int, Any]:
+        """Get the next message for the stage and its number, once
+        there is room for it.
+        """
+        with self.get_lock:
+            with self.sent_cond:
+                self.sent_cond.wait_for(
+                    lambda: (
+                        self.aborted
+                        or self.received - self.sent < self.max_pending
+                    )
+                )
+                if self.aborted:
+                    return -1, POISON
+            msg = self.in_queue.get()
+            self.received += 1
+            return self.received - 1, msg
+
+    def put(self, number: int, msgs: Iterable[Any]) -> None:
+        """Send the messages yielded for message `number`, after those
+        yielded for all the earlier messages.
+        """
+        with self.sent_cond:
+            self.pending[number] = list(msgs)
+            while self.sent in self.pending:
+                for msg in self.pending.pop(self.sent):
+                    if self.aborted:
+                        return
+                    self.out_queue.put(msg)
+                self.sent += 1
+                self.sent_cond.notify_all()
+
+    def abort(self) -> None:
+        """Stop handing out and sending on messages."""
+        with self.sent_cond:
+            self.aborted = True
+            self.sent_cond.notify_all()
+
+
 StagePrefix = TypeVarTuple("StagePrefix")
 A = TypeVarTuple("A")  # Arguments of a function (omitting the task)
 T = TypeVar("T")  # Type of the task
@@ -272,6 +352,8 @@ class PipelineThread(Thread):
                 _invalidate_queue(self.in_queue, POISON)
             if hasattr(self, "out_queue"):
                 _invalidate_queue(self.out_queue, POISON)
+            if getattr(self, "reorderer", None):
+                self.reorderer.abort()
 
     def abort_all(self, exc_info: ExcInfo) -> None:
         """Abort all other threads in the system for an exception."""
@@ -337,12 +419,14 @@ class MiddlePipelineThread(PipelineThread):
         out_queue: CountedQueue[Any],
         all_threads: Sequence[PipelineThread],
         ctx: contextvars.Context | None = None,
+        reorderer: _Reorderer | None = None,
     ) -> None:
         super().__init__(all_threads, ctx)
         self.coro = coro
         self.in_queue = in_queue
         self.out_queue = out_queue
         self.out_queue.acquire()
+        self.reorderer = reorderer
 
     def run(self) -> None:
         try:
@@ -355,7 +439,10 @@ class MiddlePipelineThread(PipelineThread):
                         return
 
                 # Get the message from the previous stage.
-                msg = self.in_queue.get()
+                if self.reorderer:
+                    number, msg = self.reorderer.get()
+                else:
+                    msg = self.in_queue.get()
                 if msg is POISON:
                     break
 
@@ -366,6 +453,12 @@ class MiddlePipelineThread(PipelineThread):
                 # Invoke the current stage.
                 out = self._run_in_context(self.coro.send, msg)
 
+                if self.reorderer:
+                    # Send messages to next stage once the earlier ones
+                    # have been sent.
+                    self.reorderer.put(number, _allmsgs(out))
+                    continue
+
                 # Send messages to next stage.
                 for msg in _allmsgs(out):
                     with self.abort_lock:
@@ -488,10 +581,21 @@ class Pipeline(Generic[Tpull, Tstage]):
 
         # Middle stages.
         for i in range(queue_count - 1):
+            reorderer = None
+            if (
+                isinstance(self.stages[i], OrderedStage)
+                and len(self.stages[i]) > 1
+            ):
+                reorderer = _Reorderer(queues[i], queues[i + 1])
             for coro in self.stages[i]:
                 threads.append(
                     MiddlePipelineThread(
-                        coro, queues[i], queues[i + 1], threads, base_ctx.copy()
+                        coro,
+                        queues[i],
+                        queues[i + 1],
+                        threads,
+                        base_ctx.copy(),
+                        reorderer,
                     )
                 )
 
@@ -0,0 +1,187 @@
+"""An on-disk cache of HTTP responses for the metadata source plugins.
+
+Responses are stored in an SQLite database, keyed by the request method and
+the URL with its query parameters. Stored responses are served without a
+request for as long as they are fresh. Stale responses are revalidated with
+the server using their ``ETag`` and ``Last-Modified`` headers, if they have
+any. Once the cache outgrows its size limit, the least recently used
+responses are evicted.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, ClassVar, NamedTuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CachedResponse(NamedTuple):
+    """A response read from the cache, along with when it was stored."""
+
+    response: requests.Response
+    stored_at: float
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Return the headers that revalidate this response with the server."""
+        headers = {}
+        if etag := self.response.headers.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+class ResponseCache:
+    """A size-bounded store of HTTP responses in an SQLite database.
+
+    The cache is safe to use from several threads. Use `open` to share a
+    single cache between all handlers that use the same database file.
+    """
+
+    _instances: ClassVar[dict[str, ResponseCache]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Open the cache stored at `path`, which holds at most `max_size`
+        bytes of responses.
+        """
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+        if dirname := os.path.dirname(path):
+            os.makedirs(dirname, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " url TEXT,"
+                " status INTEGER,"
+                " headers TEXT,"
+                " encoding TEXT,"
+                " content BLOB,"
+                " size INTEGER,"
+                " stored_at REAL,"
+                " accessed_at REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at"
+                " ON responses (accessed_at)"
+            )
+        (size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._size: int = size
+
+    @classmethod
+    def open(cls, path: str, max_size: int) -> ResponseCache:
+        """Return the cache stored at `path`, opening it on first use."""
+        path = os.path.abspath(path)
+        with cls._instances_lock:
+            if (cache := cls._instances.get(path)) is None:
+                cache = cls._instances[path] = cls(path, max_size)
+                atexit.register(cache.close)
+        return cache
+
+    @staticmethod
+    def key(method: str, url: str, params: Any = None) -> str:
+        """Return the key of a request to `url` with the query `params`."""
+        request = requests.Request(method.upper(), url, params=params)
+        return f"{request.method} {request.prepare().url}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the response stored under `key`, if there is one."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, encoding, content, stored_at"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+
+        url, status, headers, encoding, content, stored_at = row
+        response = requests.Response()
+        response.url = url
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = encoding
+        response._content = content
+        return CachedResponse(response, stored_at)
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """Store `response` under `key`, evicting the least recently used
+        responses if the cache grows too large.
+        """
+        content = response.content
+        now = time.time()
+        with self._lock, self._conn:
+            (old_size,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    content,
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            self._size += len(content) - old_size
+            self._evict()
+
+    def refresh(self, key: str) -> None:
+        """Mark the response stored under `key` as fresh again, after the
+        server confirmed that it has not changed.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ?"
+                " WHERE key = ?",
+                (now, now, key),
+            )
+
+    def _evict(self) -> None:
+        """Remove the least recently used responses until the cache fits
+        in its size limit.
+        """
+        while self._size > self.max_size:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self._size <= self.max_size:
+                    break
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key = ?", (key,)
+                )
+                self._size -= size
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -10,8 +10,12 @@ logic throughout the codebase.
 
 from __future__ import annotations
 
+import copy
 import operator
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from functools import cached_property, singledispatchmethod, wraps
 from http import HTTPStatus
@@ -36,6 +40,7 @@ from .requests import BeetsHTTPError, RequestHandler, TimeoutAndRetrySession
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import confuse
     from requests import Response
 
     from beets.metadata_plugins import IDResponse
@@ -580,8 +585,17 @@ class MusicBrainzAPI(RequestHandler):
         UnauthorizedMBError,
     ]
 
+    #: The number of recent lookups whose responses are reused.
+    LOOKUP_CACHE_SIZE: ClassVar[int] = 128
+
     api_host: str = field(init=False)
     rate_limit: float = field(init=False)
+    _lookups: OrderedDict[tuple[str, str, tuple[str, ...]], Future[Any]] = (
+        field(default_factory=OrderedDict, init=False, repr=False)
+    )
+    _lookups_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         mb_config = config["musicbrainz"]
@@ -593,6 +607,7 @@ class MusicBrainzAPI(RequestHandler):
                 "ratelimit_interval": 1,
             }
         )
+        self.add_cache_config(mb_config["http_cache"], "musicbrainz")
 
         hostname = mb_config["host"].as_str()
         if hostname == "musicbrainz.org":
@@ -612,6 +627,9 @@ class MusicBrainzAPI(RequestHandler):
     def create_session(self) -> LimiterTimeoutSession:
         return LimiterTimeoutSession(per_second=self.rate_limit)
 
+    def cache_config(self) -> confuse.ConfigView:
+        return config["musicbrainz"]["http_cache"]
+
     def request(self, *args, **kwargs) -> Response:
         """Ensure all requests specify JSON response format by default."""
         kwargs.setdefault("params", {})
@@ -639,7 +657,36 @@ class MusicBrainzAPI(RequestHandler):
     def _lookup(
         self, entity: Entity, id_: str, **kwargs: Unpack[LookupKwargs]
     ) -> Any:
-        return self._get_resource(f"{entity}/{id_}", **kwargs)
+        """Look up an entity by its ID.
+
+        Lookups of the same entity, with the same includes, are coalesced:
+        concurrent callers share a single request, and the responses to the
+        last `LOOKUP_CACHE_SIZE` lookups are reused. Every caller gets its
+        own copy of the data, which it is free to modify.
+        """
+        key = (entity, id_, tuple(kwargs.get("includes") or ()))
+        with self._lookups_lock:
+            future = self._lookups.get(key)
+            if owner := future is None:
+                future = self._lookups[key] = Future()
+                while len(self._lookups) > self.LOOKUP_CACHE_SIZE:
+                    self._lookups.popitem(last=False)
+            else:
+                self._lookups.move_to_end(key)
+
+        if owner:
+            try:
+                future.set_result(
+                    self._get_resource(f"{entity}/{id_}", **kwargs)
+                )
+            except Exception as exc:
+                # Don't keep failures, so that the lookup can be retried.
+                with self._lookups_lock:
+                    if self._lookups.get(key) is future:
+                        del self._lookups[key]
+                future.set_exception(exc)
+
+        return copy.deepcopy(future.result())
 
     def _browse(self, entity: Entity, **kwargs) -> list[Any]:
         normalised_entity = entity.replace("-", "_")
@@ -70,7 +70,7 @@ def process_track(
             new_count,
         )
         song[field] = new_count
-        song.store()
+    lib.store_many(items)
 
     return True
 
@@ -83,7 +83,7 @@ def update_play_counts(
     total_fails = 0
     log.info("Received {} tracks in this page, processing...", total)
 
-    with lib.transaction():
+    with lib.bulk():
         for i, track in enumerate(tracks, 1):
             if i % 250 == 0:
                 log.info("Processing track {}/{} ...", i, total)
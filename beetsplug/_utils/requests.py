@@ -3,19 +3,24 @@ from __future__ import annotations
 import atexit
 import threading
 import time
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from email.utils import parsedate_to_datetime
 from functools import cached_property
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Protocol, TypeVar
+from urllib.parse import urlsplit
 
+import confuse
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from beets import __version__
 
+from .httpcache import ResponseCache
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Mapping
 
 
 class BeetsHTTPError(requests.exceptions.HTTPError):
@@ -75,15 +80,16 @@ class TimeoutAndRetrySession(requests.Session, metaclass=SingletonMeta):
         super().__init__(*args, **kwargs)
         self.headers["User-Agent"] = f"beets/{__version__} https://beets.io/"
 
+        # Servers asking to slow down are handled by `RateLimitAdapter`.
         retry = Retry(
             total=6,
             backoff_factor=0.5,
+            respect_retry_after_header=False,
             status_forcelist=[
                 HTTPStatus.INTERNAL_SERVER_ERROR,
                 HTTPStatus.BAD_GATEWAY,
                 HTTPStatus.SERVICE_UNAVAILABLE,
                 HTTPStatus.GATEWAY_TIMEOUT,
-                HTTPStatus.TOO_MANY_REQUESTS,
             ],
         )
         adapter = RateLimitAdapter(rate_limit=0.25, max_retries=retry)
@@ -103,36 +109,139 @@ class TimeoutAndRetrySession(requests.Session, metaclass=SingletonMeta):
         return r
 
 
+class TokenBucket:
+    """Rate limit for the requests to a single host.
+
+    The bucket holds up to `burst` tokens and gains one every `rate_limit`
+    seconds. Each request takes a token, waiting for one if the bucket is
+    empty. The server can also pause the bucket for a while, for example
+    when it asks the client to retry later.
+    """
+
+    def __init__(self, rate_limit: float, burst: int = 1) -> None:
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token and return how many seconds to wait before using it.
+
+        The token is reserved straight away, so that concurrent callers
+        queue up behind each other instead of waiting on a lock.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.rate_limit > 0:
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated) / self.rate_limit,
+                )
+            else:
+                self._tokens = self.burst
+            self._updated = now
+            self._tokens -= 1
+
+            wait = max(0.0, -self._tokens * self.rate_limit)
+            return max(wait, self._resume_at - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for the next `seconds`."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _retry_after(headers: Mapping[str, str]) -> float | None:
+    """Return the number of seconds the server asks the client to wait
+    before sending more requests, if any.
+
+    This reads the ``Retry-After`` header, or the ``X-RateLimit-Reset``
+    header once ``X-RateLimit-Remaining`` says the budget is used up.
+    """
+    if value := headers.get("Retry-After"):
+        with suppress(ValueError):
+            return max(0.0, float(value))
+        with suppress(TypeError, ValueError):
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        return None
+
+    if headers.get("X-RateLimit-Remaining") == "0" and (
+        reset := headers.get("X-RateLimit-Reset")
+    ):
+        with suppress(ValueError):
+            seconds = float(reset)
+            # Some servers send the time of the reset, others the number
+            # of seconds until it.
+            if seconds > time.time() / 2:
+                seconds -= time.time()
+            return max(0.0, seconds)
+
+    return None
+
+
 class RateLimitAdapter(HTTPAdapter):
-    """HTTPAdapter that enforces minimum interval between requests.
+    """HTTPAdapter that limits the rate of requests to each host.
 
     Prevents server overload and 429 errors by sleeping when requests
-    come too fast. Thread-safe via lock.
+    come too fast. Every host has its own `TokenBucket`, so requests to
+    different hosts never wait for each other. When a server asks to slow
+    down, through the ``Retry-After`` or ``X-RateLimit-*`` headers, the
+    bucket of its host is paused for as long as it asks, and requests
+    rejected with a 429 status are sent again up to `rate_limit_retries`
+    times.
 
     Attributes:
-        rate_limit: Minimum seconds between requests. Default 0.25 (4/sec).
-
-    Override `_wait_time()` for custom strategies (token bucket, burst, etc.).
+        rate_limit: Sustained seconds between requests. Default 0.25 (4/sec).
+        burst: Number of requests that may be sent at once after a pause.
     """
 
-    def __init__(self, rate_limit: float = 0.25, **kwargs):
+    def __init__(
+        self,
+        rate_limit: float = 0.25,
+        burst: int = 1,
+        rate_limit_retries: int = 3,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.rate_limit = rate_limit
-        self._last_request_time = 0.0
+        self.burst = burst
+        self.rate_limit_retries = rate_limit_retries
+        self._buckets: dict[str, TokenBucket] = {}
         self._lock = threading.Lock()
 
-    def _wait_time(self, elapsed: float) -> float:
-        """Return seconds to wait. Override for custom rate limiting."""
-        return max(0, self.rate_limit - elapsed)
+    def bucket(self, url: str | None) -> TokenBucket:
+        """Return the bucket of the host of `url`."""
+        host = urlsplit(url or "").netloc
+        with self._lock:
+            if (bucket := self._buckets.get(host)) is None:
+                bucket = TokenBucket(self.rate_limit, self.burst)
+                self._buckets[host] = bucket
+        return bucket
 
     def send(self, request: requests.PreparedRequest, *args, **kwargs):
-        with self._lock:
-            elapsed = time.monotonic() - self._last_request_time
-            wait = self._wait_time(elapsed)
-            if wait > 0:
+        bucket = self.bucket(request.url)
+        for attempt in range(self.rate_limit_retries + 1):
+            if (wait := bucket.acquire()) > 0:
                 time.sleep(wait)
-            self._last_request_time = time.monotonic()
-        return super().send(request, *args, **kwargs)
+            response = super().send(request, *args, **kwargs)
+
+            retry_after = _retry_after(response.headers)
+            if retry_after is not None:
+                bucket.pause(retry_after)
+            if (
+                response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+                or attempt == self.rate_limit_retries
+            ):
+                break
+
+            response.close()
+            if retry_after is None:
+                bucket.pause(2**attempt)
+
+        return response
 
 
 class RequestHandler:
@@ -154,6 +263,9 @@ class RequestHandler:
     - :class:`RequestHandler.get()` to get HTTP response object
     - :class:`RequestHandler.request()` to invoke arbitrary HTTP methods
 
+    Override :class:`RequestHandler.cache_config()` to cache the responses to
+    GET requests on disk, as configured by the user.
+
     Feel free to define common methods that are used in multiple plugins.
     """
 
@@ -173,6 +285,40 @@ class RequestHandler:
     def session(self) -> TimeoutAndRetrySession:
         return self.create_session()
 
+    def cache_config(self) -> confuse.ConfigView | None:
+        """Return the configuration of the response cache, if any.
+
+        The view holds the ``enabled``, ``path``, ``ttl`` and ``max_size``
+        options, which `add_cache_config` fills in with their defaults.
+        """
+        return None
+
+    @staticmethod
+    def add_cache_config(view: confuse.ConfigView, name: str) -> None:
+        """Add the default response cache options to `view`, storing the
+        cache of `name` in the beets configuration directory.
+        """
+        view.add(
+            {
+                "enabled": False,
+                "path": f"{name}_cache.db",
+                "ttl": 7 * 24 * 60 * 60,
+                "max_size": 256,
+            }
+        )
+
+    @cached_property
+    def response_cache(self) -> ResponseCache | None:
+        if (view := self.cache_config()) is None or not view["enabled"].get(
+            bool
+        ):
+            return None
+
+        return ResponseCache.open(
+            view["path"].get(confuse.Filename(in_app_dir=True)),
+            view["max_size"].as_number() * 1024 * 1024,
+        )
+
     def status_to_error(
         self, code: int
     ) -> type[requests.exceptions.HTTPError] | None:
@@ -208,8 +354,53 @@ class RequestHandler:
         HTTP errors to beets-specific exceptions through the error handler.
         """
         with self.handle_http_error():
+            if (cache := self.response_cache) is not None:
+                return self._cached_request(cache, *args, **kwargs)
             return self.session.request(*args, **kwargs)
 
+    def _cached_request(
+        self, cache: ResponseCache, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Serve a GET request from the response cache while it is fresh,
+        and revalidate it with the server once it is not.
+
+        Authenticated requests, and those of other methods, are sent as is.
+        """
+        if method.lower() != "get" or self._is_authenticated(kwargs):
+            return self.session.request(method, url, **kwargs)
+
+        key = cache.key(method, url, kwargs.get("params"))
+        ttl = self.cache_config()["ttl"].as_number()  # type: ignore[index]
+        if cached := cache.get(key):
+            if time.time() - cached.stored_at < ttl:
+                return cached.response
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **cached.validators,
+            }
+
+        response = self.session.request(method, url, **kwargs)
+        if cached and response.status_code == HTTPStatus.NOT_MODIFIED:
+            cache.refresh(key)
+            return cached.response
+        if response.status_code == HTTPStatus.OK and "no-store" not in (
+            response.headers.get("Cache-Control", "")
+        ):
+            cache.store(key, response)
+        return response
+
+    def _is_authenticated(self, kwargs: dict[str, Any]) -> bool:
+        """Whether a request sent with `kwargs` carries credentials, either
+        of its own or from the session.
+        """
+        if kwargs.get("auth") or self.session.auth:
+            return True
+        headers = {**self.session.headers, **(kwargs.get("headers") or {})}
+        return any(
+            name.lower() == "authorization" and value
+            for name, value in headers.items()
+        )
+
     def get(self, *args, **kwargs) -> requests.Response:
         """Perform HTTP GET request with automatic error handling."""
         return self.request("get", *args, **kwargs)
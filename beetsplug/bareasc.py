@@ -26,6 +26,9 @@ class BareascCLIOpts(Protocol):
 class BareascQuery(StringFieldQuery[str]):
     """Compare items using bare ASCII, without accents etc."""
 
+    flex_col_clause = True
+    fts_match = "ascii"
+
     @classmethod
     def string_match(cls, pattern, val):
         """Convert both pattern and string to plain ASCII before matching.
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import cProfile
+import itertools
+import os
+import tempfile
+import threading
+import time
 import timeit
 from typing import TYPE_CHECKING, Protocol
 
-from beets import importer, plugins, ui
+from beets import config, importer, library, plugins, ui
 from beets.autotag import Source, tag_album
+from beets.autotag.distance import string_dist_cache_info
 from beets.plugins import BeetsPlugin
 from beets.util.pathformats import PF_KEY_DEFAULT
 from beetsplug._utils import vfs
@@ -27,6 +33,11 @@ class BenchMatch(Protocol):
     id: str | None
 
 
+class BenchConcurrency(Protocol):
+    readers: int
+    duration: float
+
+
 def aunique_benchmark(
     lib: Library, opts: BenchAunique, args: list[str]
 ) -> None:
@@ -92,6 +103,82 @@ def match_benchmark(lib: Library, opts: BenchMatch, args: list[str]) -> None:
         interval = timeit.timeit(_run_match, number=1)
         print("match duration:", interval)
 
+    for name, info in string_dist_cache_info().items():
+        print(f"string distance cache ({name}):", info)
+
+
+def _run_concurrently(
+    lib: Library, query: list[str], readers: int, duration: float
+) -> tuple[int, float, int]:
+    """Query `lib` from `readers` threads while another thread stores
+    items. Return the number of completed queries, the duration of the
+    slowest one and the number of completed stores.
+    """
+    items = list(lib.items())
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    slowest = 0.0
+    counts_lock = threading.Lock()
+
+    def _read():
+        nonlocal slowest
+        while not stop.is_set():
+            start = time.perf_counter()
+            list(lib.items(query))
+            elapsed = time.perf_counter() - start
+            with counts_lock:
+                counts["reads"] += 1
+                slowest = max(slowest, elapsed)
+
+    def _write():
+        for i, item in enumerate(itertools.cycle(items)):
+            if stop.is_set():
+                break
+            item["bench_write"] = i
+            item.store()
+            with counts_lock:
+                counts["writes"] += 1
+
+    threads = [threading.Thread(target=_read) for _ in range(readers)]
+    threads.append(threading.Thread(target=_write))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    lib._close()
+    return counts["reads"], slowest, counts["writes"]
+
+
+def concurrency_benchmark(
+    lib: Library, opts: BenchConcurrency, args: list[str]
+) -> None:
+    if not len(lib.items()):
+        raise ui.UserError("the library is empty")
+
+    # Work on copies of the library, since the benchmark writes to it and
+    # the journal mode is stored in the database file.
+    original_wal = config["wal"].get()
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for wal in (False, True):
+                path = os.path.join(tmpdir, f"wal-{wal}.db")
+                lib.create_backup(path)
+                config["wal"].set(wal)
+                copy = library.Library(path, lib.directory, set_music_dir=False)
+                reads, slowest, writes = _run_concurrently(
+                    copy, args, opts.readers, opts.duration
+                )
+                print(
+                    f"{'With' if wal else 'Without'} WAL:",
+                    f"{reads / opts.duration:.1f} queries/s",
+                    f"(slowest: {slowest:.3f}s),",
+                    f"{writes / opts.duration:.1f} stores/s",
+                )
+    finally:
+        config["wal"].set(original_wal)
+
 
 class BenchmarkPlugin(BeetsPlugin):
     """A plugin for performing some simple performance benchmarks."""
@@ -124,4 +211,24 @@ class BenchmarkPlugin(BeetsPlugin):
         )
         match_bench_cmd.func = match_benchmark
 
-        return [aunique_bench_cmd, match_bench_cmd]
+        concurrency_bench_cmd = ui.Subcommand(
+            "bench_concurrency",
+            help="benchmark for queries during concurrent writes",
+        )
+        concurrency_bench_cmd.parser.add_option(
+            "-r",
+            "--readers",
+            type="int",
+            default=4,
+            help="number of querying threads",
+        )
+        concurrency_bench_cmd.parser.add_option(
+            "-d",
+            "--duration",
+            type="float",
+            default=5.0,
+            help="seconds to run each benchmark for",
+        )
+        concurrency_bench_cmd.func = concurrency_benchmark
+
+        return [aunique_bench_cmd, match_bench_cmd, concurrency_bench_cmd]
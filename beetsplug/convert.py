@@ -26,6 +26,8 @@ from beets.util.pathformats import get_path_formats
 from beetsplug._utils import art
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from beets.importer import ImportSession, ImportTask
     from beets.library import Album, Library
     from beets.util.pathformats import PathFormat
@@ -310,7 +312,10 @@ class ConvertPlugin(BeetsPlugin):
             # Filter items based on should_transcode function
             items = [item for item in items if self.should_transcode(item)]
 
-            self._parallel_convert(items, keep_new=False)
+            destinations = self.compute_destinations(session.lib, items)
+            self._parallel_convert(
+                items, keep_new=False, destinations=destinations
+            )
 
     # Utilities converted from functions to methods on logging overhaul
 
@@ -398,13 +403,30 @@ class ConvertPlugin(BeetsPlugin):
             return True
         return self.fmt != item.format.lower()
 
-    def get_item_destination(self, item: Item) -> bytes:
+    def get_item_destination(
+        self, item: Item, destinations: Mapping[int, bytes] | None = None
+    ) -> bytes:
+        if destinations and (dest := destinations.get(item.id)) is not None:
+            return dest
         return item.destination(
             basedir=self.dest, path_formats=self.path_formats
         )
 
+    def compute_destinations(
+        self, lib: Library, items: list[Item]
+    ) -> dict[int, bytes]:
+        """Compute the destinations of `items` together, so that converting
+        them does not compute them one by one. Return them by item id.
+        """
+        destinations = lib.destinations(
+            items, basedir=self.dest, path_formats=self.path_formats
+        )
+        return dict(zip((i.id for i in items), destinations))
+
     @pipeline.mutator_stage
-    def convert_item(self, keep_new: bool, item: Item) -> None:
+    def convert_item(
+        self, keep_new: bool, destinations: Mapping[int, bytes], item: Item
+    ) -> None:
         """Convert an Item from the library."""
         pretend, link, hardlink, refresh = (
             self.pretend,
@@ -414,7 +436,7 @@ class ConvertPlugin(BeetsPlugin):
         )
         command, ext = self.command
 
-        dest = self.get_item_destination(item)
+        dest = self.get_item_destination(item, destinations)
 
         # Ensure that desired item is readable before processing it. Needed
         # to avoid any side-effect of the conversion (linking, keep_new,
@@ -572,7 +594,9 @@ class ConvertPlugin(BeetsPlugin):
                 "after_convert", item=item, dest=converted, keepnew=False
             )
 
-    def copy_album_art(self, album: Album) -> None:
+    def copy_album_art(
+        self, album: Album, destinations: Mapping[int, bytes] | None = None
+    ) -> None:
         """Copies or converts the associated cover art of the album. Album must
         have at least one track.
         """
@@ -594,7 +618,7 @@ class ConvertPlugin(BeetsPlugin):
 
         # Get the destination of the first item (track) of the album, we use
         # this function to format the path accordingly to path_formats.
-        dest = self.get_item_destination(album_item)
+        dest = self.get_item_destination(album_item, destinations)
 
         # Remove item from the path.
         dest = os.path.join(*util.components(dest)[:-1])
@@ -679,9 +703,11 @@ class ConvertPlugin(BeetsPlugin):
         if not (pretend or opts.yes or ui.input_yn("Convert? (Y/n)")):
             return
 
+        destinations = self.compute_destinations(lib, items)
+
         if opts.album and self.config["copy_album_art"]:
             for album in albums:
-                self.copy_album_art(album)
+                self.copy_album_art(album, destinations)
 
         # If the user supplied a playlist name, create a playlist for files
         # copied to the destination.
@@ -693,7 +719,7 @@ class ConvertPlugin(BeetsPlugin):
             pl_dir = os.path.dirname(pl_normpath)
             items_paths = []
             for item in items:
-                item_path = self.get_item_destination(item)
+                item_path = self.get_item_destination(item, destinations)
 
                 # When keeping new files in the library, destination paths
                 # keep original files and extensions.
@@ -703,7 +729,9 @@ class ConvertPlugin(BeetsPlugin):
                 items_paths.append(os.path.relpath(item_path, pl_dir))
 
         self._parallel_convert(
-            items, keep_new=self.config["keep_new"].get(bool)
+            items,
+            keep_new=self.config["keep_new"].get(bool),
+            destinations=destinations,
         )
 
         if playlist:
@@ -778,9 +806,17 @@ class ConvertPlugin(BeetsPlugin):
                     util.remove(path)
                 _temp_files.remove(path)
 
-    def _parallel_convert(self, items: list[Item], keep_new: bool):
+    def _parallel_convert(
+        self,
+        items: list[Item],
+        keep_new: bool,
+        destinations: Mapping[int, bytes],
+    ):
         """Run the convert_item function for every items on as many thread as
         defined in threads
         """
-        convert = [self.convert_item(keep_new) for _ in range(self.threads)]
+        convert = [
+            self.convert_item(keep_new, destinations)
+            for _ in range(self.threads)
+        ]
         pipeline.Pipeline([iter(items), convert]).run_parallel()
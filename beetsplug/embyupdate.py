@@ -19,7 +19,7 @@ import requests
 from beets.plugins import BeetsPlugin
 
 if TYPE_CHECKING:
-    from beets.library import LibModel, Library
+    from beets.library import Library
 
 
 def api_url(host, port, endpoint):
@@ -158,8 +158,11 @@ class EmbyUpdate(BeetsPlugin):
         self.config["apikey"].redact = True
 
         self.register_listener("database_change", self.listen_for_db_change)
+        self.register_listener(
+            "database_bulk_change", self.listen_for_db_change
+        )
 
-    def listen_for_db_change(self, lib: Library, model: LibModel) -> None:
+    def listen_for_db_change(self, lib: Library) -> None:
         """Listens for beets db change and register the update for the end."""
         self.register_listener("cli_exit", self.update)
 
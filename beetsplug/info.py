@@ -71,7 +71,11 @@ def tag_data_emitter(path):
 
 
 def library_data(lib, args, album=False):
-    for item in lib.albums(args) if album else lib.items(args):
+    if album:
+        objs = lib.albums(args, stream=True)
+    else:
+        objs = lib.items(args, stream=True, with_albums=True)
+    for item in objs:
         yield library_data_emitter(item)
 
 
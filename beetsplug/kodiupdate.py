@@ -18,7 +18,7 @@ import requests
 from beets.plugins import BeetsPlugin
 
 if TYPE_CHECKING:
-    from beets.library import LibModel, Library
+    from beets.library import Library
 
 
 def update_kodi(host, port, user, password):
@@ -49,8 +49,11 @@ class KodiUpdate(BeetsPlugin):
         self.config["user"].redact = True
         self.config["pwd"].redact = True
         self.register_listener("database_change", self.listen_for_db_change)
+        self.register_listener(
+            "database_bulk_change", self.listen_for_db_change
+        )
 
-    def listen_for_db_change(self, lib: Library, model: LibModel) -> None:
+    def listen_for_db_change(self, lib: Library) -> None:
         """Listens for beets db change and register the update"""
         self.register_listener("cli_exit", self.update)
 
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 class MBSyncCLIOpts(Protocol):
     move: bool | None
+    jobs: int
     pretend: bool | None
     write: bool | None
 
@@ -53,18 +54,27 @@ class MBSyncPlugin(BeetsPlugin):
             dest="write",
             help="don't write updated metadata to files",
         )
+        cmd.parser.add_option(
+            "-j",
+            "--jobs",
+            type="int",
+            default=1,
+            help="number of threads writing the files of an album",
+        )
         cmd.parser.add_format_option()
         cmd.func = self.func
         return [cmd]
 
     def func(self, lib: Library, opts: MBSyncCLIOpts, args: list[str]) -> None:
         """Command handler for the mbsync function."""
+        if opts.jobs < 1:
+            raise ui.UserError("the number of jobs must be at least 1")
         move = ui.should_move(opts.move)
         pretend = opts.pretend
         write = ui.should_write(opts.write)
 
         self.singletons(lib, args, move, pretend, write)
-        self.albums(lib, args, move, pretend, write)
+        self.albums(lib, args, move, pretend, write, opts.jobs)
 
     def singletons(self, lib, query, move, pretend, write):
         """Retrieve and apply info from the autotagger for items matched by
@@ -88,13 +98,13 @@ class MBSyncPlugin(BeetsPlugin):
                 continue
 
             # Apply.
-            with lib.transaction():
+            with lib.bulk():
                 TrackMatch(Distance(), track_info, item).apply_metadata(
                     from_scratch=False
                 )
                 apply_item_changes(lib, item, move, pretend, write)
 
-    def albums(self, lib, query, move, pretend, write):
+    def albums(self, lib, query, move, pretend, write, jobs=1):
         """Retrieve and apply info from the autotagger for albums matched by
         query and their items.
         """
@@ -156,28 +166,31 @@ class MBSyncPlugin(BeetsPlugin):
 
             # Apply.
             self._log.debug("applying changes to {}", album)
-            with lib.transaction():
+            with lib.bulk():
                 AlbumMatch(
                     Distance(), album_info, dict(item_info_pairs)
                 ).apply_metadata(from_scratch=False)
-                changed = False
-                # Find any changed item to apply changes to album.
-                any_changed_item = items[0]
-                for item in items:
-                    item_changed = ui.show_model_changes(item)
-                    changed |= item_changed
-                    if item_changed:
-                        any_changed_item = item
-                        apply_item_changes(lib, item, move, pretend, write)
-
-                if not changed:
+                # Find the changed items to apply their changes to album.
+                changed_items = [
+                    item for item in items if ui.show_model_changes(item)
+                ]
+                if not changed_items:
                     # No change to any item.
                     continue
 
                 if not pretend:
+                    # Move the items and write their files, several at
+                    # once, before storing them.
+                    for item in changed_items:
+                        if move and lib.directory in util.ancestry(item.path):
+                            item.move(with_album=False)
+                    if write:
+                        lib.try_write_many(changed_items, jobs)
+                    lib.store_many(changed_items)
+
                     # Update album structure to reflect an item in it.
                     for key in library.Album.item_keys:
-                        album[key] = any_changed_item[key]
+                        album[key] = changed_items[-1][key]
                     album.store()
 
                     # Move album art (and any inconsistent items).
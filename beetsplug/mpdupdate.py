@@ -17,7 +17,7 @@ from beets import config
 from beets.plugins import BeetsPlugin
 
 if TYPE_CHECKING:
-    from beets.library import LibModel, Library
+    from beets.library import Library
 
 
 # No need to introduce a dependency on an MPD library for such a
@@ -73,8 +73,9 @@ class MPDUpdatePlugin(BeetsPlugin):
                 config["mpd"][key] = self.config[key].get()
 
         self.register_listener("database_change", self.db_change)
+        self.register_listener("database_bulk_change", self.db_change)
 
-    def db_change(self, lib: Library, model: LibModel) -> None:
+    def db_change(self, lib: Library) -> None:
         self.register_listener("cli_exit", self.update)
 
     def update(self, lib: Library) -> None:
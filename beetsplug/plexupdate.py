@@ -20,7 +20,7 @@ from beets import config
 from beets.plugins import BeetsPlugin
 
 if TYPE_CHECKING:
-    from beets.library import LibModel, Library
+    from beets.library import Library
 
 
 def get_music_section(
@@ -92,8 +92,11 @@ class PlexUpdate(BeetsPlugin):
 
         config["plex"]["token"].redact = True
         self.register_listener("database_change", self.listen_for_db_change)
+        self.register_listener(
+            "database_bulk_change", self.listen_for_db_change
+        )
 
-    def listen_for_db_change(self, lib: Library, model: LibModel) -> None:
+    def listen_for_db_change(self, lib: Library) -> None:
         """Listens for beets db change and register the update for the end"""
         self.register_listener("cli_exit", self.update)
 
@@ -82,6 +82,7 @@ class SmartPlaylistPlugin(plugins.BeetsPlugin):
 
         if self.config["auto"]:
             self.register_listener("database_change", self.db_change)
+            self.register_listener("database_bulk_change", self.db_bulk_change)
 
     @cached_property
     def prefix(self) -> bytes:
@@ -300,6 +301,10 @@ class SmartPlaylistPlugin(plugins.BeetsPlugin):
 
         self._unmatched_playlists -= self._matched_playlists
 
+    def db_bulk_change(self, lib: Library, models: list[LibModel]) -> None:
+        for model in models:
+            self.db_change(lib, model)
+
     @staticmethod
     def get_queries(
         query: PlaylistQueryAndSort,
@@ -11,15 +11,18 @@ import soco
 from beets.plugins import BeetsPlugin
 
 if TYPE_CHECKING:
-    from beets.library import LibModel, Library
+    from beets.library import Library
 
 
 class SonosUpdate(BeetsPlugin):
     def __init__(self) -> None:
         super().__init__()
         self.register_listener("database_change", self.listen_for_db_change)
+        self.register_listener(
+            "database_bulk_change", self.listen_for_db_change
+        )
 
-    def listen_for_db_change(self, lib: Library, model: LibModel) -> None:
+    def listen_for_db_change(self, lib: Library) -> None:
         """Listens for beets db change and register the update"""
         self.register_listener("cli_exit", self.update)
 
@@ -28,7 +28,7 @@ import requests
 from beets.plugins import BeetsPlugin
 
 if TYPE_CHECKING:
-    from beets.library import LibModel, Library
+    from beets.library import Library
 
 
 __author__ = "https://github.com/maffo999"
@@ -49,9 +49,10 @@ class SubsonicUpdate(BeetsPlugin):
         self.config["user"].redact = True
         self.config["pass"].redact = True
         self.register_listener("database_change", self.db_change)
+        self.register_listener("database_bulk_change", self.db_change)
         self.register_listener("smartplaylist_update", self.spl_update)
 
-    def db_change(self, lib: Library, model: LibModel) -> None:
+    def db_change(self, lib: Library) -> None:
         self.register_listener("cli_exit", self.start_scan)
 
     def spl_update(self) -> None:
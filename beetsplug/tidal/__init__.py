@@ -83,6 +83,7 @@ class TidalPlugin(MetadataSourcePlugin):
         self.config.add(
             {"client_id": "mcjmpl1bPATJXcBT", "tokenfile": "tidal_token.json"}
         )
+        TidalAPI.add_cache_config(self.config["http_cache"], "tidal")
         self.config["client_id"].redact = True
 
         # We need to be authenticated if plugin is used to fetch metadata
@@ -94,6 +95,7 @@ class TidalPlugin(MetadataSourcePlugin):
         return TidalAPI(
             client_id=self.config["client_id"].as_str(),
             token_path=self._tokenfile(),
+            cache_config=self.config["http_cache"],
         )
 
     def _tokenfile(self) -> str:
@@ -15,6 +15,8 @@ from beetsplug.tidal.session import TidalSession
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    import confuse
+
     from .api_types import (
         AlbumDocument,
         Document,
@@ -40,14 +42,23 @@ def _batched(iterable: Iterable[T], n: int) -> Iterable[list[T]]:
 
 
 class TidalAPI(RequestHandler):
-    def __init__(self, client_id: str, token_path: str) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        token_path: str,
+        cache_config: confuse.ConfigView | None = None,
+    ) -> None:
         self.client_id = client_id
         self.token_path = token_path
+        self._cache_config = cache_config
 
     @cached_property
     def session(self) -> TidalSession:
         return TidalSession(self.client_id, self.token_path)
 
+    def cache_config(self) -> confuse.ConfigView | None:
+        return self._cache_config
+
     def search_results(
         self,
         query: str,
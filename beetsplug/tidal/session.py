@@ -54,6 +54,7 @@ class TidalSession(OAuth2Session, TimeoutAndRetrySession):
         retry = Retry(
             total=6,
             backoff_factor=0.5,
+            respect_retry_after_header=False,
             status_forcelist=[
                 HTTPStatus.INTERNAL_SERVER_ERROR,
                 HTTPStatus.BAD_GATEWAY,
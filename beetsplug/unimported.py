@@ -39,9 +39,10 @@ class Unimported(BeetsPlugin):
                 for x in self.config["ignore_subdirectories"].as_str_seq()
             ]
             in_folder = set()
-            for root, _, files in os.walk(lib.directory):
+            for root, dirs, files in os.walk(lib.directory):
                 # do not traverse if root is a child of an ignored directory
                 if any(root.startswith(ignored) for ignored in ignore_dirs):
+                    dirs.clear()
                     continue
                 for file in files:
                     # ignore files with ignored extensions
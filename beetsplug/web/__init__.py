@@ -306,7 +306,7 @@ def get_item(id_):
 @app.route("/item/query/")
 @resource_list("items")
 def all_items():
-    return g.lib.items()
+    return g.lib.items(stream=True, with_albums=True)
 
 
 @app.route("/item/<int:item_id>/file")
@@ -332,7 +332,9 @@ def item_file(item_id):
 @app.route("/item/query/<query:queries>", methods=["GET", "DELETE", "PATCH"])
 @resource_query("items", patchable=True)
 def item_query(queries):
-    return g.lib.items(queries)
+    # Only stream reads: DELETE and PATCH modify the rows being iterated.
+    reading = get_method() == "GET"
+    return g.lib.items(queries, stream=reading, with_albums=reading)
 
 
 @app.route("/item/path/<everything:path>")
@@ -369,13 +371,13 @@ def get_album(id_):
 @app.route("/album/query/")
 @resource_list("albums")
 def all_albums():
-    return g.lib.albums()
+    return g.lib.albums(stream=True)
 
 
 @app.route("/album/query/<query:queries>", methods=["GET", "DELETE"])
 @resource_query("albums")
 def album_query(queries):
-    return g.lib.albums(queries)
+    return g.lib.albums(queries, stream=get_method() == "GET")
 
 
 @app.route("/album/<int:album_id>/art")
@@ -1,4 +1,5 @@
 import re
+import sys
 
 import pytest
 
@@ -11,6 +12,11 @@ from beets.autotag import (
     string_dist,
     track_distance,
 )
+from beets.autotag.distance import (
+    string_dist_cache_clear,
+    string_dist_cache_info,
+    track_distance_matrix,
+)
 from beets.library import Item
 from beets.metadata_plugins import MetadataSourcePlugin, get_penalty
 from beets.plugins import BeetsPlugin
@@ -171,6 +177,29 @@ class TestTrackDistance:
         assert bool(dist) == expected_penalty, dist._penalties
 
 
+def test_track_distance_matrix_matches_track_distance():
+    items = [
+        Item(title="one", track=1, disc=1, length=180.0),
+        Item(title="Two (Live)", track=2, disc=1, length=200.5),
+        Item(title="the three", track=3, disc=2, length=61.0, mb_trackid="t3"),
+        Item(title="four", track=0, disc=0, length=0.0, data_source="Other"),
+        Item(title="", length=500.0),
+    ]
+    tracks = [
+        TrackInfo(title="One", index=1, medium_index=1, medium=1, length=181),
+        TrackInfo(title="two", index=2, medium_index=2, medium=1, length=None),
+        TrackInfo(title="three, the", index=3, medium_index=1, medium=2, track_id="t3"),
+        TrackInfo(title="Four [Remix]", index=4, length=300.0, track_id="t4"),
+        TrackInfo(title=None, index=None, data_source="Other"),
+    ]  # fmt: skip
+
+    matrix = track_distance_matrix(items, tracks)
+
+    assert matrix.tolist() == [
+        [track_distance(i, t).distance for t in tracks] for i in items
+    ]
+
+
 class TestAlbumDistance:
     @pytest.fixture(scope="class")
     def items(self):
@@ -323,6 +352,35 @@ class TestStringDistance:
         string_dist("(EP)", "(EP)")
         string_dist(", An", "")
 
+    def test_repeated_pairs_hit_cache(self):
+        string_dist_cache_clear()
+        first = string_dist("Some Song (Live)", "some song")
+        second = string_dist("Some Song (Live)", "some song")
+
+        assert first == second
+        info = string_dist_cache_info()
+        assert info["pairs"].hits == 1
+        assert info["pairs"].misses == 1
+        assert info["normalized"].hits == 2
+
+    def test_changed_parameters_are_used(self, monkeypatch):
+        assert string_dist("Rock & Roll", "Rock and Roll") == 0.0
+
+        module = sys.modules[string_dist.__module__]
+        monkeypatch.setattr(module, "SD_REPLACE", [])
+        assert string_dist("Rock & Roll", "Rock and Roll") > 0.0
+
+    def test_changed_parameters_are_used_by_matrix(self, monkeypatch):
+        items = [Item(title="Rock & Roll")]
+        tracks = [TrackInfo(title="Rock and Roll")]
+        assert track_distance_matrix(items, tracks)[0, 0] == 0.0
+
+        module = sys.modules[string_dist.__module__]
+        monkeypatch.setattr(module, "SD_REPLACE", [])
+        distance = track_distance(items[0], tracks[0]).distance
+        assert distance > 0.0
+        assert track_distance_matrix(items, tracks)[0, 0] == distance
+
 
 class TestDataSourceDistance:
     MATCH = 0.0
@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import threading
 import unittest
 from pathlib import Path
 from tempfile import mkstemp
@@ -223,6 +224,51 @@ class TransactionTest(unittest.TestCase):
         assert self.db.revision == old_rev
 
 
+class TestWAL:
+    @pytest.fixture
+    def db(self, tmp_path):
+        db = DatabaseFixture1(tmp_path / "library.db", wal=True)
+        yield db
+        db._close()
+
+    def test_enabled(self, db):
+        assert db.wal
+        with db.transaction() as tx:
+            assert tx.query("PRAGMA journal_mode")[0][0] == "wal"
+
+    def test_unsupported_for_memory_database(self):
+        db = DatabaseFixture1(":memory:", wal=True)
+        assert not db.wal
+        db._close()
+
+    def test_only_writes_take_lock(self, db):
+        with db.transaction() as tx:
+            tx.query("SELECT * FROM test")
+            assert not db._db_lock.locked()
+
+            with db.transaction() as nested_tx:
+                nested_tx.mutate("INSERT INTO test (field_one) VALUES (1)")
+            assert db._db_lock.locked()
+        assert not db._db_lock.locked()
+
+    def test_read_during_write(self, db):
+        rows = []
+
+        def read():
+            with db.transaction() as tx:
+                rows.extend(tx.query("SELECT * FROM test"))
+
+        with db.transaction() as tx:
+            tx.mutate("INSERT INTO test (field_one) VALUES (1)")
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+
+        # The reader does not see the uncommitted row.
+        assert rows == []
+
+
 class ModelTest(unittest.TestCase):
     def setUp(self):
         self.db = DatabaseFixture1(":memory:")
@@ -609,6 +655,113 @@ class ResultsIteratorTest(unittest.TestCase):
         )
 
 
+class StreamingResultsTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseFixture1(":memory:")
+        for i in range(7):
+            model = ModelFixture1()
+            model.field_one = i
+            if i % 2:
+                model["foo"] = f"odd{i}"
+            model.add(self.db)
+
+    def tearDown(self):
+        self.db._connection().close()
+
+    def test_returns_streaming_results(self):
+        objs = self.db._get_results(ModelFixture1, stream=True)
+        assert isinstance(objs, dbcore.db.StreamingResults)
+
+    def test_matches_eager_results(self):
+        eager = self.db._get_results(ModelFixture1)
+        streamed = self.db._get_results(ModelFixture1, stream=True)
+        assert [dict(o) for o in streamed] == [dict(o) for o in eager]
+
+    def test_flex_attrs_across_chunks(self):
+        with unittest.mock.patch.object(
+            dbcore.db.StreamingResults, "CHUNK_SIZE", 2
+        ):
+            objs = list(self.db._get_results(ModelFixture1, stream=True))
+        assert [o.get("foo") for o in objs] == [
+            None,
+            "odd1",
+            None,
+            "odd3",
+            None,
+            "odd5",
+            None,
+        ]
+
+    def test_sorted(self):
+        s = sort.FixedFieldSort("field_one", ascending=False)
+        objs = self.db._get_results(ModelFixture1, sort=s, stream=True)
+        assert [o.field_one for o in objs] == [6, 5, 4, 3, 2, 1, 0]
+        assert "foo" not in objs[0]
+        assert objs[1].foo == "odd5"
+
+    def test_length_before_iteration(self):
+        q = query.NumericQuery("field_one", "2..")
+        objs = self.db._get_results(ModelFixture1, q, stream=True)
+        assert len(objs) == 5
+
+    def test_slow_query(self):
+        q = query.SubstringQuery("foo", "odd", False)
+        objs = self.db._get_results(ModelFixture1, q, stream=True)
+        assert len(objs) == 3
+        assert [o.field_one for o in objs] == [1, 3, 5]
+
+    def test_concurrent_iterators(self):
+        results = self.db._get_results(ModelFixture1, stream=True)
+        it1 = iter(results)
+        it2 = iter(results)
+        next(it1)
+        list(it2)
+        assert len(list(it1)) == 6
+
+    def test_prefetch_chunks(self):
+        chunks = []
+        q = query.SubstringQuery("foo", "odd", False)
+        with unittest.mock.patch.object(
+            dbcore.db.StreamingResults, "CHUNK_SIZE", 2
+        ):
+            objs = self.db._get_results(ModelFixture1, q, stream=True)
+            objs.prefetch(lambda chunk: chunks.append([o.id for o in chunk]))
+            ids = [o.id for o in objs]
+
+        assert chunks == [ids[:2], ids[2:]]
+        assert [o.id for o in objs] == ids
+
+    def test_write_while_streaming(self):
+        fd, path = mkstemp(suffix=".db")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        db = DatabaseFixture1(path, timeout=0.1)
+        for i in range(5):
+            ModelFixture1(field_one=i).add(db)
+
+        errors = []
+
+        def write():
+            try:
+                ModelFixture1(field_one=5).add(db)
+                with db.transaction() as tx:
+                    tx.mutate("DELETE FROM test WHERE field_one = 4")
+            except Exception as exc:
+                errors.append(exc)
+
+        with unittest.mock.patch.object(
+            dbcore.db.StreamingResults, "CHUNK_SIZE", 2
+        ):
+            objs = iter(db._get_results(ModelFixture1, stream=True))
+            assert next(objs).field_one == 0
+            writer = threading.Thread(target=write)
+            writer.start()
+            writer.join()
+            assert not errors
+            assert [o.field_one for o in objs] == [1, 2, 3]
+        db._close()
+
+
 class TestException:
     @pytest.mark.parametrize("model", [DatabaseFixture1])
     @pytest.mark.filterwarnings(
@@ -8,12 +8,13 @@ from pathlib import Path
 
 import pytest
 
-from beets import util
+from beets import context, util
 from beets.dbcore import AndQuery, MatchQuery, OrQuery, types
 from beets.dbcore.query import (
     BooleanQuery,
     DateQuery,
     FalseQuery,
+    FullTextQuery,
     InQuery,
     NoneQuery,
     NotQuery,
@@ -26,7 +27,7 @@ from beets.dbcore.query import (
     SubstringQuery,
     TrueQuery,
 )
-from beets.library import Item
+from beets.library import Item, Library, parse_query_string
 from beets.test import _common
 
 # Because the absolute path begins with something like C:, we
@@ -514,6 +515,137 @@ class TestQuery:
         assert {i.title for i in lib.items(q)} == expected_titles
 
 
+class TestFlexFieldQuery:
+    """Queries and sorts on flexible attributes are evaluated in SQL."""
+
+    @pytest.fixture(scope="class")
+    def lib(self, helper):
+        album = helper.add_album(title="album item")
+        album.albumflex = "album value"
+        album.store()
+        helper.add_item(title="ten", play_count=10, tag="Rock")
+        helper.add_item(title="nine", play_count=9, tag="pop")
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(Item, "_types", {"play_count": types.Integer()})
+            yield helper.lib
+
+    @pytest.mark.parametrize(
+        "q, expected_titles",
+        [
+            ("play_count:10..", {"ten"}),
+            ("play_count:..9", {"nine"}),
+            ("play_count:9", {"nine"}),
+            ("tag:rock", {"ten"}),
+            ("tag::^p", {"nine"}),
+            ("tag:=~ROCK", {"ten"}),
+            ("-tag:rock", {"nine", "album item"}),
+            ("albumflex:value", {"album item"}),
+            ("missing::^$", {"ten", "nine", "album item"}),
+        ],
+    )
+    def test_query(self, lib, q, expected_titles):
+        query, _ = parse_query_string(q, Item)
+
+        assert query.clause()[0]
+        assert {i.title for i in lib.items(query)} == expected_titles
+        assert {i.title for i in lib.items() if query.match(i)} == (
+            expected_titles
+        )
+
+    def test_computed_field_query_is_slow(self, lib):
+        query, _ = parse_query_string("filesize:0", Item)
+
+        assert query.clause()[0] is None
+
+    def test_sort(self, lib):
+        titles = [i.title for i in lib.items("play_count-")]
+
+        assert titles[:2] == ["ten", "nine"]
+
+
+class TestSearchIndex:
+    """Keyword and substring queries look up candidates in the full-text
+    search index.
+    """
+
+    @pytest.fixture(
+        scope="class", params=[False, True], ids=["plain", "asciify"]
+    )
+    def lib(self, request, helper):
+        helper.config["search_index"]["enabled"] = True
+        helper.config["search_index"]["asciify"] = request.param
+        lib = Library(
+            helper.temp_path / f"index{request.param}.db", str(helper.lib_path)
+        )
+        for title, artist in [
+            ("Hey Jude", "The Beatles"),
+            ("Jóga", "Björk"),
+            ('Say "Hi"', "Quoted"),
+        ]:
+            lib.add(Item(title=title, artist=artist, album=f"{title} album"))
+        return lib
+
+    @pytest.mark.parametrize(
+        "q, expected_titles",
+        [
+            _p("beat", {"Hey Jude"}, id="keyword"),
+            _p("BEATLES", {"Hey Jude"}, id="keyword-ignores-case"),
+            _p("jör", {"Jóga"}, id="keyword-non-ascii"),
+            _p("album", {"Hey Jude", "Jóga", 'Say "Hi"'}, id="any-field"),
+            _p('"Hi"', {'Say "Hi"'}, id="double-quotes"),
+            _p("title:jude", {"Hey Jude"}, id="field"),
+            _p("artist:jude", set(), id="other-field"),
+            _p("-title:jude", {"Jóga", 'Say "Hi"'}, id="negated"),
+            _p("ey", {"Hey Jude"}, id="too-short"),
+        ],
+    )
+    def test_query(self, lib, q, expected_titles):
+        assert {i.title for i in lib.items(q)} == expected_titles
+
+    @pytest.mark.parametrize(
+        "q, indexed",
+        [
+            ("beat", True),
+            ("title:jude", True),
+            ("ey", False),
+            ("title::jude", False),
+            ("year:2001", False),
+        ],
+    )
+    def test_uses_index(self, lib, q, indexed):
+        with context.search_index(lib.search_index):
+            query, _ = parse_query_string(q, Item)
+
+        assert isinstance(query.subqueries[0], FullTextQuery) == indexed
+
+    def test_store_and_remove(self, lib):
+        item = lib.add(Item(title="Abbey Road", artist="Nobody"))
+        assert {i.title for i in lib.items("nobody")} == {"Abbey Road"}
+
+        item = lib.get_item(item)
+        item.artist = "Somebody"
+        item.store()
+        assert not lib.items("nobody")
+        assert lib.items("somebody")
+
+        item.remove()
+        assert not lib.items("somebody")
+
+    def test_disabling_drops_index(self, lib, helper):
+        path = helper.temp_path / "dropped.db"
+        Library(path, str(helper.lib_path))
+
+        helper.config["search_index"]["enabled"] = False
+        lib = Library(path, str(helper.lib_path))
+        with lib.transaction() as tx:
+            tables = {
+                row[0] for row in tx.query("SELECT name FROM sqlite_master")
+            }
+
+        assert not tables & {"items_fts", "items_fts_ascii"}
+
+
 class TestDefaultSearchFields:
     @pytest.fixture(scope="class")
     def lib(self, helper):
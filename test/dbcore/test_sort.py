@@ -8,7 +8,7 @@ import beets.library
 from beets import util
 from beets.dbcore import types
 from beets.dbcore.query import TrueQuery
-from beets.dbcore.sort import FixedFieldSort, SlowFieldSort
+from beets.dbcore.sort import FixedFieldSort, FlexFieldSort
 from beets.library import Album, Item
 from beets.test import _common
 
@@ -292,5 +292,5 @@ class TestNonExistingField:
         )
         assert len(query.subqueries) == 1
         assert isinstance(query.subqueries[0], TrueQuery)
-        assert isinstance(sort, SlowFieldSort)
+        assert isinstance(sort, FlexFieldSort)
         assert sort.field == "-bar"
@@ -1,6 +1,9 @@
+from unittest.mock import Mock
+
 import pytest
 
 from beetsplug._utils.musicbrainz import MusicBrainzAPI
+from beetsplug._utils.requests import HTTPNotFoundError
 
 
 def test_normalize_data():
@@ -139,3 +142,28 @@ def test_normalize_data():
 )
 def test_format_search_term(field, term, expected):
     assert MusicBrainzAPI.format_search_term(field, term) == expected
+
+
+def test_lookups_are_coalesced(monkeypatch):
+    api = MusicBrainzAPI()
+    get_json = Mock(side_effect=lambda url, **_: {"id": url, "title": "t"})
+    monkeypatch.setattr(api, "get_json", get_json)
+
+    work = api.get_work("w1")
+    work["title"] = "changed"
+    assert api.get_work("w1") == {"id": f"{api.api_root}/work/w1", "title": "t"}
+    assert get_json.call_count == 1
+
+    api.get_work("w1", includes=["work-rels"])
+    api.get_work("w2")
+    assert get_json.call_count == 3
+
+
+def test_failed_lookups_are_retried(monkeypatch):
+    api = MusicBrainzAPI()
+    get_json = Mock(side_effect=[HTTPNotFoundError(), {"id": "w1"}])
+    monkeypatch.setattr(api, "get_json", get_json)
+
+    with pytest.raises(HTTPNotFoundError):
+        api.get_work("w1")
+    assert api.get_work("w1") == {"id": "w1"}
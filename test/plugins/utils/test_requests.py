@@ -1,9 +1,11 @@
 from unittest.mock import MagicMock
 
+import confuse
 import pytest
 import requests
 
-from beetsplug._utils.requests import RateLimitAdapter
+from beetsplug._utils.httpcache import ResponseCache
+from beetsplug._utils.requests import RateLimitAdapter, RequestHandler
 
 
 def _prepared_request(
@@ -14,30 +16,181 @@ def _prepared_request(
 
 
 class TestRateLimitAdapter:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = MagicMock(return_value=100.0)
+        monkeypatch.setattr("beetsplug._utils.requests.time.monotonic", clock)
+        return clock
+
+    @pytest.fixture
+    def sleep_mock(self, monkeypatch):
+        sleep_mock = MagicMock()
+        monkeypatch.setattr("beetsplug._utils.requests.time.sleep", sleep_mock)
+        return sleep_mock
+
+    @pytest.fixture
+    def send_mock(self, monkeypatch):
+        send_mock = MagicMock(return_value=_response(b"ok"))
+        monkeypatch.setattr(
+            "beetsplug._utils.requests.HTTPAdapter.send", send_mock
+        )
+        return send_mock
+
     @pytest.mark.parametrize(
-        "last_request_time, now, expected_sleep",
-        [(100.0, 100.0, 0.25), (100.0, 100.1, 0.15)],
+        "now, expected_sleep", [(100.0, 0.25), (100.1, 0.15)]
     )
     def test_send_sleeps_for_remaining_time(
-        self, monkeypatch, last_request_time, now, expected_sleep
+        self, clock, sleep_mock, send_mock, now, expected_sleep
     ):
         adapter = RateLimitAdapter(rate_limit=0.25)
-        request = _prepared_request()
+        adapter.send(_prepared_request())
+        assert sleep_mock.call_count == 0
 
-        send_mock = MagicMock(return_value="ok")
-        monkeypatch.setattr(
-            "beetsplug._utils.requests.HTTPAdapter.send", send_mock
+        clock.return_value = now
+        adapter.send(_prepared_request())
+
+        assert sleep_mock.call_count == 1
+        assert sleep_mock.call_args.args[0] == pytest.approx(expected_sleep)
+
+    def test_burst_is_sent_without_waiting(self, clock, sleep_mock, send_mock):
+        adapter = RateLimitAdapter(rate_limit=0.25, burst=3)
+        for _ in range(3):
+            adapter.send(_prepared_request())
+        assert sleep_mock.call_count == 0
+
+        adapter.send(_prepared_request())
+        assert sleep_mock.call_args.args[0] == pytest.approx(0.25)
+
+    def test_hosts_are_limited_separately(self, clock, sleep_mock, send_mock):
+        adapter = RateLimitAdapter(rate_limit=0.25)
+        adapter.send(_prepared_request("https://example.com"))
+        adapter.send(_prepared_request("https://example.org"))
+
+        assert sleep_mock.call_count == 0
+
+    def test_too_many_requests_is_retried_after_delay(
+        self, clock, sleep_mock, send_mock
+    ):
+        send_mock.side_effect = [
+            _response(b"", status=429, **{"Retry-After": "5"}),
+            _response(b"ok"),
+        ]
+        adapter = RateLimitAdapter(rate_limit=0.25)
+
+        assert adapter.send(_prepared_request()).content == b"ok"
+        assert send_mock.call_count == 2
+        assert sleep_mock.call_args.args[0] == pytest.approx(5)
+
+    def test_exhausted_budget_pauses_host(self, clock, sleep_mock, send_mock):
+        send_mock.return_value = _response(
+            b"ok", **{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}
         )
+        adapter = RateLimitAdapter(rate_limit=0.25)
+        adapter.send(_prepared_request())
+        clock.return_value = 102.0
+        adapter.send(_prepared_request())
 
-        monkeypatch.setattr(
-            "beetsplug._utils.requests.time.monotonic", lambda: now
+        assert sleep_mock.call_args.args[0] == pytest.approx(8)
+
+
+def _response(
+    content: bytes, status: int = 200, **headers
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.url = "https://example.com/release"
+    response.headers.update(headers)
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+class CachingHandler(RequestHandler):
+    def __init__(self, view: confuse.ConfigView) -> None:
+        self.view = view
+
+    def cache_config(self) -> confuse.ConfigView:
+        return self.view
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def view(self, tmp_path):
+        view = confuse.RootView([])
+        RequestHandler.add_cache_config(view, "test")
+        view.set(
+            {"enabled": True, "path": str(tmp_path / "cache.db"), "ttl": 60}
         )
+        return view
 
-        sleep_mock = MagicMock()
-        monkeypatch.setattr("beetsplug._utils.requests.time.sleep", sleep_mock)
+    @pytest.fixture
+    def handler(self, view):
+        handler = CachingHandler(view)
+        handler.session = MagicMock(auth=None, headers={})
+        return handler
 
-        adapter._last_request_time = last_request_time
-        adapter.send(request)
+    def test_fresh_response_is_served_from_cache(self, handler):
+        handler.session.request.return_value = _response(b'{"id": 1}')
 
-        assert sleep_mock.call_count == 1
-        assert sleep_mock.call_args.args[0] == pytest.approx(expected_sleep)
+        assert handler.get_json("https://example.com", params={"a": 1}) == {
+            "id": 1
+        }
+        assert handler.get_json("https://example.com", params={"a": 1}) == {
+            "id": 1
+        }
+        assert handler.session.request.call_count == 1
+
+        handler.get("https://example.com", params={"a": 2})
+        assert handler.session.request.call_count == 2
+
+    def test_stale_response_is_revalidated(self, handler, view):
+        handler.session.request.return_value = _response(b"old", ETag='"v1"')
+        handler.get("https://example.com")
+
+        view["ttl"].set(0)
+        handler.session.request.return_value = _response(b"", status=304)
+        assert handler.get("https://example.com").content == b"old"
+        headers = handler.session.request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+
+        handler.session.request.return_value = _response(b"new")
+        assert handler.get("https://example.com").content == b"new"
+
+    def test_only_anonymous_get_requests_are_cached(self, handler):
+        handler.session.request.return_value = _response(b"data")
+        handler.put("https://example.com")
+        handler.put("https://example.com")
+        handler.get("https://example.com", auth=("user", "pass"))
+        handler.get("https://example.com", auth=("user", "pass"))
+
+        assert handler.session.request.call_count == 4
+
+    @pytest.mark.parametrize(
+        "session_auth, session_headers, headers",
+        [
+            (("user", "pass"), {}, None),
+            (None, {"Authorization": "Token secret"}, None),
+            (None, {}, {"authorization": "Bearer secret"}),
+        ],
+    )
+    def test_requests_with_credentials_are_not_cached(
+        self, handler, session_auth, session_headers, headers
+    ):
+        handler.session.auth = session_auth
+        handler.session.headers = session_headers
+        handler.session.request.return_value = _response(b"data")
+        handler.get("https://example.com", headers=headers)
+        handler.get("https://example.com", headers=headers)
+
+        assert handler.session.request.call_count == 2
+
+    def test_least_recently_used_responses_are_evicted(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / "cache.db"), max_size=10)
+        cache.store("a", _response(b"aaaa"))
+        cache.store("b", _response(b"bbbb"))
+        assert cache.get("a")
+        cache.store("c", _response(b"cccc"))
+
+        assert cache.get("a")
+        assert not cache.get("b")
+        assert cache.get("c")
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+import pickle
 import re
 import shutil
 import stat
 import sys
+import time
 import unicodedata
 import unittest
 from contextlib import contextmanager
@@ -23,7 +25,15 @@ import pytest
 from mediafile import MediaFile
 
 from beets import config, importer, logging, util
-from beets.autotag import AlbumInfo, AlbumMatch, Distance, TrackInfo
+from beets.autotag import (
+    AlbumInfo,
+    AlbumMatch,
+    Distance,
+    Recommendation,
+    TrackInfo,
+)
+from beets.exceptions import UserError
+from beets.importer.state import ImportState
 from beets.importer.tasks import (
     ImportTaskFactory,
     albums_in_dir,
@@ -1637,6 +1647,64 @@ class TagLogTest(unittest.TestCase):
         assert "status caf\xe9" in sio.getvalue()
 
 
+class TestParallelLookup(ImportHelper):
+    db_on_disk = True
+
+    def test_tasks_are_queried_in_order(self):
+        self.prepare_albums_for_import(4)
+        self.config["threaded"] = True
+        self.importer = self.setup_importer(lookup_threads=3)
+        self.importer.default_choice = importer.Action.ASIS
+        queried = []
+
+        def lookup_candidates(task, search_ids):
+            # Take longer to look up the earlier albums.
+            time.sleep((5 - int(task.paths[0][-1:])) * 0.02)
+            task.candidates, task.rec = [], Recommendation.none
+
+        def choose_match(task):
+            queried.append(os.path.basename(task.paths[0]))
+            return importer.Action.ASIS
+
+        with (
+            patch.object(
+                importer.ImportTask, "lookup_candidates", lookup_candidates
+            ),
+            patch.object(self.importer, "choose_match", choose_match),
+        ):
+            self.importer.run()
+
+        assert queried == [b"album_1", b"album_2", b"album_3", b"album_4"]
+        assert len(self.lib.albums()) == 4
+
+    def test_lookup_threads_must_be_positive(self):
+        self.prepare_albums_for_import(1)
+        self.importer = self.setup_importer(lookup_threads=0)
+
+        with pytest.raises(UserError, match="lookup_threads"):
+            self.importer.run()
+
+
+class TestReadAhead(ImportHelper):
+    @pytest.mark.parametrize("singletons", [False, True])
+    def test_tasks_keep_order(self, singletons):
+        self.prepare_albums_for_import(4)
+        session = self.setup_importer(read_threads=3, singletons=singletons)
+        session.set_config(config["import"])
+
+        factory = ImportTaskFactory(os.fsencode(self.import_path), session)
+        tasks = [t for t in factory.tasks() if not t.skip]
+
+        assert [t.items[0].album for t in tasks] == [
+            "Tag Album 1",
+            "Tag Album 2",
+            "Tag Album 3",
+            "Tag Album 4",
+        ]
+        assert factory.imported == 4
+        assert not factory._reads
+
+
 class TestResumeImport(ImportHelper):
     @patch("beets.plugins.send")
     def test_resume_album(self, plugins_send):
@@ -1714,6 +1782,58 @@ class TestIncrementalImport(AsIsImporterMixin, ImportHelper):
         assert len(self.lib.albums()) == 1
 
 
+class TestImportState:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return bytes(tmp_path / "state.pickle")
+
+    def test_changes_are_appended(self, path):
+        state = ImportState(path=path)
+        state.progress_add(b"/top", b"/top/b", b"/top/a")
+        state.history_add([b"/dir"])
+        size = os.path.getsize(path)
+        state.progress_add(b"/top", b"/top/c")
+        assert os.path.getsize(path) > size
+
+        state = ImportState(path=path)
+        assert state.tagprogress == {b"/top": [b"/top/a", b"/top/b", b"/top/c"]}
+        assert state.taghistory == {(b"/dir",)}
+        assert state.progress_has_element(b"/top", b"/top/b")
+
+    def test_log_is_compacted(self, path, monkeypatch):
+        monkeypatch.setattr(ImportState, "compact_threshold", 2)
+        state = ImportState(path=path)
+        state.history_add([b"/dir"])
+        for _ in range(10):
+            state.progress_reset(None)
+
+        # The file starts with a snapshot, which older versions can read,
+        # followed by at most as many changes as the threshold.
+        records = []
+        with open(path, "rb") as f:
+            while f.peek(1):
+                records.append(pickle.load(f))
+        assert records[0]["taghistory"] == {(b"/dir",)}
+        assert len(records) <= 3
+
+    @pytest.mark.parametrize("kept", [1, 2, 12, -1])
+    def test_truncated_change_is_ignored(self, path, kept):
+        state = ImportState(path=path)
+        state.history_add([b"/dir1"])
+        size = os.path.getsize(path)
+        state.history_add([b"/dir2"])
+        with open(path, "r+b") as f:
+            # Cut the last change short, possibly right after its header.
+            f.truncate(size + kept if kept > 0 else os.path.getsize(path) - 1)
+
+        state = ImportState(path=path)
+        assert state.taghistory == {(b"/dir1",)}
+        assert os.path.getsize(path) == size
+
+        state.history_add([b"/dir3"])
+        assert ImportState(path=path).taghistory == {(b"/dir1",), (b"/dir3",)}
+
+
 def _mkmp3(path):
     shutil.copyfile(_common.RSRC / "min.mp3", path)
 
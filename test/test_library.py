@@ -7,6 +7,8 @@ import os.path
 import re
 import shutil
 import stat
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -139,6 +141,70 @@ class TestAdd(PytestItemHelper):
         assert caplog.text.count("Sending event: database_change") == 1
 
 
+class TestBulk(PytestItemHelper):
+    def test_store_many_stores_fixed_and_flex_fields(self):
+        items = [self.add_item(title=f"t{i}", flex="old") for i in range(3)]
+        items[0].title = "new"
+        items[1].flex = "new"
+        del items[2]["flex"]
+
+        self.lib.store_many(items)
+
+        assert [i.title for i in self.lib.items("title+")] == [
+            "new",
+            "t1",
+            "t2",
+        ]
+        assert [i.get("flex") for i in self.lib.items("title+")] == [
+            "old",
+            "new",
+            None,
+        ]
+        assert not any(i._dirty for i in items)
+
+    def test_store_many_stores_only_given_fields(self):
+        item = self.add_item(title="old", artist="old")
+        item.title = item.artist = "new"
+
+        self.lib.store_many([item], fields=["title"])
+
+        stored = self.lib.get_item(item.id)
+        assert (stored.title, stored.artist) == ("new", "old")
+
+    def test_store_many_albums_are_inherited(self):
+        album = self.add_album(genres=["old"])
+        album.genres = ["new"]
+
+        self.lib.store_many([album])
+
+        assert album.items().get().genres == ["new"]
+
+    def test_add_many(self):
+        items = [
+            beets.library.Item(title=f"t{i}", flex=str(i)) for i in range(3)
+        ]
+
+        self.lib.add_many(items)
+
+        assert [(i.id, i.flex) for i in self.lib.items("title+")] == [
+            (item.id, item.flex) for item in items
+        ]
+
+    def test_bulk_sends_one_event(self, caplog: pytest.LogCaptureFixture):
+        items = [self.add_item(title=f"t{i}") for i in range(3)]
+
+        caplog.clear()
+        with caplog.at_level("DEBUG", logger="beets"), self.lib.bulk():
+            for item in items:
+                item.title = "new"
+                item.store()
+            self.lib.store_many(items)
+            items[0].remove()
+
+        assert "Sending event: database_change" not in caplog.messages
+        assert caplog.messages.count("Sending event: database_bulk_change") == 1
+
+
 class TestRemove(PytestItemHelper):
     def test_remove_deletes_from_db(self, item_in_db):
         item_in_db.remove()
@@ -491,6 +557,56 @@ class TestDestination(PytestItemHelper):
         album.store()
         assert item_in_db.destination() == np("one/three")
 
+    def test_path_format_queries_parsed_once(self, item_in_db):
+        self.lib.path_formats = [("default", "two"), ("comp:true", "three")]
+        with patch(
+            "beets.library.library.parse_query_string",
+            wraps=beets.library.library.parse_query_string,
+        ) as parse:
+            item_in_db.destination()
+            item_in_db.destination()
+        assert parse.call_count == 1
+
+    def test_select_path_formats(self):
+        comp = _common.item(self.lib)
+        other = _common.item(self.lib)
+        other.comp = False
+        other.store()
+        unsaved = _common.item(self.lib)
+        unsaved.comp = False
+        self.lib.path_formats = [("default", "two"), ("comp:true", "three")]
+
+        assert self.lib.select_path_formats([comp, other, unsaved]) == [
+            "three",
+            "two",
+            "two",
+        ]
+
+    def test_select_path_formats_non_ascii_case(self):
+        item = _common.item(self.lib)
+        item.artist = "Émile"
+        item.store()
+        self.lib.path_formats = [("default", "two"), ("artist:émile", "three")]
+
+        assert self.lib.select_path_formats([item]) == ["three"]
+        assert self.lib.destinations([item]) == [item.destination()]
+
+    def test_destinations(self):
+        album = self.add_album(album="foo")
+        album["flex"] = "bar"
+        album.store()
+        singleton = _common.item(self.lib)
+        singleton.album_id = None
+        singleton.store()
+        self.lib.path_formats = [
+            ("default", "$album%aunique{}/$flex/$title"),
+            ("singleton:true", "singletons/$title"),
+        ]
+        items = [*album.items(), singleton]
+
+        expected = [i.destination(basedir=b"base") for i in items]
+        assert self.lib.destinations(items, basedir=b"base") == expected
+
     def test_album_field_in_template(self, item_in_db):
         self.lib.directory = b"one"
         self.lib.path_formats = [("default", "$flex/two")]
@@ -771,6 +887,83 @@ class TestDisambiguation(TestHelper, PathFormattingMixin):
         self._setf("foo%aunique{albumartist album,year,}/$title")
         self._assert_dest(b"/base/foo 2001/the title", i1)
 
+    def test_index_follows_changes(self, items):
+        i1, i2 = items
+        self._assert_dest(b"/base/foo [2001]/the title", i1)
+        assert self.lib._disambiguation_indexes
+
+        album2 = self.lib.get_album(i2)
+        album2.album = "different album"
+        album2.store()
+        self.lib._memotable = {}
+        self._assert_dest(b"/base/foo/the title", i1)
+
+        album2.album = i1.album
+        album2.store()
+        self.lib._memotable = {}
+        self._assert_dest(b"/base/foo [2001]/the title", i1)
+
+        album2.remove()
+        self.lib._memotable = {}
+        self._assert_dest(b"/base/foo/the title", i1)
+
+    def test_index_finds_disambiguator_under_lock(self, items):
+        i1, _i2 = items
+        album = self.lib.get_album(i1)
+        find = beets.library.disambiguation.find_disambiguator
+        keys, disam = ["albumartist", "album"], ["year"]
+        index = self.lib._disambiguation_index(Album, keys, disam)
+
+        def locked_find(*args):
+            # A concurrent `update` must not drop its change before the
+            # result is stored.
+            assert index._lock.locked()
+            return find(*args)
+
+        with patch(
+            "beets.library.disambiguation.find_disambiguator", locked_find
+        ):
+            assert index.disambiguator(album) == (True, "year")
+
+    def test_index_counts_changes_stored_before_first_use(self, items):
+        i1, i2 = items
+        keys = ["albumartist", "album"]
+        index = self.lib._disambiguation_index(Album, keys, ())
+
+        album2 = self.lib.get_album(i2)
+        album2.year = 2001
+        album2.store()
+        self.lib.add_album([item()])
+
+        assert index.count(self.lib.get_album(i1)) == 3
+
+    def test_index_reads_changes_after_commit_with_wal(self):
+        config["wal"] = True
+        lib = beets.library.Library(self.temp_path / "wal.db")
+        assert lib.wal
+        keys = ["albumartist", "album"]
+        index = lib._disambiguation_index(Album, keys, ())
+        album = Album(albumartist="the album artist", album="the album")
+        assert index.count(album) == 0
+
+        added = threading.Event()
+
+        def add():
+            with lib.transaction():
+                lib.add_album([item()])
+                added.set()
+                time.sleep(0.2)
+
+        writer = threading.Thread(target=add)
+        writer.start()
+        added.wait()
+        counts = [index.count(album)]
+        writer.join()
+        counts.append(index.count(album))
+        lib._close()
+
+        assert counts == [1, 1]
+
     def test_key_flexible_attribute(self, items):
         i1, i2 = items
         album1 = self.lib.get_album(i1)
@@ -961,6 +1154,17 @@ class TestAlbumInfo(PytestItemHelper):
         ai = self.lib.get_album(item_in_album.id)
         assert ai is not None
 
+    def test_items_with_albums_share_albums(self, item_in_album):
+        self.lib.add_album([_common.item(), _common.item()])
+
+        with patch.object(self.lib, "get_album") as get_album:
+            items = list(self.lib.items(with_albums=True))
+            albums = [i._cached_album for i in items]
+
+        get_album.assert_not_called()
+        assert [a.id for a in albums] == [i.album_id for i in items]
+        assert len({id(a) for a in albums}) == 2
+
     def test_album_items_consistent(self, item_in_album):
         ai = self.lib.get_album(item_in_album)
         assert item_in_album.id in {i.id for i in ai.items()}
@@ -1218,6 +1422,20 @@ class TestTemplate(PytestItemHelper):
         assert f"{item}" == "bar bar"
         assert f"{item:$tagada}" == "togodo"
 
+    def test_plugin_functions_follow_loaded_plugins(
+        self, item_in_db, monkeypatch
+    ):
+        class ShoutPlugin(plugins.BeetsPlugin):
+            def __init__(self):
+                super().__init__("shout")
+                self.template_funcs["lower"] = str.upper
+
+        template = "%lower{Foo} %ifdef{title,yes}"
+        assert item_in_db.evaluate_template(template) == "foo yes"
+
+        monkeypatch.setattr(plugins, "_instances", [ShoutPlugin()])
+        assert item_in_db.evaluate_template(template) == "FOO yes"
+
 
 class TestUnicodePath(PytestItemHelper):
     def test_unicode_path(self, item_in_db):
@@ -1248,6 +1466,30 @@ class TestWrite(TestHelper):
             # Restore write permissions so the file can be cleaned up.
             item.filepath.chmod(stat.S_IRUSR | stat.S_IWUSR)
 
+    def test_try_write_many(self):
+        items = [self.add_item_fixture(title=f"title {i}") for i in range(3)]
+        missing = self.create_item(path=b"/path/does/not/exist")
+
+        with patch("beets.plugins.send", wraps=plugins.send) as send:
+            assert self.lib.try_write_many([*items, missing], jobs=2) == [
+                True,
+                True,
+                True,
+                False,
+            ]
+
+        assert [MediaFile(i.filepath).title for i in items] == [
+            "title 0",
+            "title 1",
+            "title 2",
+        ]
+        assert all(i.mtime == i.current_mtime() for i in items)
+        assert [
+            c.kwargs["item"]
+            for c in send.call_args_list
+            if c.args == ("after_write",)
+        ] == items
+
     def test_write_with_custom_path(self):
         item = self.add_item_fixture()
         custom_path = self.temp_path / "custom.mp3"
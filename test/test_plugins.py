@@ -456,6 +456,55 @@ class TestPromptChoices(TerminalImportMixin, PluginImportHelper):
         )
 
 
+class TestLazyPlugins(IOMixin, PluginTestHelper):
+    preload_plugin = False
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup):
+        self.config["lazy_plugins"] = True
+        # The first load records what the plugins provide.
+        self.load_plugins("info", "mpdupdate")
+        self.unload_plugins()
+        for name in ("info", "mpdupdate"):
+            del sys.modules[f"beetsplug.{name}"]
+
+        self.load_plugins("info", "mpdupdate")
+
+    def test_plugins_are_deferred(self):
+        assert not plugins.find_plugins()
+        assert "beetsplug.info" not in sys.modules
+        assert sorted(plugins.plugin_names()) == ["info", "mpdupdate"]
+
+    def test_command_imports_plugin(self):
+        [info_cmd] = [c for c in plugins.commands() if c.name == "info"]
+        assert info_cmd.help == "show file metadata"
+        assert not plugins.find_plugins()
+
+        assert info_cmd.func
+        assert [p.name for p in plugins.find_plugins()] == ["info"]
+
+    def test_event_imports_listening_plugin(self):
+        plugins.send("database_change", lib=self.lib, model=Item())
+
+        assert [p.name for p in plugins.find_plugins()] == ["mpdupdate"]
+
+    def test_plugins_keep_configured_order(self):
+        plugins.send("database_change", lib=self.lib, model=Item())
+        [info_cmd] = [c for c in plugins.commands() if c.name == "info"]
+        assert info_cmd.func
+
+        assert [p.name for p in plugins.find_plugins()] == ["info", "mpdupdate"]
+
+    def test_config_shows_deferred_plugin_defaults(self):
+        output = self.run_with_output("config", "-d")
+
+        assert "port: 6600" in output
+        assert sorted(p.name for p in plugins.find_plugins()) == [
+            "info",
+            "mpdupdate",
+        ]
+
+
 def get_available_plugins():
     """Get all available plugins in the beetsplug namespace."""
     namespace_pkg = importlib.import_module("beetsplug")
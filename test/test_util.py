@@ -395,6 +395,34 @@ class WalkTest(BeetsTestCase):
         assert len(res) == 1
         assert res[0] == (self.str_base, [], [])
 
+    def test_ignore_glob_bytes(self):
+        (self.base / "d" / "e").mkdir()
+        (self.base / "d" / "e" / "w.log").touch()
+        base = os.fsencode(self.str_base)
+        res = list(util.sorted_walk(base, (b"y", b"*.log")))
+        assert res == [
+            (base, [b"d"], [b"x"]),
+            (os.path.join(base, b"d"), [b"e"], [b"z"]),
+            (os.path.join(base, b"d", b"e"), [], []),
+        ]
+
+    def test_ignore_hidden(self):
+        (self.base / ".hidden").mkdir()
+        (self.base / ".hidden" / "v").touch()
+        res = list(util.sorted_walk(self.str_base, ignore_hidden=True))
+        assert res[0] == (self.str_base, ["d"], ["x", "y"])
+        assert len(res) == 2
+
+    def test_scandir_entries(self):
+        res = list(util.sorted_scandir(self.str_base))
+        _, dirs, files = res[0]
+        assert [d.name for d in dirs] == ["d"]
+        assert [f.path for f in files] == [
+            str(self.base / "x"),
+            str(self.base / "y"),
+        ]
+        assert files[0].stat().st_size == 0
+
 
 class UniquePathTest(BeetsTestCase):
     def setUp(self):
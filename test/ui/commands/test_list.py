@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from beets.test import _common
 from beets.test.helper import BeetsTestCase, IOMixin
 from beets.ui.commands.list import list_items
@@ -66,3 +68,21 @@ class ListTest(IOMixin, BeetsTestCase):
         stdout = self._run_list(album=True, fmt="$genres")
         assert "the genre" in stdout
         assert "the album" not in stdout
+
+    def test_list_item_fields_do_not_load_albums(self):
+        with (
+            patch.object(self.lib, "get_album") as get_album,
+            patch.object(self.lib, "_prefetch_albums") as prefetch_albums,
+        ):
+            stdout = self._run_list(fmt="$title - $artist")
+
+        assert stdout.strip() == "the title - the artist"
+        get_album.assert_not_called()
+        prefetch_albums.assert_not_called()
+
+    def test_list_album_field_prefetches_albums(self):
+        with patch.object(self.lib, "get_album") as get_album:
+            stdout = self._run_list(fmt="$title: $albumtotal")
+
+        assert stdout.strip() == "the title: 5"
+        get_album.assert_not_called()
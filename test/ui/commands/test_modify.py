@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 from mediafile import MediaFile
 
 from beets import logging
 from beets.exceptions import UserError
+from beets.library import Item
 from beets.test.helper import BeetsTestCase, IOMixin, TestHelper
 from beets.ui.commands.modify import ModifyOperation, modify_parse_args
 
@@ -68,6 +71,17 @@ class ModifyTest(ModifyHelper, BeetsTestCase):
         item = self.lib.items().get()
         assert b"newTitle" not in item.path
 
+    def test_move_noinherit_leaves_album(self):
+        with patch.object(Item, "move", autospec=True) as move:
+            self.modify("--noinherit", "title=newTitle")
+
+        move.assert_called_once()
+        assert move.call_args.kwargs["with_album"] is False
+
+    def test_jobs_must_be_positive(self):
+        with pytest.raises(UserError, match="at least 1"):
+            self.modify("-j", "0", "title=newTitle")
+
     def test_no_write_no_move(self):
         self.modify("--nomove", "--nowrite", "title=newTitle")
         item = self.lib.items().get()
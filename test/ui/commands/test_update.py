@@ -1,11 +1,13 @@
 import mediafile
+import pytest
 from mediafile import MediaFile
 
 from beets import library
+from beets.exceptions import UserError
 from beets.plugins import BeetsPlugin
 from beets.test import _common
 from beets.test.helper import BeetsTestCase, IOMixin
-from beets.ui.commands.update import update_items
+from beets.ui.commands.update import current_mtimes, update_items
 from beets.util import MoveOperation, remove
 
 
@@ -39,6 +41,7 @@ class UpdateTest(IOMixin, BeetsTestCase):
         reset_mtime=True,
         fields=None,
         exclude_fields=None,
+        jobs=1,
     ):
         self.io.addinput("y")
         if reset_mtime:
@@ -52,6 +55,7 @@ class UpdateTest(IOMixin, BeetsTestCase):
             False,
             fields=fields,
             exclude_fields=exclude_fields,
+            jobs=jobs,
         )
 
     def test_delete_removes_item(self):
@@ -226,3 +230,25 @@ class UpdateTest(IOMixin, BeetsTestCase):
         self._update(exclude_fields=["lyrics"])
         item = self.lib.items().get()
         assert item.lyrics != "new lyrics"
+
+    def test_parallel_update(self):
+        mf = MediaFile(self.i.filepath)
+        mf.title = "differentTitle"
+        mf.save()
+        remove(self.i2.path)
+        self._update(jobs=2)
+        assert [i.title for i in self.lib.items()] == ["differentTitle"]
+
+    def test_jobs_must_be_positive(self):
+        with pytest.raises(UserError, match="at least 1"):
+            self.run_command("update", "-j", "0")
+
+    def test_current_mtimes(self):
+        remove(self.i2.path)
+        self.i2.path = b""
+        missing = library.Item(path=self.i.path + b".missing")
+        assert current_mtimes([self.i, self.i2, missing], jobs=2) == [
+            self.i.current_mtime(),
+            None,
+            None,
+        ]
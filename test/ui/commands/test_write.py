@@ -1,3 +1,7 @@
+import pytest
+from mediafile import MediaFile
+
+from beets.exceptions import UserError
 from beets.test.helper import BeetsTestCase, IOMixin
 
 
@@ -44,3 +48,19 @@ class WriteTest(IOMixin, BeetsTestCase):
         output = self.write_cmd()
 
         assert f"{old_title} -> new title" in output
+
+    def test_parallel_write(self):
+        items = [self.add_item_fixture() for _ in range(3)]
+        for item in items:
+            item.title = f"new title {item.id}"
+            item.store()
+
+        self.write_cmd("-j", "2")
+
+        for item in self.lib.items():
+            assert item.mtime == item.current_mtime()
+            assert MediaFile(item.filepath).title == f"new title {item.id}"
+
+    def test_jobs_must_be_positive(self):
+        with pytest.raises(UserError, match="at least 1"):
+            self.write_cmd("-j", "-1")
@@ -1,6 +1,9 @@
 """Tests for template engine."""
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from beets.util import functemplate
 
@@ -254,3 +257,54 @@ class EvalTest(unittest.TestCase):
 
     def test_function_call_with_empty_arg(self):
         assert self._eval("%len{}") == "0"
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        self.code_cache = functemplate.CodeCache()
+        self._orig_code_cache = functemplate.code_cache
+        functemplate.code_cache = self.code_cache
+
+    def tearDown(self):
+        functemplate.code_cache = self._orig_code_cache
+        functemplate.set_template_cache_size(functemplate.TEMPLATE_CACHE_SIZE)
+
+    def test_get_template_counts_hits(self):
+        functemplate.set_template_cache_size(1)
+        functemplate.get_template("$foo")
+        functemplate.get_template("$foo")
+        functemplate.get_template("$bar")
+
+        info = functemplate.template_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 1)
+
+    def test_saved_code_is_reused(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "templates.cache")
+            self.code_cache.load(path)
+            functemplate.Template("%lower{$foo} $bar")
+            self.code_cache.save()
+
+            assert os.listdir(temp_dir) == ["templates.cache"]
+
+            self.code_cache.load(path)
+            with patch.object(functemplate, "compile_func") as compile_func:
+                template = functemplate.Template("%lower{$foo} $bar")
+            compile_func.assert_not_called()
+
+        assert template.varnames == {"foo", "bar"}
+        values = {"foo": "FOO", "bar": "bar"}
+        assert template.substitute(values, {"lower": str.lower}) == "foo bar"
+        assert self.code_cache.hits == 1
+
+    def test_code_from_other_version_is_ignored(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "templates.cache")
+            self.code_cache.load(path)
+            functemplate.Template("$foo")
+            self.code_cache.save()
+
+            with patch.object(functemplate.beets, "__version__", "0.0"):
+                self.code_cache.load(path)
+
+        assert len(self.code_cache) == 0
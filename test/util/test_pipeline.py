@@ -1,6 +1,8 @@
 """Test the "pipeline.py" restricted parallel programming library."""
 
+import time
 import unittest
+from unittest.mock import patch
 
 import pytest
 
@@ -117,6 +119,64 @@ class ParallelStageTest(unittest.TestCase):
         assert list(pl.pull()) == [0, 2, 4, 6, 8]
 
 
+# A worker that takes longer for earlier messages.
+def _slow_work(num=5):
+    i = None
+    while True:
+        i = yield i
+        time.sleep((num - i) * 0.01)
+        i = pipeline.BUBBLE if i == 3 else pipeline.multiple([i, -i])
+
+
+class OrderedStageTest(unittest.TestCase):
+    def setUp(self):
+        self.result = []
+        self.pl = pipeline.Pipeline(
+            (
+                _produce(),
+                pipeline.ordered([_slow_work(), _slow_work(), _slow_work()]),
+                _consume(self.result),
+            )
+        )
+
+    def test_run_sequential(self):
+        self.pl.run_sequential()
+        assert self.result == [0, 0, 1, -1, 2, -2, 4, -4]
+
+    def test_run_parallel(self):
+        self.pl.run_parallel()
+        assert self.result == [0, 0, 1, -1, 2, -2, 4, -4]
+
+    def test_slow_message_bounds_pending(self):
+        def work():
+            i = None
+            while True:
+                i = yield i
+                if i == 0:
+                    time.sleep(0.2)
+
+        pending = []
+        put = pipeline._Reorderer.put
+
+        def record_put(self, number, msgs):
+            pending.append(len(self.pending))
+            put(self, number, msgs)
+
+        result = []
+        pl = pipeline.Pipeline(
+            (
+                _produce(100),
+                pipeline.ordered([work(), work(), work()]),
+                _consume(result),
+            )
+        )
+        with patch.object(pipeline._Reorderer, "put", record_put):
+            pl.run_parallel()
+
+        assert result == list(range(100))
+        assert max(pending) < pipeline.DEFAULT_QUEUE_SIZE
+
+
 class ExceptionTest(unittest.TestCase):
     def setUp(self):
         self.result = []